@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Admission Module
+Per-tool and per-route concurrency limits: excess requests wait in a bounded queue and are
+shed with 503 once it is full, so a slow upstream cannot take every server thread.
+"""
+
+import threading
+import time
+
+from metrics import format_labels
+
+
+class Shed(Exception):
+    """The request was not admitted (queue full, or it waited longer than the queue timeout)"""
+
+    def __init__(self, message, reason):
+        super().__init__(message)
+        self.reason = reason
+
+
+class ConcurrencyLimiter:
+    """At most max_concurrent holders at a time, and at most max_queue callers waiting for a slot"""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int = 0, queue_timeout: float = 10.0):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed = {'queue_full': 0, 'timeout': 0}
+        self.wait_seconds = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Take a slot, waiting in the queue if needed; raises Shed when the request is turned away"""
+        with self._condition:
+            if self.active < self.max_concurrent and not self.waiting:
+                self.active += 1
+                self.admitted += 1
+                return
+            if self.waiting >= self.max_queue:
+                self.shed['queue_full'] += 1
+                raise Shed(f"{self.name}: {self.max_concurrent} requests running and {self.max_queue} queued",
+                           'queue_full')
+
+            self.waiting += 1
+            start = time.monotonic()
+            try:
+                admitted = self._condition.wait_for(lambda: self.active < self.max_concurrent, self.queue_timeout)
+            finally:
+                self.waiting -= 1
+                self.wait_seconds += time.monotonic() - start
+            if not admitted:
+                self.shed['timeout'] += 1
+                raise Shed(f"{self.name}: no slot freed up within {self.queue_timeout:g} seconds", 'timeout')
+            self.active += 1
+            self.admitted += 1
+
+    def release(self):
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+    def stats(self):
+        with self._condition:
+            return {
+                'name': self.name,
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'active': self.active,
+                'queued': self.waiting,
+                'admitted': self.admitted,
+                'shed': dict(self.shed),
+                'wait_seconds': round(self.wait_seconds, 6),
+            }
+
+
+class AdmissionController:
+    """
+    Limiters keyed by tool ('<tool>') or route ('<tool>.<endpoint>'). Limits come from the tool
+    (get_tool_info / route options) and can be overridden by configuration, parsed from
+    'name=max_concurrent[:max_queue],...'.
+    """
+
+    def __init__(self, overrides: str = '', queue_timeout: float = 10.0, retry_after: int = 1):
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.overrides = self.parse_limits(overrides)
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_limits(spec: str):
+        """'dev-tool-rss=4:8,dev-tool-conversations.ai_autocomplete=2' -> {name: (max_concurrent, max_queue)}"""
+        limits = {}
+        for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+            try:
+                name, value = item.split('=', 1)
+                max_concurrent, _, max_queue = value.partition(':')
+                limits[name.strip()] = (int(max_concurrent), int(max_queue) if max_queue else int(max_concurrent) * 2)
+            except ValueError:
+                print(f"Warning: ignoring invalid concurrency limit '{item}'")
+        return limits
+
+    def configure(self, name: str, max_concurrent: int = None, max_queue: int = None):
+        """Create the limiter of a tool or route; configuration overrides win. Returns None without a limit."""
+        if name in self.overrides:
+            max_concurrent, max_queue = self.overrides[name]
+        if not max_concurrent:
+            return None
+        if max_queue is None:
+            max_queue = max_concurrent * 2
+        with self._lock:
+            limiter = self._limiters[name] = ConcurrencyLimiter(name, max_concurrent, max_queue, self.queue_timeout)
+        return limiter
+
+    def stats(self):
+        """Limits, running and queued requests, and shed counts of every limiter"""
+        with self._lock:
+            limiters = sorted(self._limiters.items())
+        return [limiter.stats() for _, limiter in limiters]
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        active, queued, admitted, shed = [], [], [], []
+        for stats in self.stats():
+            labels = format_labels({'limiter': stats['name']})
+            active.append(f'devtools_admission_active{{{labels}}} {stats["active"]}')
+            queued.append(f'devtools_admission_queue_depth{{{labels}}} {stats["queued"]}')
+            admitted.append(f'devtools_admission_admitted_total{{{labels}}} {stats["admitted"]}')
+            for reason, count in stats['shed'].items():
+                shed_labels = format_labels({'limiter': stats['name'], 'reason': reason})
+                shed.append(f'devtools_admission_shed_total{{{shed_labels}}} {count}')
+        return [
+            '# TYPE devtools_admission_active gauge',
+            '# HELP devtools_admission_active Requests holding a concurrency slot.',
+            *active,
+            '# TYPE devtools_admission_queue_depth gauge',
+            '# HELP devtools_admission_queue_depth Requests waiting for a concurrency slot.',
+            *queued,
+            '# TYPE devtools_admission_admitted counter',
+            '# HELP devtools_admission_admitted Requests admitted by a concurrency limiter.',
+            *admitted,
+            '# TYPE devtools_admission_shed counter',
+            '# HELP devtools_admission_shed Requests answered 503 because the limiter queue was full or the wait timed out.',
+            *shed,
+        ]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Async Runtime Module
+Shared asyncio event loop and async HTTP client for tools, bridged into the (synchronous) Flask app.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from metrics import format_labels
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncLoop:
+    """
+    One asyncio event loop running in a background thread, shared by all tools.
+    Synchronous code (Flask views, scheduled jobs) hands it coroutines with run(); they execute
+    in the caller's context, so flask.request and current_app work inside async handlers.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get_loop(self):
+        """The running loop, started on first use (and again in a forked child process)"""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='async-loop', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def in_loop_thread(self):
+        return self._thread is threading.current_thread()
+
+    def run(self, coro, timeout: float = None):
+        """Run a coroutine on the shared loop and wait for its result from synchronous code"""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("AsyncLoop.run() called from the loop thread: await the coroutine instead")
+
+        loop = self.get_loop()
+        result = concurrent.futures.Future()
+        tasks = []
+
+        def copy_outcome(task):
+            if task.cancelled():
+                result.cancel()
+            elif task.exception() is not None:
+                result.set_exception(task.exception())
+            else:
+                result.set_result(task.result())
+
+        def schedule():
+            # Runs in the caller's context: the task gets a copy of it
+            try:
+                task = loop.create_task(coro)
+            except Exception as e:
+                result.set_exception(e)
+                return
+            task.add_done_callback(copy_outcome)
+            tasks.append(task)
+
+        loop.call_soon_threadsafe(schedule, context=contextvars.copy_context())
+        try:
+            return result.result(timeout)
+        except concurrent.futures.TimeoutError:
+            loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+            raise
+
+    def stop(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None and self._pid == os.getpid():
+            loop.call_soon_threadsafe(loop.stop)
+
+
+class AsyncResponse:
+    """Fully read upstream response with the parts of the requests.Response API tools use"""
+
+    def __init__(self, status_code, headers, content, url, reason=''):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.reason = reason
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.HTTPError(f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}", response=self)
+
+
+class AsyncHttpClient:
+    """
+    Async counterpart of HttpClient: `await client.get(...)`, `await client.post(...)`.
+    With aiohttp installed, requests are sent natively from the shared loop over pooled keep-alive
+    connections per host. Without it, they are sent by the shared sync HttpClient on the loop's
+    thread pool. Either way errors are requests exceptions, so tool code handles both the same.
+    """
+
+    def __init__(self, http_client, pool_maxsize: int = 10, timeout: float = 10.0):
+        self.http_client = http_client
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.native = aiohttp is not None
+        self._sessions = {}  # loop -> aiohttp.ClientSession
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    async def request(self, method: str, url: str, **kwargs):
+        """Send a request and return the fully read response"""
+        if not self.native:
+            # Run in a copy of the task's context, so the client's observers see the calling request
+            call = functools.partial(contextvars.copy_context().run, self.http_client.request, method, url, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(None, call)
+
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+        timeout = kwargs.pop('timeout', self.timeout)
+        start = time.perf_counter()
+        failed = True
+        status = None
+        try:
+            async with self._session().request(method, url, timeout=aiohttp.ClientTimeout(total=timeout),
+                                               **kwargs) as resp:
+                content = await resp.read()
+                status = resp.status
+                failed = resp.status >= 500
+                return AsyncResponse(resp.status, resp.headers, content, str(resp.url), resp.reason or '')
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(f"{method} {url} timed out after {timeout}s") from e
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.ConnectionError(f"{method} {url} failed: {e}") from e
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                stats = self._stats.setdefault(host_key, [0, 0, 0.0])
+                stats[0] += 1
+                stats[1] += failed
+                stats[2] += seconds
+            self.http_client.notify_observers(method, url, seconds, status)
+
+    async def get(self, url: str, params=None, **kwargs):
+        return await self.request('GET', url, params=params, **kwargs)
+
+    async def post(self, url: str, data=None, json=None, **kwargs):
+        return await self.request('POST', url, data=data, json=json, **kwargs)
+
+    def _session(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_maxsize)
+            # Requests from different users share the session: never replay upstream cookies
+            session = self._sessions[loop] = aiohttp.ClientSession(connector=connector,
+                                                                   cookie_jar=aiohttp.DummyCookieJar())
+        return session
+
+    def stats(self):
+        """Per-host request, error and latency counters of natively sent requests"""
+        with self._lock:
+            return {host_key: {'requests': requests_count, 'errors': errors, 'total_seconds': round(seconds, 6)}
+                    for host_key, (requests_count, errors, seconds) in self._stats.items()}
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        requests_lines, errors_lines, duration_lines = [], [], []
+        for host_key, stats in sorted(self.stats().items()):
+            labels = format_labels({'host': host_key})
+            requests_lines.append(f'devtools_async_http_client_requests_total{{{labels}}} {stats["requests"]}')
+            errors_lines.append(f'devtools_async_http_client_errors_total{{{labels}}} {stats["errors"]}')
+            duration_lines.append(f'devtools_async_http_client_duration_seconds_total{{{labels}}} {stats["total_seconds"]}')
+        return [
+            '# TYPE devtools_async_http_client_requests counter',
+            '# HELP devtools_async_http_client_requests Outbound requests sent from the shared event loop, per upstream host.',
+            *requests_lines,
+            '# TYPE devtools_async_http_client_errors counter',
+            '# HELP devtools_async_http_client_errors Event loop requests that raised or returned a 5xx status.',
+            *errors_lines,
+            '# TYPE devtools_async_http_client_duration_seconds counter',
+            '# UNIT devtools_async_http_client_duration_seconds seconds',
+            '# HELP devtools_async_http_client_duration_seconds Time spent in outbound requests sent from the event loop.',
+            *duration_lines,
+        ]
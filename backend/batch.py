@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Batch Module
+Runs several tool API calls received in one HTTP request concurrently inside the server.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+# Headers of the batch request that every sub-request inherits
+FORWARDED_HEADERS = ('Authorization', 'Cookie', 'Accept-Language')
+# Endpoints that cannot be answered inside a batch (recursion, never-ending streams)
+EXCLUDED_PATHS = ('/api/batch', '/api/events')
+
+
+class BatchRunner:
+    """
+    Dispatches each item of a batch through the full WSGI stack of the app, so tool routes see
+    an ordinary request (lazy activation, metrics and coalescing included).
+    Items run concurrently on a bounded worker pool shared by all batches; results keep the order
+    of the items. A batch has at most max_concurrent items in the pool at a time (the next one is
+    queued when one finishes), so a batch of slow items cannot take every thread from the others.
+    """
+
+    def __init__(self, app, max_workers: int = 8, max_items: int = 20, max_concurrent: int = 4, excluded_pattern=None):
+        self.app = app
+        # Compiled regex of further paths that cannot be batched (matched at the start of the path)
+        self.excluded_pattern = excluded_pattern
+        self.max_workers = max_workers
+        self.max_items = max_items
+        self.max_concurrent = max(1, min(max_concurrent, max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='batch')
+
+    def validate(self, items):
+        """Return an error message if the batch cannot be run, None otherwise"""
+        if not isinstance(items, list) or not items:
+            return 'requests must be a non-empty list'
+        if len(items) > self.max_items:
+            return f'A batch is limited to {self.max_items} requests, got {len(items)}'
+        return None
+
+    def run(self, items, headers=None, remote_addr=None):
+        """Run every item ({method, path, body}) and return their {status, duration_ms, body} in order"""
+        forwarded = {name: value for name, value in (headers or {}).items() if name in FORWARDED_HEADERS}
+        results = [None] * len(items)
+        queued = iter(enumerate(items))
+        remaining = [len(items)]
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def submit_next():
+            with lock:
+                index, item = next(queued, (None, None))
+            if index is not None:
+                future = self._executor.submit(self._run_item, item, forwarded, remote_addr)
+                future.add_done_callback(lambda future, index=index: finished(index, future))
+
+        def finished(index, future):
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = self._error(500, str(e), time.perf_counter())
+            submit_next()
+            with lock:
+                remaining[0] -= 1
+                if not remaining[0]:
+                    done.set()
+
+        for _ in range(min(self.max_concurrent, len(items))):
+            submit_next()
+        done.wait()
+        return results
+
+    def _run_item(self, item, headers, remote_addr):
+        start = time.perf_counter()
+        if not isinstance(item, dict):
+            return self._error(400, 'Each request must be an object with method, path and body', start)
+
+        method = str(item.get('method') or 'GET').upper()
+        path = item.get('path')
+        if not isinstance(path, str) or not path.startswith('/api/'):
+            return self._error(400, f'Only /api/ paths can be batched, got {path!r}', start)
+        if (path.split('?', 1)[0].rstrip('/') in EXCLUDED_PATHS
+                or (self.excluded_pattern is not None and self.excluded_pattern.match(path))):
+            return self._error(400, f'{path} cannot be batched', start)
+
+        builder_args = {'path': path, 'method': method, 'headers': headers,
+                        'environ_overrides': {'REMOTE_ADDR': remote_addr or '127.0.0.1'}}
+        if item.get('body') is not None:
+            builder_args['json'] = item['body']
+        try:
+            environ = EnvironBuilder(**builder_args).get_environ()
+            app_iter, status, response_headers = run_wsgi_app(self.app.wsgi_app, environ, buffered=False)
+        except Exception as e:
+            return self._error(500, str(e), start)
+
+        try:
+            content_type = response_headers.get('Content-Type', '')
+            if content_type.startswith('text/event-stream'):
+                return self._error(400, f'{path} returned a stream, which cannot be batched', start)
+            data = b''.join(app_iter)
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+        return {
+            'status': int(status.split(' ', 1)[0]),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+            'body': self._decode(data, content_type),
+        }
+
+    @staticmethod
+    def _decode(data, content_type):
+        """JSON bodies are embedded as values, anything else as text"""
+        text = data.decode('utf-8', errors='replace')
+        if 'json' in content_type:
+            try:
+                return json.loads(text)
+            except ValueError:
+                pass
+        return text
+
+    @staticmethod
+    def _error(status, message, start):
+        return {
+            'status': status,
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+            'body': {'success': False, 'error': message},
+        }
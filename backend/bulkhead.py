@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Bulkhead Module
+Runs blocking tool handlers in a dedicated process pool, so a slow psutil scan or feed parse
+cannot hold the threads that serve the other tools.
+"""
+
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+from metrics import format_labels
+
+# Environ key marking a request that is already running inside a pool process
+ISOLATED_ENVIRON_KEY = 'devtools.isolated'
+
+# Inherited by the pool processes when they are forked: the app, the registered functions and
+# the shared array where a pool process writes its pid while it runs a call (indexed by call slot)
+_fork_state = {'app': None, 'functions': {}, 'in_worker': False, 'running': None}
+
+
+class BulkheadFull(Exception):
+    """The pool and its queue are full: the call was rejected without waiting"""
+
+
+class BulkheadTimeout(Exception):
+    """The call did not complete (queue wait included) within its timeout"""
+
+
+def _init_worker():
+    # Ctrl+C is handled by the server process, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _fork_state['in_worker'] = True
+
+    # Exit with the server process, however it ended
+    parent = os.getppid()
+
+    def watch_parent():
+        while os.getppid() == parent:
+            time.sleep(1)
+        os._exit(0)
+    threading.Thread(target=watch_parent, name='parent-watch', daemon=True).start()
+
+
+def _run_call(slot, target, args):
+    """Run target in a pool process, with the process's pid in the running array meanwhile"""
+    running = _fork_state['running']
+    running[slot] = os.getpid()
+    try:
+        return target(*args)
+    finally:
+        running[slot] = 0
+
+
+def _call_function(name, args, kwargs):
+    func = _fork_state['functions'].get(name)
+    if func is None:
+        raise LookupError(f"Function {name} is not registered in the process pool")
+    return func(*args, **kwargs)
+
+
+def _run_request(request_data):
+    """Serve one request shipped from the server process; returns (status, headers, body)"""
+    environ = EnvironBuilder(**request_data, environ_overrides={ISOLATED_ENVIRON_KEY: True}).get_environ()
+    app_iter, status, headers = run_wsgi_app(_fork_state['app'].wsgi_app, environ, buffered=True)
+    try:
+        body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    return int(status.split(' ', 1)[0]), list(headers.items()), body
+
+
+class _CallStats:
+    """Counters of one isolated function or route"""
+
+    __slots__ = ('calls', 'rejected', 'timeouts', 'errors', 'in_flight', 'total_seconds', 'max_seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class ProcessBulkhead:
+    """
+    A fixed pool of forked worker processes in front of blocking calls.
+    - at most workers + max_queue calls are accepted at a time; more are rejected (BulkheadFull)
+    - a caller waits at most `timeout` seconds, queueing included (BulkheadTimeout)
+    The pool is forked by start(), before the server starts its threads: functions must be
+    registered before. With an on_broken handler (production workers, which it retires so the
+    master forks a fresh worker and pool), the process running a call that overruns is killed,
+    and a pool that lost a process rejects its calls from then on. Without one (development
+    server), an overrunning call keeps its process until it finishes, and a pool that lost a
+    process is forked again from the running server, there being no clean process to fork from.
+    """
+
+    def __init__(self, app=None, workers: int = 2, max_queue: int = 8, timeout: float = 15.0, on_broken=None):
+        self.app = app
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.on_broken = on_broken
+        self._executor = None
+        self._started = False
+        self._broken = False
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        # Call slots (one per accepted call) and the pid of the pool process running each one
+        self._free_slots = list(range(workers + max_queue))
+        self._running = None
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @property
+    def started(self):
+        """Whether the pool was forked: functions and routes registered from now on are not in it"""
+        return self._started
+
+    def register(self, name: str, func):
+        """Make func callable in the pool processes under name (before start())"""
+        with self._lock:
+            if self._started:
+                raise RuntimeError(f"{name}: registered after the process pool was forked")
+            _fork_state['functions'][name] = func
+
+    def start(self):
+        """Fork the pool processes (once). Call before the server starts its threads."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            _fork_state['app'] = self.app
+            # Created here, not in __init__: production workers each fork a pool of their own
+            self._running = multiprocessing.get_context('fork').Array('i', self.workers + self.max_queue, lock=False)
+            _fork_state['running'] = self._running
+            self._executor = executor = self._new_executor()
+        # With the fork start method, all the pool processes are created by the first submit
+        executor.submit(os.getpid).result()
+        print(f"Process bulkhead started ({self.workers} processes)")
+
+    def _new_executor(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   mp_context=multiprocessing.get_context('fork'))
+
+    def stop(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def in_worker():
+        """Whether the current process is one of the pool processes"""
+        return _fork_state['in_worker']
+
+    def call(self, name: str, *args, timeout: float = None, **kwargs):
+        """Run the function registered as name in the pool and return its result"""
+        if self.in_worker():
+            return _call_function(name, args, kwargs)
+        return self._submit(name, _call_function, (name, args, kwargs), timeout)
+
+    def run_request(self, name: str, request_data, timeout: float = None):
+        """Serve a request (EnvironBuilder arguments) in the pool; returns (status, headers, body)"""
+        return self._submit(name, _run_request, (request_data,), timeout)
+
+    def _submit(self, name, target, args, timeout):
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            stats = self._stats.setdefault(name, _CallStats())
+            executor = self._executor
+        if executor is None:
+            with self._lock:
+                stats.rejected += 1
+            raise BulkheadFull(f"{name}: the process pool is {'broken' if self._broken else 'not started'}")
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                stats.rejected += 1
+            raise BulkheadFull(f"{name}: all {self.workers} processes are busy and {self.max_queue} calls are queued")
+
+        start = time.perf_counter()
+        with self._lock:
+            stats.calls += 1
+            stats.in_flight += 1
+            slot = self._free_slots.pop()
+
+        def release(_future=None):
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats.in_flight -= 1
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+                self._free_slots.append(slot)
+            self._slots.release()
+
+        try:
+            future = executor.submit(_run_call, slot, target, args)
+        except BaseException as e:
+            release()
+            if isinstance(e, BrokenProcessPool):
+                self._mark_broken(executor)
+            raise
+        future.add_done_callback(release)
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                stats.timeouts += 1
+            if self.on_broken and not future.cancel():
+                # Running: the process is killed, which breaks the pool (its other calls fail)
+                pid = self._running[slot]
+                if pid:
+                    print(f"Warning: {name} still running after {timeout:g} seconds, killing pool process {pid}")
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    self._mark_broken(executor)
+            raise BulkheadTimeout(f"{name} did not complete within {timeout:g} seconds")
+        except BrokenProcessPool:
+            # A pool process died (e.g. killed by the OOM killer)
+            with self._lock:
+                stats.errors += 1
+            self._mark_broken(executor)
+            raise
+        except Exception:
+            with self._lock:
+                stats.errors += 1
+            raise
+
+    def _mark_broken(self, executor):
+        """Retire a pool that lost a process: on_broken() replaces it, else it is forked again here"""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._broken = True
+        executor.shutdown(wait=False, cancel_futures=True)
+        if self.on_broken:
+            print("Warning: the process bulkhead lost a process, isolated calls are rejected from now on")
+            self.on_broken()
+            return
+
+        print("Warning: the process bulkhead lost a process, forking a new pool")
+        replacement = self._new_executor()
+        try:
+            replacement.submit(os.getpid).result()
+        except BrokenProcessPool:
+            print("Warning: could not fork a new process pool, isolated calls are rejected from now on")
+            return
+        with self._lock:
+            self._executor = replacement
+            self._broken = False
+
+    def stats(self):
+        """Per function/route calls, rejections, timeouts, errors and run times"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            return {
+                'running': self._executor is not None,
+                'broken': self._broken,
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'timeout': self.timeout,
+                'calls': [{
+                    'name': name,
+                    'calls': stats.calls,
+                    'in_flight': stats.in_flight,
+                    'rejected': stats.rejected,
+                    'timeouts': stats.timeouts,
+                    'errors': stats.errors,
+                    'avg_ms': round(stats.total_seconds / stats.calls * 1000, 2) if stats.calls else None,
+                    'max_ms': round(stats.max_seconds * 1000, 2),
+                } for name, stats in items],
+            }
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        calls, in_flight, rejected, timeouts = [], [], [], []
+        for stats in self.stats()['calls']:
+            labels = format_labels({'name': stats['name']})
+            calls.append(f'devtools_bulkhead_calls_total{{{labels}}} {stats["calls"]}')
+            in_flight.append(f'devtools_bulkhead_in_flight{{{labels}}} {stats["in_flight"]}')
+            rejected.append(f'devtools_bulkhead_rejected_total{{{labels}}} {stats["rejected"]}')
+            timeouts.append(f'devtools_bulkhead_timeouts_total{{{labels}}} {stats["timeouts"]}')
+        return [
+            '# TYPE devtools_bulkhead_calls counter',
+            '# HELP devtools_bulkhead_calls Calls run in the process bulkhead.',
+            *calls,
+            '# TYPE devtools_bulkhead_in_flight gauge',
+            '# HELP devtools_bulkhead_in_flight Calls running or queued in the process bulkhead.',
+            *in_flight,
+            '# TYPE devtools_bulkhead_rejected counter',
+            '# HELP devtools_bulkhead_rejected Calls rejected because the process bulkhead was full.',
+            *rejected,
+            '# TYPE devtools_bulkhead_timeouts counter',
+            '# HELP devtools_bulkhead_timeouts Calls that did not complete within their timeout.',
+            *timeouts,
+        ]
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Bundler Module
+Concatenates and minifies each tool's local frontend imports into one content-hashed bundle.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+from static_assets import PRECOMPRESSED_ENCODINGS, compress_variants
+
+# Characters/keywords after which a '/' starts a regex literal instead of a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                  'throw', 'case', 'do', 'else', 'yield', 'await'}
+
+
+def _is_word_char(c):
+    return c.isalnum() or c in '_$'
+
+
+class _JSMinifier:
+    """
+    Conservative JavaScript minifier.
+    Strips comments, indentation, trailing whitespace and blank lines. String, template
+    and regex literals are copied verbatim and line breaks are kept, so automatic
+    semicolon insertion behaves exactly as in the original source.
+    """
+
+    def __init__(self, source: str):
+        self.src = source
+        self.n = len(source)
+        self.out = []
+
+    def minify(self):
+        self._scan(0, stop_at_brace=False)
+        return ''.join(self.out).strip()
+
+    def _last_char(self):
+        for piece in reversed(self.out):
+            if piece:
+                return piece[-1]
+        return ''
+
+    def _newline(self):
+        """Emit a line break, dropping trailing whitespace and blank lines"""
+        while self.out and self.out[-1] == ' ':
+            self.out.pop()
+        if self._last_char() not in ('', '\n'):
+            self.out.append('\n')
+
+    def _space(self):
+        """Emit one space, dropping indentation and collapsing whitespace runs"""
+        if self._last_char() not in ('', '\n', ' '):
+            self.out.append(' ')
+
+    def _last_significant(self):
+        """Return the last emitted non-whitespace character and the word it ends, if any"""
+        text = ''.join(self.out[-64:]).rstrip()
+        if not text:
+            return None, ''
+        last = text[-1]
+        word = ''
+        if _is_word_char(last):
+            i = len(text)
+            while i > 0 and _is_word_char(text[i - 1]):
+                i -= 1
+            word = text[i:]
+        return last, word
+
+    def _regex_allowed(self):
+        last, word = self._last_significant()
+        if last is None:
+            return True
+        if word:
+            return word in REGEX_KEYWORDS
+        return last in REGEX_PRECEDERS
+
+    def _copy_quoted(self, i, quote):
+        """Copy a '...' or "..." string; unterminated strings stop at the end of the line"""
+        start = i
+        i += 1
+        while i < self.n:
+            c = self.src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote or c == '\n':
+                i += 1
+                break
+            i += 1
+        self.out.append(self.src[start:i])
+        return i
+
+    def _copy_regex(self, i):
+        start = i
+        i += 1
+        in_class = False
+        while i < self.n:
+            c = self.src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '\n':
+                break
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                i += 1
+                break
+            i += 1
+        self.out.append(self.src[start:i])
+        return i
+
+    def _copy_template(self, i):
+        """Copy a template literal verbatim, minifying the code inside ${...} expressions"""
+        self.out.append('`')
+        i += 1
+        start = i
+        while i < self.n:
+            c = self.src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '`':
+                self.out.append(self.src[start:i + 1])
+                return i + 1
+            if c == '$' and i + 1 < self.n and self.src[i + 1] == '{':
+                self.out.append(self.src[start:i + 2])
+                i = self._scan(i + 2, stop_at_brace=True)
+                start = i
+                continue
+            i += 1
+        self.out.append(self.src[start:i])
+        return i
+
+    def _scan(self, i, stop_at_brace):
+        """Minify code from i; when stop_at_brace, return after the closing '}' of a ${...}"""
+        depth = 0
+        while i < self.n:
+            c = self.src[i]
+            nxt = self.src[i + 1] if i + 1 < self.n else ''
+            if c in '"\'':
+                i = self._copy_quoted(i, c)
+            elif c == '`':
+                i = self._copy_template(i)
+            elif c == '/' and nxt == '/':
+                while i < self.n and self.src[i] != '\n':
+                    i += 1
+            elif c == '/' and nxt == '*':
+                end = self.src.find('*/', i + 2)
+                end = self.n if end == -1 else end + 2
+                # Keep a line break if the comment spanned one, so ASI is unaffected
+                if '\n' in self.src[i:end]:
+                    self._newline()
+                else:
+                    self._space()
+                i = end
+            elif c == '/' and self._regex_allowed():
+                i = self._copy_regex(i)
+            elif c == '\n':
+                self._newline()
+                i += 1
+            elif c in ' \t\r':
+                while i < self.n and self.src[i] in ' \t\r':
+                    i += 1
+                self._space()
+            else:
+                if stop_at_brace:
+                    if c == '{':
+                        depth += 1
+                    elif c == '}':
+                        if depth == 0:
+                            self.out.append('}')
+                            return i + 1
+                        depth -= 1
+                self.out.append(c)
+                i += 1
+        return i
+
+
+def minify_js(source: str) -> str:
+    """Minify JavaScript source conservatively (comments and whitespace only)"""
+    return _JSMinifier(source).minify()
+
+
+class ToolBundler:
+    """
+    Builds and holds per-tool script bundles in memory.
+    Each bundle is compressed (.br/.gz, like the precompressed static files) once, when it is built.
+    """
+
+    # Previous bundle generations kept per tool, so pages holding an older manifest still load
+    KEEP_GENERATIONS = 2
+
+    def __init__(self, minify: bool = True):
+        self.minify = minify
+        self.bundles = {}
+        self.variants = {}
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def build(self, tool_name: str, files, root: Path):
+        """Concatenate (and minify) the given files into one bundle; return its file name"""
+        parts = []
+        for path in files:
+            try:
+                source = path.read_text(encoding='utf-8')
+            except OSError as e:
+                print(f"Warning: cannot bundle {path} for tool {tool_name}: {e}")
+                continue
+            if self.minify:
+                source = minify_js(source)
+            rel_path = path.relative_to(root).as_posix()
+            # Terminate each file so concatenation never joins two statements
+            parts.append(f"/* {rel_path} */\n{source}\n;")
+        content = '\n'.join(parts).encode('utf-8')
+        filename = f"{tool_name}.{hashlib.sha256(content).hexdigest()[:16]}.js"
+        variants = compress_variants(content)
+
+        with self._lock:
+            self.bundles[filename] = content
+            self.variants[filename] = variants
+            generations = self._generations.setdefault(tool_name, [])
+            if filename in generations:
+                generations.remove(filename)
+            generations.append(filename)
+            while len(generations) > self.KEEP_GENERATIONS:
+                retired = generations.pop(0)
+                self.bundles.pop(retired, None)
+                self.variants.pop(retired, None)
+        return filename
+
+    def get(self, filename: str, accept_encodings=None):
+        """
+        Return (content, encoding) of a bundle by file name, or (None, None).
+        With the request's accept_encodings, the preferred precompressed variant it accepts is returned.
+        """
+        with self._lock:
+            content = self.bundles.get(filename)
+            variants = self.variants.get(filename, {})
+        if content is not None and accept_encodings is not None:
+            for encoding, _ in PRECOMPRESSED_ENCODINGS:
+                if encoding in variants and accept_encodings.quality(encoding) > 0:
+                    return variants[encoding], encoding
+        return content, None
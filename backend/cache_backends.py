@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Cache Backends Module
+Storage behind the tool caches: an in-process LRU, or a Redis-protocol server shared by several app instances.
+"""
+
+import json
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from urllib.parse import unquote, urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared entries: expires_at and stale_until (wall clock), codec byte, payload
+_HEADER = struct.Struct('!ddc')
+# Payloads above this size are stored zlib-compressed
+COMPRESS_MIN_SIZE = 1024
+
+
+class Entry:
+    __slots__ = ('value', 'expires_at', 'stale_until')
+
+    def __init__(self, value, expires_at, stale_until):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class MemoryBackend:
+    """Size-bounded LRU of entries in this process (the default backend)"""
+
+    name = 'memory'
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """The entry of a key while it can still be served (fresh or stale), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.clock() >= entry.stale_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Store an entry; returns the number of least recently used entries evicted"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key):
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            keys = [key for key in self._entries if str(key).startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def size(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisError(Exception):
+    """Error reply from the server"""
+
+
+class RedisClient:
+    """
+    Minimal client for the Redis protocol (RESP2), shared by all the shared caches:
+    redis://[[user]:password@]host[:port][/db]. Works with Redis, Valkey, KeyDB and other
+    compatible servers. Connections are pooled per process (a forked worker opens its own).
+    """
+
+    def __init__(self, url: str, timeout: float = 0.5, pool_size: int = 8):
+        parts = urlsplit(url)
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 6379
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.strip('/') or 0)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"redis://{self.host}:{self.port}/{self.db}"
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = (sock, sock.makefile('rb'))
+        try:
+            if self.password:
+                self._call(connection, *(['AUTH', self.username] if self.username else ['AUTH']), self.password)
+            if self.db:
+                self._call(connection, 'SELECT', self.db)
+        except BaseException:
+            self._close(connection)
+            raise
+        return connection
+
+    @staticmethod
+    def _close(connection):
+        for part in reversed(connection):
+            try:
+                part.close()
+            except OSError:
+                pass
+
+    def execute(self, *args):
+        """Send one command and return its reply (bytes, int, list or None); raises OSError or RedisError"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Sockets inherited from the parent process are never reused
+                self._pool = queue.LifoQueue()
+                self._pid = os.getpid()
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+        try:
+            reply = self._call(connection, *args)
+        except RedisError:
+            self._release(connection)
+            raise
+        except BaseException:
+            self._close(connection)
+            raise
+        self._release(connection)
+        return reply
+
+    def _release(self, connection):
+        if self._pool.qsize() < self.pool_size:
+            self._pool.put(connection)
+        else:
+            self._close(connection)
+
+    def _call(self, connection, *args):
+        sock, reader = connection
+        parts = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+        sock.sendall(b''.join(parts))
+        return self._read_reply(reader)
+
+    def _read_reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError('Connection closed by the cache server')
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest
+        if kind == b'-':
+            raise RedisError(rest.decode('utf-8', errors='replace'))
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError('Connection closed by the cache server')
+            return data[:-2]
+        if kind == b'*':
+            length = int(rest)
+            return None if length < 0 else [self._read_reply(reader) for _ in range(length)]
+        raise ConnectionError(f'Unexpected reply from the cache server: {line[:32]!r}')
+
+
+def encode_entry(entry: Entry):
+    """Compact binary form of an entry: header, then JSON (zlib-compressed when large)"""
+    if orjson is not None:
+        payload = orjson.dumps(entry.value, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(entry.value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    codec = b'j'
+    if len(payload) >= COMPRESS_MIN_SIZE:
+        payload, codec = zlib.compress(payload, 3), b'z'
+    return _HEADER.pack(entry.expires_at, entry.stale_until, codec) + payload
+
+
+def decode_entry(data: bytes):
+    expires_at, stale_until, codec = _HEADER.unpack_from(data)
+    payload = data[_HEADER.size:]
+    if codec == b'z':
+        payload = zlib.decompress(payload)
+    return Entry(orjson.loads(payload) if orjson is not None else json.loads(payload), expires_at, stale_until)
+
+
+class RedisBackend:
+    """
+    One tool cache stored on a Redis-protocol server, under '<key_prefix>:<tool>/<cache>:<key>'.
+    Values must be JSON data (dicts, lists, strings, numbers); tuples come back as lists.
+    The server removes an entry once it can no longer be served stale, and its memory
+    policy (maxmemory) replaces maxsize. While the server is unreachable, lookups miss and
+    stores are dropped, so the tool keeps working uncached; it is retried every retry_interval seconds.
+    """
+
+    name = 'redis'
+    clock = staticmethod(time.time)
+
+    def __init__(self, client: RedisClient, namespace: str, retry_interval: float = 5.0):
+        self.client = client
+        self.namespace = namespace
+        self.retry_interval = retry_interval
+        self.errors = 0
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+
+    def _key(self, key):
+        return f"{self.namespace}{key}"
+
+    def _execute(self, *args, default=None):
+        if time.monotonic() < self._down_until:
+            return default
+        try:
+            return self.client.execute(*args)
+        except (OSError, RedisError) as e:
+            with self._lock:
+                self.errors += 1
+                if isinstance(e, OSError):
+                    if time.monotonic() >= self._down_until:
+                        print(f"Warning: cache server {self.client!r} unreachable ({e}), "
+                              f"caching without it for {self.retry_interval:g} seconds")
+                    self._down_until = time.monotonic() + self.retry_interval
+                else:
+                    print(f"Warning: cache server {self.client!r} error on {args[0]}: {e}")
+            return default
+
+    def get(self, key):
+        data = self._execute('GET', self._key(key))
+        if data is None:
+            return None
+        try:
+            entry = decode_entry(data)
+        except (struct.error, zlib.error, ValueError):
+            return None
+        return entry if self.clock() < entry.stale_until else None
+
+    def set(self, key, entry):
+        try:
+            data = encode_entry(entry)
+        except TypeError as e:
+            print(f"Warning: value of {self._key(key)!r} is not JSON data, not cached: {e}")
+            return 0
+        ttl_ms = max(int((entry.stale_until - self.clock()) * 1000), 1)
+        self._execute('SET', self._key(key), data, 'PX', ttl_ms)
+        return 0
+
+    def delete(self, key):
+        return bool(self._execute('DEL', self._key(key), default=0))
+
+    def delete_prefix(self, prefix: str):
+        # Glob characters in the namespace and prefix are matched literally
+        pattern = ''.join(f'\\{c}' if c in '*?[]\\' else c for c in self._key(prefix)) + '*'
+        deleted, cursor = 0, b'0'
+        while True:
+            reply = self._execute('SCAN', cursor, 'MATCH', pattern, 'COUNT', 500)
+            if not reply:
+                return deleted
+            cursor, keys = reply
+            if keys:
+                deleted += self._execute('DEL', *keys, default=0)
+            if cursor == b'0':
+                return deleted
+
+    def size(self):
+        """Not counted: it would scan the whole keyspace"""
+        return None
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Cache Service Module
+Named TTL/LRU caches for tools, with stale-while-revalidate and hit/miss statistics.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cache_backends import Entry, MemoryBackend, RedisBackend
+from metrics import format_labels
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a TTL.
+    With stale_ttl > 0, an expired entry is still served for stale_ttl more seconds while one
+    background refresh per key recomputes it (stale-while-revalidate).
+    Entries live in the backend: in this process by default, or on a shared server (RedisBackend).
+    """
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: float = 60.0, stale_ttl: float = 0.0, executor=None,
+                 backend=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.backend = backend or MemoryBackend(maxsize)
+        self._refreshing = set()
+        self._executor = executor
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def _lookup(self, key):
+        """Return (entry, fresh) for a servable entry, or (None, False)"""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+        return entry, self.backend.clock() < entry.expires_at
+
+    def get(self, key, default=None):
+        """Return the fresh value of a key, or default"""
+        entry, fresh = self._lookup(key)
+        with self._lock:
+            if entry is not None and fresh:
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: float = None):
+        """Store a value, evicting the least recently used entries above maxsize"""
+        ttl = self.ttl if ttl is None else ttl
+        now = self.backend.clock()
+        evicted = self.backend.set(key, Entry(value, now + ttl, now + ttl + self.stale_ttl))
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+
+    def get_or_compute(self, key, compute, ttl: float = None, cache_if=None):
+        """
+        Return the cached value of a key, computing and storing it on a miss.
+        cache_if(value) -> bool can refuse to cache a result (e.g. an upstream error payload).
+        A stale entry is returned immediately and refreshed in the background.
+        """
+        entry, fresh = self._lookup(key)
+        with self._lock:
+            if entry is not None:
+                if fresh:
+                    self.hits += 1
+                    return entry.value
+                self.stale_hits += 1
+                if key not in self._refreshing and self._executor is not None:
+                    self._refreshing.add(key)
+                    self._executor.submit(self._refresh, key, compute, ttl, cache_if)
+                return entry.value
+            self.misses += 1
+
+        value = compute()
+        if cache_if is None or cache_if(value):
+            self.set(key, value, ttl)
+        return value
+
+    def _refresh(self, key, compute, ttl, cache_if):
+        try:
+            value = compute()
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl)
+            with self._lock:
+                self.refreshes += 1
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors += 1
+            print(f"Warning: background refresh of cache {self.name} key {key!r} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key):
+        """Drop one key"""
+        return self.backend.delete(key)
+
+    def invalidate_prefix(self, prefix: str = ''):
+        """Drop every string key starting with prefix (all keys for an empty prefix); returns the count"""
+        return self.backend.delete_prefix(prefix)
+
+    def clear(self):
+        self.invalidate_prefix('')
+
+    def stats(self):
+        size = self.backend.size()
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'backend': self.backend.name,
+                'size': size,
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_ratio': round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'backend_errors': getattr(self.backend, 'errors', 0),
+            }
+
+
+class CacheRegistry:
+    """
+    All named caches of the app, sharing one small pool for background refreshes.
+    With a shared client (RedisClient), caches created with shared=True store their entries
+    on that server under '<key_prefix>:<name>:', so every app instance sees the same values.
+    """
+
+    def __init__(self, refresh_workers: int = 4, shared_client=None, key_prefix: str = 'devtools'):
+        self.shared_client = shared_client
+        self.key_prefix = key_prefix
+        self._caches = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='cache-refresh')
+
+    def get_cache(self, name: str, maxsize: int = 256, ttl: float = 60.0, stale_ttl: float = 0.0,
+                  shared: bool = False):
+        """Return the cache with this name, creating it with the given limits on first use"""
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                backend = None
+                if shared and self.shared_client is not None:
+                    backend = RedisBackend(self.shared_client, f"{self.key_prefix}:{name}:")
+                cache = self._caches[name] = TTLCache(name, maxsize, ttl, stale_ttl, executor=self._executor,
+                                                      backend=backend)
+            return cache
+
+    def names(self):
+        with self._lock:
+            return sorted(self._caches)
+
+    def stats(self):
+        """Per-cache statistics"""
+        with self._lock:
+            caches = sorted(self._caches.items())
+        return {name: cache.stats() for name, cache in caches}
+
+    def invalidate(self, name: str = None, prefix: str = ''):
+        """
+        Drop keys starting with prefix from one cache, or from every cache whose name starts with
+        name (e.g. 'weather/' for all caches of the weather tool). Returns dropped keys per cache.
+        """
+        with self._lock:
+            caches = [(cache_name, cache) for cache_name, cache in self._caches.items()
+                      if name is None or cache_name == name or cache_name.startswith(name)]
+        return {cache_name: cache.invalidate_prefix(prefix) for cache_name, cache in sorted(caches)}
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        hits, misses, evictions, sizes, errors = [], [], [], [], []
+        for name, stats in self.stats().items():
+            labels = format_labels({'cache': name})
+            hits.append(f'devtools_cache_hits_total{{{labels},state="fresh"}} {stats["hits"]}')
+            hits.append(f'devtools_cache_hits_total{{{labels},state="stale"}} {stats["stale_hits"]}')
+            misses.append(f'devtools_cache_misses_total{{{labels}}} {stats["misses"]}')
+            evictions.append(f'devtools_cache_evictions_total{{{labels}}} {stats["evictions"]}')
+            if stats['size'] is not None:
+                sizes.append(f'devtools_cache_entries{{{labels}}} {stats["size"]}')
+            if stats['backend'] != 'memory':
+                errors.append(f'devtools_cache_backend_errors_total{{{labels}}} {stats["backend_errors"]}')
+        return [
+            '# TYPE devtools_cache_hits counter',
+            '# HELP devtools_cache_hits Cache lookups answered from the cache (fresh or stale-while-revalidate).',
+            *hits,
+            '# TYPE devtools_cache_misses counter',
+            '# HELP devtools_cache_misses Cache lookups that had to compute the value.',
+            *misses,
+            '# TYPE devtools_cache_evictions counter',
+            '# HELP devtools_cache_evictions Entries evicted because the cache was full.',
+            *evictions,
+            '# TYPE devtools_cache_entries gauge',
+            '# HELP devtools_cache_entries Entries currently held by the cache (in-process caches).',
+            *sizes,
+            '# TYPE devtools_cache_backend_errors counter',
+            '# HELP devtools_cache_backend_errors Failed calls to the shared cache server (lookups miss, stores are dropped).',
+            *errors,
+        ]
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Compression Module
+Negotiated gzip / brotli compression of JSON and event-stream responses, with per-route ratio and CPU time.
+"""
+
+import gzip
+import threading
+import time
+import zlib
+
+from flask import request
+
+from bulkhead import ISOLATED_ENVIRON_KEY
+from metrics import format_labels
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Responses worth compressing; streams are compressed chunk by chunk
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/event-stream')
+
+
+class _RouteStats:
+    """Counters of one route and encoding"""
+
+    __slots__ = ('responses', 'bytes_in', 'bytes_out', 'cpu_seconds')
+
+    def __init__(self):
+        self.responses = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+
+class ResponseCompressor:
+    """
+    after_request hook compressing responses when the client accepts it (brotli preferred, when installed).
+    - buffered responses are compressed when their body is at least min_size bytes
+    - streamed responses are compressed as they are sent, flushing after every chunk so each
+      event still reaches the browser right away
+    A strong ETag becomes weak on compressed responses: the bytes differ but the data is the same.
+    """
+
+    def __init__(self, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        app.after_request(self.compress)
+
+    def negotiate(self):
+        """The best encoding the request accepts, or None"""
+        best, best_quality = None, 0
+        for encoding in self.encodings:
+            quality = request.accept_encodings.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, response):
+        if (response.mimetype not in COMPRESSIBLE_MIMETYPES or request.method == 'HEAD'
+                or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough or 'Content-Encoding' in response.headers
+                or 'no-transform' in response.headers.get('Cache-Control', '')
+                # Compressed once, by the server process that answers the client
+                or request.environ.get(ISOLATED_ENVIRON_KEY)):
+            return response
+        response.vary.add('Accept-Encoding')
+
+        encoding = self.negotiate()
+        if encoding is None:
+            return response
+        route = request.endpoint or 'unmatched'
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.response, encoding, route)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            start = time.thread_time()
+            compressed = self._compress_data(data, encoding)
+            self._record(route, encoding, len(data), len(compressed), time.thread_time() - start)
+            response.set_data(compressed)
+
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _compress_data(self, data, encoding):
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
+
+    def _compress_stream(self, iterable, encoding, route):
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+            process, flush, finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)  # 31: gzip container
+            process, flush, finish = compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+        bytes_in = bytes_out = 0
+        cpu_seconds = 0.0
+        try:
+            for chunk in iterable:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                start = time.thread_time()
+                compressed = process(chunk) + flush()
+                cpu_seconds += time.thread_time() - start
+                bytes_in += len(chunk)
+                bytes_out += len(compressed)
+                yield compressed
+            compressed = finish()
+            bytes_out += len(compressed)
+            yield compressed
+        finally:
+            self._record(route, encoding, bytes_in, bytes_out, cpu_seconds)
+            if hasattr(iterable, 'close'):
+                iterable.close()
+
+    def _record(self, route, encoding, bytes_in, bytes_out, cpu_seconds):
+        with self._lock:
+            stats = self._stats.setdefault((route, encoding), _RouteStats())
+            stats.responses += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.cpu_seconds += cpu_seconds
+
+    def stats(self):
+        """Compressed responses, bytes before and after, ratio and CPU time per route and encoding"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            return {
+                'min_size': self.min_size,
+                'gzip_level': self.gzip_level,
+                'brotli_quality': self.brotli_quality if brotli is not None else None,
+                'routes': [{
+                    'route': route,
+                    'encoding': encoding,
+                    'responses': stats.responses,
+                    'bytes_in': stats.bytes_in,
+                    'bytes_out': stats.bytes_out,
+                    'ratio': round(stats.bytes_in / stats.bytes_out, 2) if stats.bytes_out else None,
+                    'cpu_ms': round(stats.cpu_seconds * 1000, 3),
+                } for (route, encoding), stats in items],
+            }
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        responses, bytes_in, bytes_out, cpu = [], [], [], []
+        for stats in self.stats()['routes']:
+            labels = format_labels({'route': stats['route'], 'encoding': stats['encoding']})
+            responses.append(f'devtools_compression_responses_total{{{labels}}} {stats["responses"]}')
+            bytes_in.append(f'devtools_compression_input_bytes_total{{{labels}}} {stats["bytes_in"]}')
+            bytes_out.append(f'devtools_compression_output_bytes_total{{{labels}}} {stats["bytes_out"]}')
+            cpu.append(f'devtools_compression_cpu_seconds_total{{{labels}}} {stats["cpu_ms"] / 1000}')
+        return [
+            '# TYPE devtools_compression_responses counter',
+            '# HELP devtools_compression_responses Responses sent compressed.',
+            *responses,
+            '# TYPE devtools_compression_input_bytes counter',
+            '# UNIT devtools_compression_input_bytes bytes',
+            '# HELP devtools_compression_input_bytes Response bytes before compression.',
+            *bytes_in,
+            '# TYPE devtools_compression_output_bytes counter',
+            '# UNIT devtools_compression_output_bytes bytes',
+            '# HELP devtools_compression_output_bytes Response bytes after compression.',
+            *bytes_out,
+            '# TYPE devtools_compression_cpu_seconds counter',
+            '# UNIT devtools_compression_cpu_seconds seconds',
+            '# HELP devtools_compression_cpu_seconds Thread CPU time spent compressing responses.',
+            *cpu,
+        ]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Conditional GET Module
+Strong ETags for JSON GET routes, answering If-None-Match with 304 Not Modified.
+"""
+
+import functools
+import hashlib
+
+from flask import current_app, request
+
+
+def _etag_of(data: bytes):
+    return hashlib.sha256(data).hexdigest()
+
+
+def conditional_get(version=None):
+    """
+    Decorator for GET views returning JSON. The response gets a strong ETag and must be
+    revalidated (Cache-Control: no-cache); a request whose If-None-Match matches gets a bodyless 304.
+    - without version, the ETag is the hash of the response body (the view still runs)
+    - version(*view_args) returns a cheap token that changes whenever the data changes (a file
+      mtime, a counter); the ETag derives from it, and a matching request skips the view entirely
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def conditional_view(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+
+            etag = None
+            if version is not None:
+                # The query string is part of the representation (e.g. ?category=)
+                token = f"{request.full_path}:{version(*args, **kwargs)}"
+                etag = _etag_of(token.encode('utf-8'))
+                # Weak comparison (RFC 9110): compression turns the ETag weak, the data is the same
+                if request.if_none_match.contains_weak(etag):
+                    response = current_app.response_class(status=304)
+                    response.set_etag(etag)
+                    response.cache_control.no_cache = True
+                    return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed or not response.is_json:
+                return response
+            response.set_etag(etag or _etag_of(response.get_data()))
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
+
+        return conditional_view
+    return decorator
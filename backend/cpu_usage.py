@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+CPU Usage Module
+CPU usage readings that keep a separate baseline per caller, for tools reporting system load.
+Needs psutil, which the tools using it list in their requirements.
+"""
+
+import threading
+import time
+
+import psutil
+
+
+def busy_and_total(times):
+    """Busy and total CPU seconds of a cpu_times() sample (guest time is already counted in user time)"""
+    total = sum(times) - getattr(times, 'guest', 0) - getattr(times, 'guest_nice', 0)
+    return total - times.idle - getattr(times, 'iowait', 0), total
+
+
+def usage_percent(before, after):
+    """CPU usage between two cpu_times() samples, in percent"""
+    busy_before, total_before = busy_and_total(before)
+    busy_after, total_after = busy_and_total(after)
+    if total_after <= total_before:
+        return 0.0
+    return round(min(max((busy_after - busy_before) / (total_after - total_before) * 100, 0.0), 100.0), 1)
+
+
+class CpuUsage:
+    """
+    CPU usage since the previous reading of the same caller (a route or an event topic).
+    psutil.cpu_percent(interval=None) measures since the previous call anywhere in the process:
+    callers sharing it would shorten each other's intervals to arbitrary spans.
+    """
+
+    def __init__(self):
+        self._system = {}  # caller -> (cpu_times(), per core cpu_times())
+        self._processes = {}  # caller -> (time, {pid: cpu seconds})
+        self._lock = threading.Lock()
+
+    def system_percents(self, caller):
+        """System CPU usage (total, per core) since this caller's previous call (the first call samples for a second)"""
+        with self._lock:
+            before = self._system.get(caller)
+        if before is None:
+            before = (psutil.cpu_times(), psutil.cpu_times(percpu=True))
+            time.sleep(1)
+        after = (psutil.cpu_times(), psutil.cpu_times(percpu=True))
+        with self._lock:
+            self._system[caller] = after
+        return (usage_percent(before[0], after[0]),
+                [usage_percent(core_before, core_after) for core_before, core_after in zip(before[1], after[1])])
+
+    def system_percent(self, caller):
+        """Total system CPU usage since this caller's previous call"""
+        return self.system_percents(caller)[0]
+
+    def process_percents(self, caller):
+        """{pid: CPU usage} of the processes since this caller's previous call (empty on the first call)"""
+        now = time.monotonic()
+        cpu_seconds = {}
+        for proc in psutil.process_iter(['pid', 'cpu_times']):
+            times = proc.info['cpu_times']
+            if times is not None:
+                cpu_seconds[proc.info['pid']] = times.user + times.system
+        with self._lock:
+            previous_time, previous = self._processes.get(caller, (None, {}))
+            self._processes[caller] = (now, cpu_seconds)
+        if previous_time is None or now <= previous_time:
+            return {}
+        elapsed = now - previous_time
+        return {pid: max(seconds - previous[pid], 0.0) / elapsed * 100
+                for pid, seconds in cpu_seconds.items() if pid in previous}
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Event Hub Module
+Server-Sent Events hub: tools publish to topics, browsers receive every subscribed topic over one connection.
+"""
+
+import json
+import queue
+import re
+import threading
+
+from metrics import format_labels
+
+
+class _Subscriber:
+    """One open event stream and the events waiting to be sent on it"""
+
+    def __init__(self, topics, max_queue):
+        self.topics = frozenset(topics)
+        self.queue = queue.Queue(maxsize=max_queue)
+
+    def put(self, event):
+        """Queue an event; a slow client loses its oldest events instead of blocking publishers"""
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+class EventHub:
+    """
+    Topic based publish/subscribe over Server-Sent Events.
+    Each event is serialized once per publish, whatever the number of subscribers. The last
+    event of every topic is kept and sent first to new subscribers.
+    Topic names are '<tool>/<name>', optionally with a parameter: '<tool>/<name>:<param>'.
+    Every param is a separate upstream call per interval, so a parameterized topic can only be
+    subscribed to once registered, with params matching its pattern, and a connection subscribes
+    to at most max_topics topics. The last events of parameterized topics are dropped once nobody
+    is subscribed to them.
+    """
+
+    KEEPALIVE_SECONDS = 15
+    # Default pattern of the params of a parameterized topic: a word, name or city
+    PARAM_PATTERN = r"[\w .,'()-]{1,64}"
+
+    def __init__(self, max_queue: int = 100, max_topics: int = 20):
+        self.max_queue = max_queue
+        self.max_topics = max_topics
+        self._subscribers = set()
+        self._last_events = {}
+        self._published = {}
+        self._param_patterns = {}  # parameterized topic -> compiled param pattern
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def register_parameterized(self, topic: str, param_pattern: str = None):
+        """Accept subscriptions to '<topic>:<param>' for params fully matching param_pattern"""
+        with self._lock:
+            self._param_patterns[topic] = re.compile(param_pattern or self.PARAM_PATTERN)
+
+    def topic_error(self, topic: str):
+        """Why topic cannot be subscribed to, or None"""
+        if ':' not in topic:
+            return None
+        base, param = topic.split(':', 1)
+        pattern = self._param_patterns.get(base)
+        if pattern is None:
+            return f"{base} is not a parameterized topic"
+        if not pattern.fullmatch(param):
+            return f"Invalid parameter for {base}: {param[:64]!r}"
+        return None
+
+    def publish(self, topic: str, data):
+        """Send data to every subscriber of topic"""
+        with self._lock:
+            self._next_id += 1
+            event = (f"id: {self._next_id}\n"
+                     f"data: {json.dumps({'topic': topic, 'data': data}, separators=(',', ':'))}\n\n").encode('utf-8')
+            subscribers = [subscriber for subscriber in self._subscribers if topic in subscriber.topics]
+            if subscribers or ':' not in topic:
+                self._last_events[topic] = event
+            self._published[topic] = self._published.get(topic, 0) + 1
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    def publish_active(self, topic: str, producer, parameterized: bool = False):
+        """
+        Publish producer() to topic if anyone subscribed to it. A parameterized topic publishes
+        producer(param) to each subscribed '<topic>:<param>'. Returns the number of topics published.
+        """
+        prefix = f"{topic}:"
+        targets = [name for name in self.active_topics()
+                   if (name.startswith(prefix) if parameterized else name == topic)]
+        failed = []
+        for name in targets:
+            try:
+                self.publish(name, producer(name[len(prefix):]) if parameterized else producer())
+            except Exception as e:
+                failed.append(f"{name}: {e}")
+        if failed:
+            raise RuntimeError(f"Could not publish {'; '.join(failed)}")
+        return len(targets)
+
+    def subscribe(self, topics):
+        """
+        Open a subscription to the given topics, primed with their last events. Invalid topics are
+        left out, with an error event each (one bad param does not close the page's other topics);
+        more than max_topics raises ValueError.
+        """
+        topics = set(topics)
+        if len(topics) > self.max_topics:
+            raise ValueError(f"At most {self.max_topics} topics per connection")
+        errors = {topic: self.topic_error(topic) for topic in topics}
+        subscriber = _Subscriber([topic for topic, error in errors.items() if error is None], self.max_queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            last_events = [self._last_events[topic] for topic in sorted(subscriber.topics) if topic in self._last_events]
+        for topic, error in sorted(errors.items()):
+            if error is not None:
+                subscriber.put(f"data: {json.dumps({'topic': topic, 'error': error}, separators=(',', ':'))}\n\n"
+                               .encode('utf-8'))
+        for event in last_events:
+            subscriber.put(event)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            # Parameterized topics nobody follows any more: their last event and counter go
+            remaining = set().union(*(other.topics for other in self._subscribers))
+            for topic in subscriber.topics:
+                if ':' in topic and topic not in remaining:
+                    self._last_events.pop(topic, None)
+                    self._published.pop(topic, None)
+
+    def stream(self, subscriber):
+        """Generator of the subscriber's SSE byte chunks; unsubscribes when the client goes away"""
+        try:
+            # Tell EventSource how long to wait before reconnecting
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    yield subscriber.queue.get(timeout=self.KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    # Comment line: keeps proxies from closing an idle connection
+                    yield b": keep-alive\n\n"
+        finally:
+            self.unsubscribe(subscriber)
+
+    def active_topics(self):
+        """Topics with at least one subscriber"""
+        with self._lock:
+            return set().union(*(subscriber.topics for subscriber in self._subscribers))
+
+    def stats(self):
+        """Open connections, and subscribers and published events per topic"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            published = dict(self._published)
+        topics = {}
+        for subscriber in subscribers:
+            for topic in subscriber.topics:
+                topics.setdefault(topic, {'subscribers': 0, 'published': published.get(topic, 0)})
+                topics[topic]['subscribers'] += 1
+        for topic, count in published.items():
+            topics.setdefault(topic, {'subscribers': 0, 'published': count})
+        return {'connections': len(subscribers), 'topics': dict(sorted(topics.items()))}
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        stats = self.stats()
+        subscribers, published = [], []
+        for topic, topic_stats in stats['topics'].items():
+            labels = format_labels({'topic': topic})
+            subscribers.append(f'devtools_events_subscribers{{{labels}}} {topic_stats["subscribers"]}')
+            published.append(f'devtools_events_published_total{{{labels}}} {topic_stats["published"]}')
+        return [
+            '# TYPE devtools_events_connections gauge',
+            '# HELP devtools_events_connections Open Server-Sent Events connections.',
+            f'devtools_events_connections {stats["connections"]}',
+            '# TYPE devtools_events_subscribers gauge',
+            '# HELP devtools_events_subscribers Open connections subscribed to a topic.',
+            *subscribers,
+            '# TYPE devtools_events_published counter',
+            '# HELP devtools_events_published Events published to a topic.',
+            *published,
+        ]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+File Watcher Module
+Polls a directory tree in the background and notifies when files change.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+
+class FileWatcher:
+    """Polling file-change watcher (no external dependencies)"""
+
+    def __init__(self, root: Path, callback, interval: float = 2.0, suffixes=None):
+        self.root = root
+        self.callback = callback
+        self.interval = interval
+        self.suffixes = tuple(suffixes) if suffixes else None
+        self._snapshot = self.snapshot()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def snapshot(self):
+        """Return a {path: (mtime_ns, size)} map of all watched files"""
+        files = {}
+        if not self.root.exists():
+            return files
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if self.suffixes and not filename.endswith(self.suffixes):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def start(self):
+        """Start polling in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='file-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling"""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            current = self.snapshot()
+            if current != self._snapshot:
+                self._snapshot = current
+                try:
+                    self.callback()
+                except Exception as e:
+                    print(f"Error in file watcher callback for {self.root}: {e}")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+HTTP Client Module
+Shared outbound HTTP client for tools: pooled keep-alive sessions per host, default
+timeouts, retries with backoff and per-host connection metrics.
+"""
+
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from metrics import format_labels
+
+
+class _HostStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+
+
+class HttpClient:
+    """
+    Drop-in replacement for the `requests` module functions used by tools (get/post/request).
+    Connections are kept alive and reused per host. Only idempotent methods are retried after a
+    request was sent; failed connection attempts are retried for every method.
+    A forked child process (production worker, bulkhead process) starts with new sessions: the
+    keep-alive connections opened before the fork are never shared between processes.
+    """
+
+    RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(self, pool_maxsize: int = 10, timeout: float = 10.0, retries: int = 2,
+                 backoff_factor: float = 0.3):
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._sessions = {}
+        self._adapters = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # Called with (method, url, seconds, status or None) after every outbound request
+        self.observers = []
+
+    def _session(self, host_key):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Sockets inherited from the parent process are never reused (nor closed: the parent owns them)
+                self._sessions, self._adapters, self._stats = {}, {}, {}
+                self._pid = os.getpid()
+            session = self._sessions.get(host_key)
+            if session is None:
+                retry = Retry(total=self.retries, backoff_factor=self.backoff_factor,
+                              status_forcelist=self.RETRY_STATUSES, raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                # Requests from different users share the session: never replay upstream cookies
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                self._sessions[host_key] = session
+                self._adapters[host_key] = adapter
+                self._stats[host_key] = _HostStats()
+            return session
+
+    def request(self, method: str, url: str, **kwargs):
+        """Send a request through the pooled session of the URL's host"""
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+        session = self._session(host_key)
+        # An explicit timeout=None (e.g. long-lived streams) is kept as is
+        kwargs.setdefault('timeout', self.timeout)
+
+        start = time.perf_counter()
+        failed = True
+        status = None
+        try:
+            response = session.request(method, url, **kwargs)
+            status = response.status_code
+            failed = status >= 500
+            return response
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                stats = self._stats[host_key]
+                stats.requests += 1
+                stats.total_seconds += seconds
+                if failed:
+                    stats.errors += 1
+            self.notify_observers(method, url, seconds, status)
+
+    def notify_observers(self, method: str, url: str, seconds: float, status):
+        """Report an outbound request (also used by the async client for the requests it sends itself)"""
+        for observer in self.observers:
+            observer(method, url, seconds, status)
+
+    def get(self, url: str, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def _connections_opened(self, host_key):
+        """Number of TCP/TLS connections urllib3 opened for a host (reused ones are not counted)"""
+        adapter = self._adapters[host_key]
+        pools = adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def stats(self):
+        """Per-host request, error, latency and connection counters"""
+        with self._lock:
+            hosts = list(self._stats.items())
+        result = {}
+        for host_key, stats in hosts:
+            result[host_key] = {
+                'requests': stats.requests,
+                'errors': stats.errors,
+                'total_seconds': round(stats.total_seconds, 6),
+                'connections_opened': self._connections_opened(host_key),
+            }
+        return result
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        requests_lines, errors_lines, duration_lines, connection_lines = [], [], [], []
+        for host_key, stats in sorted(self.stats().items()):
+            labels = format_labels({'host': host_key})
+            requests_lines.append(f'devtools_http_client_requests_total{{{labels}}} {stats["requests"]}')
+            errors_lines.append(f'devtools_http_client_errors_total{{{labels}}} {stats["errors"]}')
+            duration_lines.append(f'devtools_http_client_duration_seconds_total{{{labels}}} {stats["total_seconds"]}')
+            connection_lines.append(f'devtools_http_client_connections_opened_total{{{labels}}} {stats["connections_opened"]}')
+        return [
+            '# TYPE devtools_http_client_requests counter',
+            '# HELP devtools_http_client_requests Outbound requests sent by tools, per upstream host.',
+            *requests_lines,
+            '# TYPE devtools_http_client_errors counter',
+            '# HELP devtools_http_client_errors Outbound requests that raised or returned a 5xx status.',
+            *errors_lines,
+            '# TYPE devtools_http_client_duration_seconds counter',
+            '# UNIT devtools_http_client_duration_seconds seconds',
+            '# HELP devtools_http_client_duration_seconds Time spent in outbound requests, including retries.',
+            *duration_lines,
+            '# TYPE devtools_http_client_connections_opened counter',
+            '# HELP devtools_http_client_connections_opened New upstream connections; the rest of the requests reused a pooled one.',
+            *connection_lines,
+        ]
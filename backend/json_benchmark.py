@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+JSON Benchmark Module
+Times jsonify and request decoding of representative tool payloads with each available JSON provider.
+
+Usage: python json_benchmark.py [--rounds 200]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from json_provider import OrjsonProvider, orjson
+
+
+def network_info_payload(interfaces=100):
+    """get_network_info of a host with many interfaces (dev-tool-system-info)"""
+    rng = random.Random(1)
+    return {
+        'interfaces': [{
+            'name': f'veth{i:04x}',
+            'addresses': [
+                {'family': 'IPv4', 'address': f'10.{i // 256}.{i % 256}.1', 'netmask': '255.255.255.0',
+                 'broadcast': f'10.{i // 256}.{i % 256}.255'},
+                {'family': 'IPv6', 'address': f'fe80::{i:x}:ff:fe00:{i:x}%veth{i:04x}', 'netmask': 'ffff:ffff:ffff:ffff::'},
+                {'family': 'MAC', 'address': ':'.join(f'{rng.randrange(256):02x}' for _ in range(6))},
+            ],
+            'stats': {'isup': True, 'duplex': 2, 'speed': 10000, 'mtu': 1500},
+            'counters': {key: rng.randrange(10 ** 12) for key in
+                         ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                          'errin', 'errout', 'dropin', 'dropout')},
+        } for i in range(interfaces)],
+        'total_counters': {'bytes_sent': 10 ** 13, 'bytes_recv': 2 * 10 ** 13,
+                           'packets_sent': 10 ** 10, 'packets_recv': 2 * 10 ** 10},
+    }
+
+
+def conversation_payload(messages=1000):
+    """conversations_messages_list of a long conversation (dev-tool-conversations)"""
+    rng = random.Random(2)
+    words = ('the', 'group', 'member', 'agrees', 'that', 'pricing', 'should', 'follow', 'usage',
+             'but', 'quality', 'matters', 'more', 'for', 'enterprise', 'customers', 'über', 'naïve')
+    start = datetime(2025, 1, 1)
+    return {
+        'success': True,
+        'data': {
+            'conversation_id': 4242,
+            'messages': [{
+                'id': 100000 + i,
+                'member_id': i % 7,
+                'member_name': f'Member {i % 7}',
+                'message_text': ' '.join(rng.choice(words) for _ in range(rng.randrange(20, 120))),
+                'created_at': (start + timedelta(seconds=37 * i)).isoformat(),
+                'feedback': {'score': rng.randrange(1, 6), 'reason': None} if i % 3 == 0 else None,
+                'usage': {'prompt_tokens': rng.randrange(2000), 'completion_tokens': rng.randrange(500),
+                          'latency': round(rng.random() * 3, 3)},
+            } for i in range(messages)],
+        },
+    }
+
+
+def rss_payload(items=20):
+    """get_feed of a 20-item feed (dev-tool-rss)"""
+    return {
+        'success': True,
+        'feed_title': 'Example News',
+        'feed_description': 'Latest stories from Example News',
+        'items': [{
+            'title': f'Story number {i}: something happened somewhere',
+            'link': f'https://news.example.com/2025/01/{i:02d}/story-{i}',
+            'description': ('Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 6)[:297] + '...',
+            'published': datetime(2025, 1, 1 + i % 28, 8, i).isoformat(),
+            'author': 'Example Staff',
+            'guid': f'https://news.example.com/?p={1000 + i}',
+        } for i in range(items)],
+        'last_updated': datetime(2025, 1, 28).isoformat(),
+    }
+
+
+PAYLOADS = {
+    'network_info (100 interfaces)': network_info_payload,
+    'conversation (1,000 messages)': conversation_payload,
+    'rss feed (20 items)': rss_payload,
+}
+
+
+def _time(func, rounds):
+    """Best per-call time in ms over `rounds` calls, after a warmup"""
+    func()
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(rounds=200):
+    """Encode (jsonify) and decode (get_json) times per payload and provider, in ms"""
+    providers = [DefaultJSONProvider] + ([OrjsonProvider] if orjson is not None else [])
+    results = {}
+    for payload_name, build in PAYLOADS.items():
+        payload = build()
+        for provider_class in providers:
+            app = Flask(__name__)
+            app.json = provider_class(app)
+            with app.app_context():
+                body = app.json.response(payload).get_data()
+                results[(payload_name, provider_class.__name__)] = {
+                    'bytes': len(body),
+                    'encode_ms': _time(lambda: app.json.response(payload).get_data(), rounds),
+                    'decode_ms': _time(lambda: app.json.loads(body), rounds),
+                }
+    return providers, results
+
+
+def format_table(providers, results):
+    """Results as a plain-text table, with the gain over the standard library"""
+    name_width = max(len(name) for name in PAYLOADS)
+    header = f"{'Payload':<{name_width}}  {'provider':<20}  {'bytes':>9}  {'encode ms':>9}  {'decode ms':>9}  {'gain':>11}"
+    lines = [header, '-' * len(header)]
+    for payload_name in PAYLOADS:
+        base = results[(payload_name, DefaultJSONProvider.__name__)]
+        for provider_class in providers:
+            result = results[(payload_name, provider_class.__name__)]
+            gain = (f"{base['encode_ms'] / result['encode_ms']:.1f}x/{base['decode_ms'] / result['decode_ms']:.1f}x"
+                    if provider_class is not DefaultJSONProvider else '-')
+            lines.append(f"{payload_name:<{name_width}}  {provider_class.__name__:<20}  {result['bytes']:>9}"
+                         f"  {result['encode_ms']:>9.3f}  {result['decode_ms']:>9.3f}  {gain:>11}")
+    if orjson is None:
+        lines.append('orjson is not installed: only the standard library provider was measured')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the JSON providers on representative tool payloads')
+    parser.add_argument('--rounds', type=int, default=200, help='Timed calls per payload and provider (default: 200)')
+    args = parser.parse_args()
+    print(format_table(*run(args.rounds)))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+JSON Provider Module
+Fast JSON encoding and decoding for jsonify / request.get_json, with the standard library as fallback.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson. Output matches DefaultJSONProvider's for the data
+    tools return (sorted keys, dates as HTTP dates, non-string keys as strings); anything
+    orjson cannot encode (integers beyond 64 bits, custom options) goes to the stdlib provider.
+    """
+
+    name = 'orjson'
+
+    def _options(self, indent=False):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj, indent=False):
+        """Serialize to UTF-8 bytes (what the response body needs) without a str round trip"""
+        return orjson.dumps(obj, default=self.default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            # orjson never escapes non-ASCII; stdlib escapes by default, both are valid JSON
+            return self.dumps_bytes(obj).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Same error type and message as the stdlib provider (e.g. NaN, which orjson rejects)
+            return super().loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = self.dumps_bytes(obj, indent=indent)
+        except TypeError:
+            return super().response(obj)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+
+def select_json_provider(name: str = 'auto'):
+    """The provider class for name: 'auto' (orjson when installed), 'orjson' or 'stdlib'"""
+    if name == 'stdlib':
+        return DefaultJSONProvider
+    if orjson is None:
+        if name == 'orjson':
+            print("Warning: JSON_PROVIDER=orjson but orjson is not installed, using the standard library")
+        return DefaultJSONProvider
+    return OrjsonProvider
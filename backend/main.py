@@ -4,29 +4,197 @@ Dev Tools App - Backend Server
 A modular development tools application with tool-based architecture.
 """
 
+import argparse
+import functools
+import hmac
 import os
+import re
+import signal
+import sys
+import time
 from pathlib import Path
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template, request
 from flask_cors import CORS
 from dotenv import load_dotenv
+from admission import AdmissionController
+from async_runtime import AsyncHttpClient, AsyncLoop
+from batch import BatchRunner
+from bulkhead import ProcessBulkhead
+from cache_backends import RedisClient
+from cache_service import CacheRegistry
+from compression import ResponseCompressor
+from conditional import conditional_get
+from event_hub import EventHub
+from http_client import HttpClient
+from json_provider import select_json_provider
+from memory_snapshots import MemorySnapshots
+from metrics import render_openmetrics
+from prefork import PreforkServer, WorkerStats
+from sampling_profiler import SamplingProfiler
+from scheduler import JobScheduler
+from slow_requests import SlowRequestMonitor
+from static_assets import StaticAssets, precompress_static
 from tool_manager import ToolManager
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__, template_folder='../frontend', static_folder='../frontend/static')
-CORS(app)
+# JSON encoder/decoder of jsonify and request.get_json: auto (orjson when installed), orjson or stdlib
+app.json = select_json_provider(os.getenv('JSON_PROVIDER', 'auto').lower())(app)
+
+# Production mode (python main.py --production): prefork workers, never the debugger or reloader
+PRODUCTION = __name__ == '__main__' and '--production' in sys.argv
 
 # Configuration
-app.config['DEBUG'] = os.getenv('DEBUG', 'True').lower() == 'true'
+app.config['DEBUG'] = os.getenv('DEBUG', 'True').lower() == 'true' and not PRODUCTION
+
+# Admin endpoints (cache invalidation, /api/debug/*, /api/workers) are registered only with ADMIN_ENDPOINTS
+# (default: on with DEBUG); with ADMIN_TOKEN set they also require 'Authorization: Bearer <token>'
+ADMIN_ENDPOINTS = os.getenv('ADMIN_ENDPOINTS', str(app.config['DEBUG'])).lower() == 'true'
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+ADMIN_PATHS = re.compile(r'/api/(debug/|cache/invalidate|workers)')
+# Cross-origin requests are allowed on every path except the admin endpoints (nor can a batch reach them)
+CORS(app, resources={re.compile(rf'^(?!{ADMIN_PATHS.pattern}).*'): {}})
 
 # Paths
 BACKEND_DIR = Path(__file__).parent
 FRONTEND_DIR = BACKEND_DIR.parent / 'frontend'
 TOOLS_DIR = BACKEND_DIR / 'tools'
 
+# Precompressing static files is a deployment step: it exits here, before any tool is loaded or started
+if __name__ == '__main__' and '--precompress-static' in sys.argv:
+    counts = precompress_static(FRONTEND_DIR / 'static')
+    print(f"Precompressed static files: {counts['written']} variants written "
+          f"({counts['original_bytes']} -> {counts['compressed_bytes']} bytes), "
+          f"{counts['current']} up to date, {counts['skipped']} not worth compressing")
+    sys.exit(0)
+
+# Profiling startup loads every tool eagerly and without the metadata cache, so all phases are measured
+PROFILE_STARTUP = __name__ == '__main__' and '--profile-startup' in sys.argv
+
+# Allocation tracing for /api/debug/memory; started before the tools are imported so their allocations are traced
+memory_snapshots = MemorySnapshots(TOOLS_DIR, BACKEND_DIR, keep=int(os.getenv('MEMORY_SNAPSHOTS_KEEP', '5')))
+memory_trace_frames = int(os.getenv('MEMORY_TRACE_FRAMES', '16'))
+if os.getenv('MEMORY_TRACING', 'False').lower() == 'true':
+    memory_snapshots.start(frames=memory_trace_frames)
+
 # Initialize tool manager
-tool_manager = ToolManager(TOOLS_DIR, app)
+# Bundling (one minified, content-hashed script per tool) defaults to on outside of DEBUG
+bundle_imports = os.getenv('TOOLS_BUNDLE_IMPORTS', str(not app.config['DEBUG'])).lower() == 'true'
+# Lazy mode imports a tool's api.py on the first request under /api/<tool>/
+# Production workers are forked after every tool is imported, so lazy loading is off there
+lazy_tools = os.getenv('TOOLS_LAZY_LOAD', 'False').lower() == 'true' and not PROFILE_STARTUP and not PRODUCTION
+# Cached tool metadata lets restarts skip re-executing unchanged tools (empty path disables it)
+metadata_cache_path = os.getenv('TOOLS_METADATA_CACHE', str(BACKEND_DIR / '.cache' / 'tools-manifest.json'))
+if PROFILE_STARTUP:
+    metadata_cache_path = ''
+# Shared outbound HTTP client handed to tools (pooled keep-alive connections per upstream host)
+http_client = HttpClient(
+    pool_maxsize=int(os.getenv('HTTP_POOL_MAXSIZE', '10')),
+    timeout=float(os.getenv('HTTP_TIMEOUT', '10')),
+    retries=int(os.getenv('HTTP_RETRIES', '2')),
+    backoff_factor=float(os.getenv('HTTP_BACKOFF_FACTOR', '0.3'))
+)
+# Tool caches; with CACHE_REDIS_URL, caches created with shared=True live on that Redis-protocol server
+cache_redis_url = os.getenv('CACHE_REDIS_URL', '')
+cache_registry = CacheRegistry(
+    shared_client=RedisClient(cache_redis_url, timeout=float(os.getenv('CACHE_REDIS_TIMEOUT', '0.5')))
+    if cache_redis_url else None,
+    key_prefix=os.getenv('CACHE_KEY_PREFIX', 'devtools')
+)
+# Shared event loop for async def tool handlers, with an async client (native when aiohttp is installed)
+async_loop = AsyncLoop()
+async_http_client = AsyncHttpClient(http_client, pool_maxsize=http_client.pool_maxsize, timeout=http_client.timeout)
+# Worker pool of the background job scheduler (cache refresh and prefetch jobs of tools)
+scheduler = JobScheduler(max_workers=int(os.getenv('SCHEDULER_WORKERS', '4')))
+# Server-Sent Events hub; a connection subscribes to at most EVENTS_MAX_TOPICS topics
+event_hub = EventHub(max_topics=int(os.getenv('EVENTS_MAX_TOPICS', '20')))
+# Process pool for blocking handlers (routes marked isolate=True, functions wrapped with services.isolate)
+bulkhead = ProcessBulkhead(app, workers=int(os.getenv('BULKHEAD_WORKERS', '2')),
+                           max_queue=int(os.getenv('BULKHEAD_QUEUE', '8')),
+                           timeout=float(os.getenv('BULKHEAD_TIMEOUT', '15')))
+# Concurrency limits overriding the tools' own: 'dev-tool-rss=4:8,dev-tool-conversations.ai_autocomplete=2'
+admission = AdmissionController(os.getenv('CONCURRENCY_LIMITS', ''),
+                                queue_timeout=float(os.getenv('ADMISSION_QUEUE_TIMEOUT', '10')))
+# Tool requests running longer than SLOW_REQUEST_THRESHOLD seconds get their stack sampled (0 disables)
+slow_requests = SlowRequestMonitor(threshold=float(os.getenv('SLOW_REQUEST_THRESHOLD', '1')),
+                                   interval=float(os.getenv('SLOW_REQUEST_SAMPLE_INTERVAL', '0.005')),
+                                   keep=int(os.getenv('SLOW_REQUESTS_KEEP', '50')))
+tool_manager = ToolManager(TOOLS_DIR, app, FRONTEND_DIR / 'static' / 'tools',
+                           bundle_imports=bundle_imports, lazy=lazy_tools,
+                           metadata_cache_path=Path(metadata_cache_path) if metadata_cache_path else None,
+                           http_client=http_client, cache_registry=cache_registry, scheduler=scheduler,
+                           event_hub=event_hub, bulkhead=bulkhead, async_loop=async_loop,
+                           async_http_client=async_http_client, admission=admission, slow_requests=slow_requests)
+
+# With the debug reloader, the parent process only restarts the server: jobs and the process pool run in its child.
+# In production mode they run in every worker process (threads do not survive the fork).
+RELOADER_PARENT = __name__ == '__main__' and app.config['DEBUG'] and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+
+# Run the tools' warmup() hooks concurrently, waiting at most TOOLS_WARMUP_TIMEOUT seconds (0 disables them).
+# Production workers and the process pool are forked afterwards, so they start warm.
+warmup_timeout = float(os.getenv('TOOLS_WARMUP_TIMEOUT', '10'))
+if warmup_timeout > 0 and not PROFILE_STARTUP and not RELOADER_PARENT:
+    tool_manager.run_warmups(warmup_timeout)
+
+# Fork the process pool now, while the server has no other threads
+if not PROFILE_STARTUP and not RELOADER_PARENT and not PRODUCTION:
+    bulkhead.start()
+
+# Rebuild the imports manifest when tool frontend files change (0 disables the watcher)
+watch_interval = float(os.getenv('TOOLS_WATCH_INTERVAL', '2'))
+if watch_interval > 0 and not PROFILE_STARTUP and not PRODUCTION:
+    tool_manager.watch_static_files(watch_interval)
+
+# Run the tools' periodic jobs (false disables them, e.g. when the upstream APIs are rate limited).
+SCHEDULER_ENABLED = os.getenv('SCHEDULER_ENABLED', 'True').lower() == 'true'
+if SCHEDULER_ENABLED and not PROFILE_STARTUP and not RELOADER_PARENT and not PRODUCTION:
+    scheduler.start()
+
+# Continuous sampling profiler of all threads, exported at /api/debug/profile (opt-in)
+PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'False').lower() == 'true'
+sampling_profiler = SamplingProfiler(tool_manager.active_requests, rate=float(os.getenv('PROFILER_RATE', '100')),
+                                     retention=int(os.getenv('PROFILER_RETENTION', '600')),
+                                     max_overhead=float(os.getenv('PROFILER_MAX_OVERHEAD', '0.02'))
+                                     ) if PROFILER_ENABLED else None
+if sampling_profiler and not PROFILE_STARTUP and not RELOADER_PARENT and not PRODUCTION:
+    sampling_profiler.start()
+
+# Negotiated gzip (and brotli, when installed) for JSON and event-stream responses
+compressor = ResponseCompressor(min_size=int(os.getenv('COMPRESSION_MIN_SIZE', '1024')),
+                                gzip_level=int(os.getenv('COMPRESSION_LEVEL', '6')),
+                                brotli_quality=int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4')))
+if os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true':
+    compressor.init_app(app)
+
+# Static files: precompressed variants (python main.py --precompress-static) and immutable ?v=<hash> URLs
+static_assets = StaticAssets(FRONTEND_DIR / 'static', max_age=int(os.getenv('STATIC_MAX_AGE', '31536000')))
+static_assets.init_app(app)
+# Let a fronting proxy (nginx X-Accel / Apache X-Sendfile) send static files
+app.config['USE_X_SENDFILE'] = os.getenv('STATIC_X_SENDFILE', 'False').lower() == 'true'
+
+# Per-worker request counters (production mode only)
+worker_stats = None
+
+# Sub-requests of /api/batch run concurrently on this many threads, at most BATCH_CONCURRENCY per batch
+batch_runner = BatchRunner(app, max_workers=int(os.getenv('BATCH_WORKERS', '8')),
+                           max_items=int(os.getenv('BATCH_MAX_ITEMS', '20')),
+                           max_concurrent=int(os.getenv('BATCH_CONCURRENCY', '4')), excluded_pattern=ADMIN_PATHS)
+
+def admin_route(rule, **options):
+    """app.route for admin endpoints: skipped without ADMIN_ENDPOINTS, token-checked with ADMIN_TOKEN"""
+    def decorator(f):
+        if not ADMIN_ENDPOINTS:
+            return f
+        @functools.wraps(f)
+        def view(*args, **kwargs):
+            authorization = request.headers.get('Authorization', '').encode()
+            if ADMIN_TOKEN and not hmac.compare_digest(authorization, f'Bearer {ADMIN_TOKEN}'.encode()):
+                return jsonify({'success': False, 'error': 'Admin token required'}), 401
+            return f(*args, **kwargs)
+        return app.route(rule, **options)(view)
+    return decorator
 
 @app.route('/')
 def index():
@@ -34,6 +202,7 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/tools')
+@conditional_get(version=lambda: tool_manager.tools_version)
 def get_tools():
     """Get available tools"""
     try:
@@ -43,23 +212,11 @@ def get_tools():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/tools/<tool_name>/panels')
+@conditional_get()
 def get_tool_panels(tool_name):
     """Get available panels for a specific tool"""
     try:
-        from pathlib import Path
-        panels_dir = FRONTEND_DIR / 'static' / 'tools' / tool_name / 'panels'
-        
-        if not panels_dir.exists():
-            return jsonify({'success': True, 'panels': []})
-        
-        panels = []
-        for panel_file in panels_dir.glob('*.js'):
-            if panel_file.is_file():
-                # Extract panel name from filename (remove .js extension)
-                panel_name = panel_file.stem
-                panels.append(panel_name)
-        
-        return jsonify({'success': True, 'panels': panels})
+        return jsonify({'success': True, 'panels': tool_manager.get_tool_panels(tool_name)})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -67,40 +224,258 @@ def get_tool_panels(tool_name):
 def get_tools_imports():
     """Return a mapping of tool_name -> list of JS script paths to import for all tools"""
     try:
-        tools = tool_manager.get_available_tools()
-        imports_map = {}
-        for tool_name, info in tools.items():
-            imports = info.get('imports', [])
-            resolved_imports = []
-            for path in imports:
-                # If it's a URL, just add it
-                if path.startswith('http://') or path.startswith('https://'):
-                    resolved_imports.append(path)
-                # If it contains a wildcard, expand it
-                elif '*' in path:
-                    # Get the directory and pattern
-                    static_dir = FRONTEND_DIR / 'static' / 'tools' / tool_name
-                    pattern_path = path
-                    # Use glob to expand the pattern
-                    for match in static_dir.glob(pattern_path):
-                        if match.is_file() and match.suffix == '.js':
-                            # Add as static path
-                            rel_path = match.relative_to(FRONTEND_DIR)
-                            resolved_imports.append(f"/{rel_path.as_posix()}")
-                else:
-                    # Normal static file
-                    resolved_imports.append(f"/static/tools/{tool_name}/{path}")
-            imports_map[tool_name] = resolved_imports
-        return jsonify({'success': True, 'imports': imports_map})
+        # The manifest is built once by the tool manager and rebuilt on file changes
+        body, etag = tool_manager.get_imports_manifest()
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/bundles/<filename>')
+def get_tool_bundle(filename):
+    """Serve a tool's content-hashed script bundle"""
+    content, encoding = tool_manager.get_bundle(filename, request.accept_encodings)
+    if content is None:
+        return jsonify({'success': False, 'error': f'Bundle {filename} not found'}), 404
+    response = Response(content, mimetype='application/javascript')
+    # Compressed when the bundle was built, so the response compressor leaves it alone
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    # The file name carries the content hash, so the bundle never changes under its URL
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Per-endpoint request metrics of all tools in OpenMetrics text format"""
+    return Response(render_openmetrics(tool_manager.metrics, tool_manager.http_client, tool_manager.async_http_client,
+                                       tool_manager.cache_registry, tool_manager.single_flight, tool_manager.scheduler,
+                                       tool_manager.event_hub, tool_manager.bulkhead, tool_manager.admission, compressor,
+                                       tool_manager.slow_requests,
+                                       *([sampling_profiler] if sampling_profiler else []),
+                                       *([worker_stats] if worker_stats else [])),
+                    mimetype='application/openmetrics-text; version=1.0.0; charset=utf-8')
+
+@app.route('/api/cache/stats')
+def get_cache_stats():
+    """Size, hit/miss and eviction counters of every tool cache"""
+    try:
+        return jsonify({'success': True, 'caches': tool_manager.cache_registry.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@admin_route('/api/cache/invalidate', methods=['POST'])
+def invalidate_cache():
+    """Drop cached entries by key prefix: {"cache": "<tool>/<name>" or "<tool>/", "prefix": "..."}"""
+    try:
+        payload = request.get_json(silent=True) or {}
+        dropped = tool_manager.cache_registry.invalidate(payload.get('cache'), payload.get('prefix', ''))
+        return jsonify({'success': True, 'invalidated': dropped})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/events')
+def get_events():
+    """Server-Sent Events stream of the requested topics: /api/events?topic=<tool>/<name>&topic=..."""
+    topics = [topic for topic in request.args.getlist('topic') if topic]
+    if not topics:
+        return jsonify({'success': False, 'error': 'At least one topic parameter is required'}), 400
+    try:
+        subscriber = tool_manager.event_hub.subscribe(topics)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    response = Response(tool_manager.event_hub.stream(subscriber), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/events/stats')
+def get_events_stats():
+    """Open event connections and subscribers per topic"""
+    try:
+        return jsonify({'success': True, **tool_manager.event_hub.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/bulkhead/stats')
+def get_bulkhead_stats():
+    """Calls, rejections and timeouts of the handlers running in the process pool"""
+    try:
+        return jsonify({'success': True, **tool_manager.bulkhead.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/admission/stats')
+def get_admission_stats():
+    """Concurrency limits with their running and queued requests and shed counts"""
+    try:
+        return jsonify({'success': True, 'limiters': tool_manager.admission.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/compression/stats')
+def get_compression_stats():
+    """Compression ratio and CPU time per route and encoding"""
+    try:
+        return jsonify({'success': True, **compressor.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@admin_route('/api/debug/slow', methods=['GET', 'DELETE'])
+def get_slow_requests():
+    """Slow tool requests with stack samples and upstream calls (?tool=, ?format=collapsed; DELETE clears)"""
+    try:
+        if request.method == 'DELETE':
+            slow_requests.clear()
+            return jsonify({'success': True})
+        tool_name = request.args.get('tool') or None
+        if request.args.get('format') == 'collapsed':
+            return Response(slow_requests.collapsed(tool_name), mimetype='text/plain')
+        return jsonify({'success': True, **slow_requests.stats(), 'requests': slow_requests.recent(tool_name)})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@admin_route('/api/debug/profile')
+def get_profile():
+    """Sampled stacks of the last ?seconds=N (default 60), collapsed (?tool=, ?idle=true; ?format=json: per root)"""
+    try:
+        if sampling_profiler is None or not sampling_profiler.running:
+            return jsonify({'success': False, 'error': 'The sampling profiler is off (set PROFILER_ENABLED=True)'}), 409
+        seconds = min(request.args.get('seconds', 60, type=float), sampling_profiler.retention)
+        idle = request.args.get('idle', 'false').lower() == 'true'
+        if request.args.get('format') == 'json':
+            return jsonify({'success': True, **sampling_profiler.stats(), 'seconds': seconds,
+                            'endpoints': sampling_profiler.endpoints(seconds, idle)})
+        return Response(sampling_profiler.collapsed(seconds, request.args.get('tool') or None, idle),
+                        mimetype='text/plain')
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@admin_route('/api/debug/memory', methods=['GET', 'POST'])
+def get_memory():
+    """Traced memory per tool package and core module (?snapshot=<id>), or its growth since a snapshot
+    (?since=<id>[&to=<id>]); POST takes a snapshot, starting tracing if MEMORY_TRACING is off"""
+    try:
+        if request.method == 'POST':
+            memory_snapshots.start(frames=memory_trace_frames)
+            return jsonify({'success': True, 'id': memory_snapshots.take(), **memory_snapshots.stats()})
+        if not memory_snapshots.tracing:
+            return jsonify({'success': False,
+                            'error': 'Memory tracing is off (set MEMORY_TRACING=True, or POST to start it)'}), 409
+        limit = request.args.get('limit', 20, type=int)
+        since = request.args.get('since', type=int)
+        if since is not None:
+            groups = memory_snapshots.diff(since, request.args.get('to', type=int), limit=limit)
+        else:
+            groups = memory_snapshots.report(request.args.get('snapshot', type=int), limit=limit)
+        return jsonify({'success': True, **memory_snapshots.stats(), 'groups': groups})
+    except KeyError as e:
+        return jsonify({'success': False, 'error': e.args[0]}), 404
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/scheduler/jobs')
+def get_scheduler_jobs():
+    """Background jobs of all tools with their run-time statistics"""
+    try:
+        return jsonify({'success': True, 'jobs': tool_manager.scheduler.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/batch', methods=['POST'])
+def run_batch():
+    """Run several tool API calls in one round trip: {"requests": [{"method", "path", "body"}, ...]}"""
+    try:
+        payload = request.get_json(silent=True) or {}
+        items = payload.get('requests')
+        error = batch_runner.validate(items)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+        start = time.perf_counter()
+        results = batch_runner.run(items, headers=request.headers, remote_addr=request.remote_addr)
+        return jsonify({'success': True, 'results': results,
+                        'duration_ms': round((time.perf_counter() - start) * 1000, 2)})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@admin_route('/api/workers')
+def get_workers():
+    """Request counters of the production worker processes"""
+    try:
+        return jsonify({'success': True, 'mode': 'production' if worker_stats else 'development',
+                        'workers': worker_stats.stats() if worker_stats else []})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/health')
 def health_check():
-    """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'tools_count': len(tool_manager.tools)})
+    """Health check endpoint; a tool is ready once it is loaded and its warmup finished"""
+    tools_ready = {name: name not in tool_manager.pending_tools and tool_manager.warmups.is_ready(name)
+                   for name in tool_manager.tools}
+    return jsonify({
+        'status': 'healthy',
+        'ready': all(tools_ready.values()),
+        'tools_count': len(tool_manager.tools),
+        'tools_ready': tools_ready,
+        'pending_tools': list(tool_manager.pending_tools),
+        'activation_ms': {name: round(seconds * 1000, 1) for name, seconds in tool_manager.activation_times.items()},
+        'warmups': tool_manager.warmups.stats()
+    })
+
+def serve_production(host, port, workers):
+    """Serve with a prefork master and worker processes sharing the preloaded tools"""
+    global worker_stats
+    worker_stats = WorkerStats(workers)
+
+    def retire_worker():
+        # The master forks a fresh worker (and process pool) once this one finished its requests
+        print(f"Worker {os.getpid()} retiring to replace its process pool")
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    def post_fork(worker):
+        # The pool is forked first, while the worker has no other threads
+        bulkhead.on_broken = retire_worker
+        bulkhead.start()
+        tool_manager.warmups.after_fork()
+        if SCHEDULER_ENABLED:
+            scheduler.start()
+        if sampling_profiler:
+            sampling_profiler.start()
+
+    server = PreforkServer(app, host, port, workers, worker_stats, post_fork=post_fork,
+                           graceful_timeout=float(os.getenv('GRACEFUL_TIMEOUT', '30')))
+    server.serve_forever()
+
+def profile_startup(output_path):
+    """Print the per-tool startup profile and write it as JSON"""
+    print()
+    print(tool_manager.profiler.format_table())
+    tool_manager.profiler.write_json(output_path)
+    print(f"\nStartup profile written to {output_path}")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Dev Tools App backend server')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Load all tools, report per-tool load phase timings and imports, then exit')
+    parser.add_argument('--profile-output', default='startup-profile.json',
+                        help='JSON file for the --profile-startup report (default: startup-profile.json)')
+    parser.add_argument('--precompress-static', action='store_true',
+                        help='Write .br/.gz variants of the files under frontend/static next to the originals, then exit')
+    parser.add_argument('--production', action='store_true',
+                        help='Serve with multiple worker processes forked after all tools are loaded (DEBUG is ignored)')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('WORKERS', os.cpu_count() or 1)),
+                        help='Number of worker processes in --production mode (default: WORKERS or the CPU count)')
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        profile_startup(args.profile_output)
+        sys.exit(0)
+
     host = os.getenv('HOST', '127.0.0.1')
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('DEBUG', 'True').lower() == 'true'
@@ -109,5 +484,9 @@ if __name__ == '__main__':
     print(f"Frontend directory: {FRONTEND_DIR}")
     print(f"Tools directory: {TOOLS_DIR}")
     print(f"Available tools: {list(tool_manager.tools.keys())}")
-    
+
+    if args.production:
+        serve_production(host, port, max(args.workers, 1))
+        sys.exit(0)
+
     app.run(host=host, port=port, debug=debug)
\ No newline at end of file
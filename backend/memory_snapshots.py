@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Memory Snapshots Module
+tracemalloc snapshots of the server, with allocations grouped by the tool or core module that made them.
+"""
+
+import itertools
+import sysconfig
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from pathlib import Path
+
+
+class _Group:
+    __slots__ = ('size', 'count', 'sites')
+
+    def __init__(self):
+        self.size = 0
+        self.count = 0
+        self.sites = {}  # allocation site -> [size, count]
+
+
+class MemorySnapshots:
+    """
+    Tracks allocations with tracemalloc (started with start(), ideally before the tools are
+    imported) and keeps the `keep` most recent numbered snapshots to diff against.
+    Each traced block is attributed to the innermost frame of its traceback that is tool code
+    ('tools.<tool>'), else core code (the backend module), else the library it was allocated in:
+    memory a tool holds through feedparser or requests counts for the tool.
+    """
+
+    def __init__(self, tools_dir: Path, backend_dir: Path, keep: int = 5):
+        self.tools_dir = Path(tools_dir).resolve()
+        self.backend_dir = Path(backend_dir).resolve()
+        self.keep = keep
+        self._stdlib_dir = Path(sysconfig.get_paths()['stdlib']).resolve()
+        self._snapshots = OrderedDict()  # id -> [taken at, traced bytes, snapshot, groups once computed]
+        self._ids = itertools.count(1)
+        self._files = {}  # filename -> (kind, owner, short path)
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 16):
+        """Start tracing with `frames` frames per allocation (deep enough to reach the tool calling a library)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def _file_info(self, filename: str):
+        """(kind, owner, short path) of a source file: kind is 'tool', 'core' or 'library'"""
+        info = self._files.get(filename)
+        if info is not None:
+            return info
+        if filename.startswith('<'):
+            # <frozen importlib._bootstrap>, <string>
+            info = ('library', filename.strip('<>').split()[-1].split('.')[0], filename)
+        else:
+            path = Path(filename).resolve()
+            parts = path.parts
+            packages = [index for index, part in enumerate(parts) if part in ('site-packages', 'dist-packages')]
+            if path.is_relative_to(self.tools_dir):
+                relative = path.relative_to(self.tools_dir)
+                info = ('tool', f"tools.{relative.parts[0]}", f"tools/{relative.as_posix()}")
+            elif path.parent == self.backend_dir:
+                info = ('core', path.stem, path.name)
+            elif packages and packages[-1] + 1 < len(parts):
+                relative = Path(*parts[packages[-1] + 1:])
+                info = ('library', Path(relative.parts[0]).stem, relative.as_posix())
+            elif path.is_relative_to(self._stdlib_dir):
+                relative = path.relative_to(self._stdlib_dir)
+                info = ('library', Path(relative.parts[0]).stem, relative.as_posix())
+            else:
+                info = ('library', path.stem, filename)
+        self._files[filename] = info
+        return info
+
+    def _attribute(self, traceback):
+        """(group, site) of a traceback: the innermost tool frame, else core frame, else the innermost frame"""
+        innermost = traceback[-1]
+        found = {}
+        for frame in reversed(traceback):
+            kind, owner, short = self._file_info(frame.filename)
+            if kind not in found:
+                found[kind] = (owner, short, frame)
+            if kind == 'tool':
+                break
+        owner, short, frame = found['tool' if 'tool' in found else 'core' if 'core' in found else 'library']
+        site = f"{short}:{frame.lineno}"
+        if frame != innermost:
+            site += f" -> {self._file_info(innermost.filename)[2]}:{innermost.lineno}"
+        return owner, site
+
+    def _groups(self, snapshot):
+        groups = {}
+        # Blocks allocated by the same traceback are attributed once
+        for stat in snapshot.statistics('traceback'):
+            owner, site = self._attribute(stat.traceback)
+            group = groups.get(owner)
+            if group is None:
+                group = groups[owner] = _Group()
+            group.size += stat.size
+            group.count += stat.count
+            totals = group.sites.setdefault(site, [0, 0])
+            totals[0] += stat.size
+            totals[1] += stat.count
+        return groups
+
+    def _take(self):
+        snapshot = tracemalloc.take_snapshot()
+        # Leaves out tracemalloc's and this module's own allocations (the groups of kept snapshots)
+        return snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),
+                                       tracemalloc.Filter(False, __file__),
+                                       tracemalloc.Filter(False, '<unknown>')))
+
+    def take(self):
+        """Take and keep a snapshot (dropping the oldest beyond `keep`); returns its id"""
+        snapshot = self._take()
+        traced = tracemalloc.get_traced_memory()[0]
+        with self._lock:
+            snapshot_id = next(self._ids)
+            self._snapshots[snapshot_id] = [time.time(), traced, snapshot, None]
+            while len(self._snapshots) > self.keep:
+                self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def snapshots(self):
+        with self._lock:
+            return [{'id': snapshot_id,
+                     'taken_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(taken_at)),
+                     'traced_kb': round(traced / 1024, 1)}
+                    for snapshot_id, (taken_at, traced, _, _) in self._snapshots.items()]
+
+    def _kept_groups(self, snapshot_id):
+        """Groups of a kept snapshot, computed on first use (grouping is the slow part: it runs traced)"""
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise KeyError(f"No snapshot {snapshot_id} (kept: {', '.join(map(str, self._snapshots)) or 'none'})")
+        if entry[3] is None:
+            entry[3] = self._groups(entry[2])
+        return entry[3]
+
+    def report(self, snapshot_id: int = None, limit: int = 20, sites: int = 5):
+        """Traced memory per group, largest first, with each group's largest allocation sites"""
+        groups = self._kept_groups(snapshot_id) if snapshot_id is not None else self._groups(self._take())
+        ordered = sorted(groups.items(), key=lambda item: item[1].size, reverse=True)[:limit]
+        return [{
+            'group': owner,
+            'size_kb': round(group.size / 1024, 1),
+            'blocks': group.count,
+            'top_sites': [{'site': site, 'size_kb': round(size / 1024, 1), 'blocks': count}
+                          for site, (size, count) in sorted(group.sites.items(),
+                                                            key=lambda item: item[1][0], reverse=True)[:sites]],
+        } for owner, group in ordered]
+
+    def diff(self, base_id: int, snapshot_id: int = None, limit: int = 20, sites: int = 5):
+        """
+        Growth per group from snapshot base_id to snapshot_id (or now), largest growth first,
+        with the sites that grew the most in each group
+        """
+        # Now is taken first, so it does not include the memory used to compare
+        current = self._kept_groups(snapshot_id) if snapshot_id is not None else self._groups(self._take())
+        base = self._kept_groups(base_id)
+        empty = _Group()
+        rows = []
+        for owner in set(base) | set(current):
+            before, after = base.get(owner, empty), current.get(owner, empty)
+            site_growth = []
+            for site in set(before.sites) | set(after.sites):
+                size_before, count_before = before.sites.get(site, (0, 0))
+                size_after, count_after = after.sites.get(site, (0, 0))
+                if size_after != size_before:
+                    site_growth.append((size_after - size_before, count_after - count_before, site))
+            site_growth.sort(reverse=True)
+            rows.append({
+                'group': owner,
+                'size_kb': round(after.size / 1024, 1),
+                'size_diff_kb': round((after.size - before.size) / 1024, 1),
+                'blocks_diff': after.count - before.count,
+                'top_sites': [{'site': site, 'size_diff_kb': round(size / 1024, 1), 'blocks_diff': count}
+                              for size, count, site in site_growth[:sites]],
+            })
+        rows.sort(key=lambda row: row['size_diff_kb'], reverse=True)
+        return rows[:limit]
+
+    def stats(self):
+        """Tracing state, traced memory now and at its peak, and the tracemalloc overhead"""
+        if not tracemalloc.is_tracing():
+            return {'tracing': False}
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            'tracing': True,
+            'frames': tracemalloc.get_traceback_limit(),
+            'traced_kb': round(current / 1024, 1),
+            'peak_kb': round(peak / 1024, 1),
+            'tracemalloc_overhead_kb': round(tracemalloc.get_tracemalloc_memory() / 1024, 1),
+            'snapshots': self.snapshots(),
+        }
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Metadata Cache Module
+On-disk cache of tool metadata, so unchanged tools are not re-executed on restart.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class ToolMetadataCache:
+    """Stores each tool's tool_info and panel list keyed by the fingerprint of its source files"""
+
+    VERSION = 1
+    TRACKED_FILES = ('tool.py', 'api.py', '.env')
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk (a missing or unreadable file means an empty cache)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data.get('tools', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Write the manifest if it changed (atomic replace, safe with several workers)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': self.VERSION, 'tools': self.entries}, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Warning: could not write tool metadata cache {self.path}: {e}")
+
+    def get_tool_info(self, tool_dir: Path):
+        """Return the cached tool_info if none of the tool's tracked files changed, else None"""
+        with self._lock:
+            entry = self.entries.get(tool_dir.name)
+            if entry is None or not self._files_unchanged(tool_dir, entry):
+                return None
+            return entry['tool_info']
+
+    def put_tool_info(self, tool_dir: Path, tool_info):
+        """Record a tool's tool_info with the current fingerprint of its files"""
+        with self._lock:
+            entry = self.entries.get(tool_dir.name, {})
+            entry['files'] = {name: self._fingerprint(tool_dir / name) for name in self.TRACKED_FILES}
+            entry['tool_info'] = tool_info
+            self.entries[tool_dir.name] = entry
+            self._dirty = True
+
+    def get_panels(self, tool_name: str, panels_dir: Path):
+        """Return the cached panel list if the panels directory is unchanged, else None"""
+        with self._lock:
+            entry = self.entries.get(tool_name)
+            if entry is None or 'panels' not in entry:
+                return None
+            return entry['panels'] if entry.get('panels_mtime_ns') == self._dir_mtime(panels_dir) else None
+
+    def put_panels(self, tool_name: str, panels_dir: Path, panels):
+        """Record a tool's panel list with the modification time of its panels directory"""
+        with self._lock:
+            entry = self.entries.setdefault(tool_name, {})
+            entry['panels'] = panels
+            entry['panels_mtime_ns'] = self._dir_mtime(panels_dir)
+            self._dirty = True
+
+    def _files_unchanged(self, tool_dir: Path, entry):
+        cached_files = entry.get('files', {})
+        for name in self.TRACKED_FILES:
+            cached = cached_files.get(name)
+            path = tool_dir / name
+            try:
+                stat = path.stat()
+            except OSError:
+                # Unchanged only if the file was also missing when cached
+                if cached is not None:
+                    return False
+                continue
+            if cached is None:
+                return False
+            if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                continue
+            # mtime moved (checkout, touch): compare content before declaring a change
+            if cached['sha256'] != self._hash(path):
+                return False
+            cached['mtime_ns'] = stat.st_mtime_ns
+            cached['size'] = stat.st_size
+            self._dirty = True
+        return True
+
+    def _fingerprint(self, path: Path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': self._hash(path)}
+
+    @staticmethod
+    def _hash(path: Path):
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    @staticmethod
+    def _dir_mtime(path: Path):
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Metrics Module
+Per-endpoint request metrics for tool APIs, exported in OpenMetrics text format.
+"""
+
+import threading
+from collections import deque
+
+
+def escape_label(value) -> str:
+    """Escape a label value for the OpenMetrics text format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels: dict) -> str:
+    return ','.join(f'{key}="{escape_label(value)}"' for key, value in labels.items())
+
+
+class _RouteStats:
+    """Counters and latency samples of one endpoint"""
+
+    def __init__(self, buckets, reservoir_size):
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.errors = 0
+        self.bytes_out = 0
+        # Most recent durations, used to estimate quantiles
+        self.samples = deque(maxlen=reservoir_size)
+
+
+class RouteMetrics:
+    """Per-endpoint latency histograms with p50/p95/p99, error counts and bytes sent, labelled by tool"""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    QUANTILES = (0.5, 0.95, 0.99)
+    RESERVOIR_SIZE = 1024
+
+    def __init__(self):
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, tool_name, endpoint):
+        key = (tool_name, endpoint)
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = _RouteStats(self.BUCKETS, self.RESERVOIR_SIZE)
+        return stats
+
+    def observe(self, tool_name: str, endpoint: str, duration: float, status: int, bytes_out: int = 0):
+        """Record one handled request"""
+        with self._lock:
+            stats = self._stats(tool_name, endpoint)
+            stats.count += 1
+            stats.total_seconds += duration
+            stats.bytes_out += bytes_out
+            stats.samples.append(duration)
+            if status >= 500:
+                stats.errors += 1
+            for i, bound in enumerate(self.BUCKETS):
+                if duration <= bound:
+                    stats.bucket_counts[i] += 1
+                    break
+
+    def add_bytes(self, tool_name: str, endpoint: str, bytes_out: int):
+        """Add bytes sent after the handler returned (streamed responses)"""
+        with self._lock:
+            self._stats(tool_name, endpoint).bytes_out += bytes_out
+
+    @staticmethod
+    def _quantile(sorted_samples, q):
+        if not sorted_samples:
+            return 0.0
+        index = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+        return sorted_samples[index]
+
+    def snapshot(self):
+        """Per-endpoint summary: count, p50/p95/p99 (seconds), errors and bytes out"""
+        with self._lock:
+            items = [(key, stats, sorted(stats.samples)) for key, stats in self._routes.items()]
+        return [{
+            'tool': tool_name,
+            'endpoint': endpoint,
+            'count': stats.count,
+            'errors': stats.errors,
+            'bytes_out': stats.bytes_out,
+            **{f"p{int(q * 100)}": self._quantile(samples, q) for q in self.QUANTILES},
+        } for (tool_name, endpoint), stats, samples in sorted(items, key=lambda item: item[0])]
+
+    def render(self):
+        """Metric lines (without the final '# EOF') in OpenMetrics text format"""
+        with self._lock:
+            items = sorted(((key, stats, list(stats.bucket_counts), sorted(stats.samples))
+                            for key, stats in self._routes.items()), key=lambda item: item[0])
+
+        duration, latency, errors, sent = [], [], [], []
+        for (tool_name, endpoint), stats, bucket_counts, samples in items:
+            labels = {'tool': tool_name, 'endpoint': endpoint}
+            base = format_labels(labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.BUCKETS, bucket_counts):
+                cumulative += bucket_count
+                duration.append(f'devtools_request_duration_seconds_bucket{{{base},le="{bound}"}} {cumulative}')
+            duration.append(f'devtools_request_duration_seconds_bucket{{{base},le="+Inf"}} {stats.count}')
+            duration.append(f'devtools_request_duration_seconds_count{{{base}}} {stats.count}')
+            duration.append(f'devtools_request_duration_seconds_sum{{{base}}} {stats.total_seconds}')
+            for q in self.QUANTILES:
+                latency.append(f'devtools_request_latency_seconds{{{base},quantile="{q}"}} {self._quantile(samples, q)}')
+            latency.append(f'devtools_request_latency_seconds_count{{{base}}} {len(samples)}')
+            latency.append(f'devtools_request_latency_seconds_sum{{{base}}} {sum(samples)}')
+            errors.append(f'devtools_request_errors_total{{{base}}} {stats.errors}')
+            sent.append(f'devtools_response_bytes_total{{{base}}} {stats.bytes_out}')
+
+        lines = [
+            '# TYPE devtools_request_duration_seconds histogram',
+            '# UNIT devtools_request_duration_seconds seconds',
+            '# HELP devtools_request_duration_seconds Tool endpoint handler latency.',
+            *duration,
+            '# TYPE devtools_request_latency_seconds summary',
+            '# UNIT devtools_request_latency_seconds seconds',
+            f'# HELP devtools_request_latency_seconds Tool endpoint latency quantiles over the last {self.RESERVOIR_SIZE} requests.',
+            *latency,
+            '# TYPE devtools_request_errors counter',
+            '# HELP devtools_request_errors Tool endpoint requests that failed (exception or 5xx status).',
+            *errors,
+            '# TYPE devtools_response_bytes counter',
+            '# UNIT devtools_response_bytes bytes',
+            '# HELP devtools_response_bytes Response body bytes sent by tool endpoints.',
+            *sent,
+        ]
+        return lines
+
+
+def render_openmetrics(*sources) -> str:
+    """Join the metric lines of several sources into one OpenMetrics exposition"""
+    lines = []
+    for source in sources:
+        lines.extend(source.render())
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
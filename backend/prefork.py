@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Prefork Module
+Production serving mode: the master process loads every tool once, then forks worker processes
+that share its memory pages (copy-on-write) and accept connections on one listening socket.
+"""
+
+import gc
+import os
+import signal
+import sys
+import threading
+import time
+from multiprocessing.sharedctypes import RawArray
+
+from werkzeug.serving import make_server
+
+from metrics import format_labels
+
+# Environment handed over to the re-executed master on a graceful reload
+LISTEN_FD_ENV = 'PREFORK_LISTEN_FD'
+OLD_WORKERS_ENV = 'PREFORK_OLD_WORKERS'
+
+
+class WorkerStats:
+    """
+    Per-worker request counters in shared memory, so any worker can report all of them.
+    Each worker only writes its own slot: pid, started, requests, active requests.
+    """
+
+    FIELDS = 4
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._slots = RawArray('d', workers * self.FIELDS)
+        self._slot = None
+        self._lock = threading.Lock()
+
+    def attach(self, slot: int):
+        """Claim a slot for the current (freshly forked) worker process"""
+        self._slot = slot
+        base = slot * self.FIELDS
+        self._slots[base:base + self.FIELDS] = [os.getpid(), time.time(), 0, 0]
+
+    def _add(self, field, amount):
+        with self._lock:
+            self._slots[self._slot * self.FIELDS + field] += amount
+
+    def middleware(self, wsgi_app):
+        """WSGI middleware counting the requests served by this worker"""
+        def counting_app(environ, start_response):
+            self._add(2, 1)
+            self._add(3, 1)
+            try:
+                app_iter = wsgi_app(environ, start_response)
+            except BaseException:
+                self._add(3, -1)
+                raise
+            return _ClosingIterator(app_iter, lambda: self._add(3, -1))
+        return counting_app
+
+    def active(self):
+        """Requests in progress in the current worker"""
+        with self._lock:
+            return int(self._slots[self._slot * self.FIELDS + 3]) if self._slot is not None else 0
+
+    def stats(self):
+        """pid, uptime, served and active requests of every worker"""
+        now = time.time()
+        workers = []
+        for slot in range(self.workers):
+            pid, started, requests, active = self._slots[slot * self.FIELDS:(slot + 1) * self.FIELDS]
+            if not pid:
+                continue
+            workers.append({
+                'worker': slot,
+                'pid': int(pid),
+                'uptime_seconds': round(now - started, 1),
+                'requests': int(requests),
+                'active': int(active),
+                'current': slot == self._slot,
+            })
+        return workers
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        requests, active = [], []
+        for worker in self.stats():
+            labels = format_labels({'worker': str(worker['worker']), 'pid': str(worker['pid'])})
+            requests.append(f'devtools_worker_requests_total{{{labels}}} {worker["requests"]}')
+            active.append(f'devtools_worker_active_requests{{{labels}}} {worker["active"]}')
+        return [
+            '# TYPE devtools_worker_requests counter',
+            '# HELP devtools_worker_requests Requests served by a worker process since it started.',
+            *requests,
+            '# TYPE devtools_worker_active_requests gauge',
+            '# HELP devtools_worker_active_requests Requests in progress in a worker process.',
+            *active,
+        ]
+
+
+class _ClosingIterator:
+    """Response iterable that runs a callback once the server closed it (streams included)"""
+
+    def __init__(self, app_iter, on_close):
+        self._app_iter = app_iter
+        self._on_close = on_close
+
+    def __iter__(self):
+        return iter(self._app_iter)
+
+    def close(self):
+        try:
+            if hasattr(self._app_iter, 'close'):
+                self._app_iter.close()
+        finally:
+            self._on_close()
+
+
+class PreforkServer:
+    """
+    Master/worker server on top of Werkzeug's threaded WSGI server.
+    - SIGTERM / SIGINT: workers finish their requests (up to graceful_timeout) and the master exits
+    - SIGHUP: graceful reload, the master re-executes itself on the same socket (new code and
+      configuration), starts fresh workers, then retires the old ones
+    - a worker that dies is replaced
+    """
+
+    def __init__(self, app, host: str, port: int, workers: int, stats: WorkerStats,
+                 post_fork=None, graceful_timeout: float = 30.0):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.stats = stats
+        self.post_fork = post_fork
+        self.graceful_timeout = graceful_timeout
+        self._children = {}  # pid -> slot
+        self._stopping = False
+        self._reloading = False
+
+    def serve_forever(self):
+        listen_fd = os.environ.pop(LISTEN_FD_ENV, None)
+        old_workers = [int(pid) for pid in os.environ.pop(OLD_WORKERS_ENV, '').split(',') if pid]
+        server = make_server(self.host, self.port, self.app, threaded=True,
+                             fd=int(listen_fd) if listen_fd else None)
+        self.server = server
+
+        # Objects loaded so far are never freed: keep the collector from touching (and copying) their pages
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+
+        print(f"Master {os.getpid()} serving on http://{self.host}:{self.port} with {self.workers} workers")
+        for slot in range(self.workers):
+            self._spawn(slot)
+        # Reloaded master: the previous generation is still running as our children, retire it now
+        for pid in old_workers:
+            self._signal(pid, signal.SIGTERM)
+
+        while not self._stopping:
+            if self._reloading:
+                self._reexec()
+            self._reap(respawn=True)
+            time.sleep(0.5)
+
+        for pid in list(self._children) + old_workers:
+            self._signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self._children and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(0.1)
+        for pid in list(self._children):
+            self._signal(pid, signal.SIGKILL)
+        server.server_close()
+        print(f"Master {os.getpid()} stopped")
+
+    def _on_stop(self, signum, frame):
+        self._stopping = True
+
+    def _on_reload(self, signum, frame):
+        self._reloading = True
+
+    @staticmethod
+    def _signal(pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _spawn(self, slot):
+        pid = os.fork()
+        if pid:
+            self._children[pid] = slot
+            return
+        try:
+            self._run_worker(slot)
+        finally:
+            os._exit(0)
+
+    def _reap(self, respawn):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            slot = self._children.pop(pid, None)
+            if slot is not None and respawn and not self._stopping:
+                print(f"Warning: worker {slot} (pid {pid}) exited with status {status}, restarting it")
+                self._spawn(slot)
+
+    def _reexec(self):
+        """Graceful reload: hand the listening socket and the running workers to a fresh master"""
+        print(f"Master {os.getpid()} reloading")
+        fd = self.server.fileno()
+        os.set_inheritable(fd, True)
+        os.environ[LISTEN_FD_ENV] = str(fd)
+        os.environ[OLD_WORKERS_ENV] = ','.join(str(pid) for pid in self._children)
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    def _run_worker(self, slot):
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: threading.Thread(target=self.server.shutdown, daemon=True).start())
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        self.stats.attach(slot)
+        self.server.app = self.stats.middleware(self.server.app)
+        if self.post_fork:
+            self.post_fork(slot)
+        print(f"Worker {slot} started (pid {os.getpid()})")
+
+        self.server.serve_forever()
+
+        # No new connections are accepted any more: let the requests in progress finish
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.stats.active() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        print(f"Worker {slot} stopped (pid {os.getpid()})")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Sampling Profiler Module
+Continuous low-rate stack sampling of all server threads, aggregated per tool endpoint as collapsed stacks.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+# Innermost frames of threads blocked waiting for work (excluded unless idle samples are requested)
+IDLE_FRAMES = frozenset((
+    'threading:Condition.wait',
+    'threading:Thread._wait_for_tstate_lock',
+    'selectors:_PollLikeSelector.select',
+    'selectors:SelectSelector.select',
+    'selectors:KqueueSelector.select',
+    'concurrent.futures.thread:_worker',
+))
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of every thread of the process `rate` times per second and keeps the
+    counts in one-second buckets for `retention` seconds, so any recent window can be exported.
+    A thread serving a tool request is counted under '<tool>;<endpoint>' with the frames from
+    the tool's view down; other threads under '[<thread name>]'.
+    The sampler's CPU time is measured on every sample: when it would exceed max_overhead
+    (a fraction of one core), the sampling interval is stretched to stay within it.
+    """
+
+    MAX_STACKS_PER_BUCKET = 5000
+
+    def __init__(self, active_requests: dict, rate: float = 100, retention: int = 600, max_overhead: float = 0.02):
+        if rate <= 0:
+            raise ValueError(f"Sampling rate must be positive (samples per second), got {rate}")
+        self.active_requests = active_requests
+        self.interval = 1.0 / rate
+        self.retention = retention
+        self.max_overhead = max_overhead
+        self._buckets = deque()  # (second, Counter of (root, stack, idle))
+        self._labels = {}  # code object -> frame label
+        self._thread_names = {}
+        self._thread_names_at = 0.0
+        self._samples = 0
+        self._cpu_seconds = 0.0
+        self._started = None
+        self._current_interval = self.interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start sampling (in production mode, in every worker: threads do not survive the fork)"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            cpu_start = time.thread_time()
+            self._sample()
+            cpu = time.thread_time() - cpu_start
+            interval = max(self.interval, cpu / self.max_overhead)
+            with self._lock:
+                self._samples += 1
+                self._cpu_seconds += cpu
+                self._current_interval = interval
+            next_sample += interval
+            delay = next_sample - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                # Fell behind (e.g. the process was suspended): samples are not made up
+                next_sample = time.perf_counter()
+
+    def _label(self, frame):
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = (f"{frame.f_globals.get('__name__', '?')}:"
+                                          f"{getattr(code, 'co_qualname', code.co_name)}")
+        return label
+
+    def _collapse(self, frame, stop=None):
+        labels = []
+        while frame is not None and frame is not stop:
+            labels.append(self._label(frame))
+            frame = frame.f_back
+        return labels
+
+    def _thread_name(self, thread_id, now):
+        if now - self._thread_names_at > (1.0 if thread_id in self._thread_names else 0.1):
+            # Numbers are dropped so the threads of a pool share one root
+            self._thread_names = {thread.ident: re.sub(r'\d+', 'N', thread.name) for thread in threading.enumerate()}
+            self._thread_names_at = now
+        return self._thread_names.get(thread_id, 'unknown')
+
+    def _sample(self):
+        own_id = threading.get_ident()
+        now = time.time()
+        samples = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            request = self.active_requests.get(thread_id)
+            if request is not None:
+                tool_name, endpoint, entry_frame = request
+                labels = self._collapse(frame, entry_frame)
+                root = f"{tool_name};{endpoint}"
+            else:
+                labels = self._collapse(frame)
+                root = f"[{self._thread_name(thread_id, now)}]"
+            if labels:
+                samples.append((root, ';'.join(reversed(labels)), labels[0] in IDLE_FRAMES))
+
+        second = int(now)
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != second:
+                self._buckets.append((second, Counter()))
+                while self._buckets and self._buckets[0][0] <= second - self.retention:
+                    self._buckets.popleft()
+            bucket = self._buckets[-1][1]
+            for key in samples:
+                if key in bucket or len(bucket) < self.MAX_STACKS_PER_BUCKET:
+                    bucket[key] += 1
+                else:
+                    bucket[(key[0], '[truncated]', key[2])] += 1
+
+    def profile(self, seconds: float, tool_name: str = None, idle: bool = False):
+        """Counts of (root, stack) over the last `seconds` seconds"""
+        since = time.time() - seconds
+        totals = Counter()
+        with self._lock:
+            buckets = [counts for second, counts in self._buckets if second >= since]
+            for counts in buckets:
+                for (root, stack, is_idle), count in counts.items():
+                    if is_idle and not idle:
+                        continue
+                    if tool_name and not root.startswith(f"{tool_name};"):
+                        continue
+                    totals[(root, stack)] += count
+        return totals
+
+    def collapsed(self, seconds: float, tool_name: str = None, idle: bool = False):
+        """The window as collapsed stack lines ('<root>;<frames> <samples>'), for flamegraph.pl or speedscope"""
+        totals = self.profile(seconds, tool_name, idle)
+        return ''.join(f"{root};{stack} {count}\n" for (root, stack), count in sorted(totals.items()))
+
+    def endpoints(self, seconds: float, idle: bool = False):
+        """Samples per root (tool endpoint or thread) over the window, most sampled first"""
+        totals = Counter()
+        for (root, _), count in self.profile(seconds, idle=idle).items():
+            totals[root] += count
+        return [{'root': root, 'samples': count} for root, count in totals.most_common()]
+
+    def stats(self):
+        """Rate, samples taken and the sampler's CPU time as a fraction of the time it has been running"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started if self._started is not None else 0.0
+            return {
+                'running': self.running,
+                'rate': round(1.0 / self.interval, 1),
+                'effective_rate': round(1.0 / self._current_interval, 1),
+                'retention_seconds': self.retention,
+                'samples': self._samples,
+                'sampler_cpu_seconds': round(self._cpu_seconds, 6),
+                'overhead': round(self._cpu_seconds / elapsed, 6) if elapsed else 0.0,
+                'max_overhead': self.max_overhead,
+            }
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        stats = self.stats()
+        return [
+            '# TYPE devtools_profiler_samples counter',
+            '# HELP devtools_profiler_samples Stack samples taken by the sampling profiler (all threads each).',
+            f'devtools_profiler_samples_total {stats["samples"]}',
+            '# TYPE devtools_profiler_cpu_seconds counter',
+            '# UNIT devtools_profiler_cpu_seconds seconds',
+            '# HELP devtools_profiler_cpu_seconds CPU time spent by the sampling profiler thread.',
+            f'devtools_profiler_cpu_seconds_total {stats["sampler_cpu_seconds"]}',
+            '# TYPE devtools_profiler_rate gauge',
+            '# HELP devtools_profiler_rate Current sampling rate per second (below the configured one to bound the overhead).',
+            f'devtools_profiler_rate {stats["effective_rate"]}',
+        ]
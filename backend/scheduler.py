@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Scheduler Module
+Runs periodic background jobs registered by tools (cache refreshes, prefetching, sampling).
+"""
+
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import format_labels
+
+
+class _Job:
+    """A periodic job and its run statistics"""
+
+    def __init__(self, name, func, interval, jitter):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.running = False
+        self.runs = 0
+        self.errors = 0
+        self.skipped = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_seconds = None
+        self.last_run = None
+        self.last_error = None
+
+
+class JobScheduler:
+    """
+    Runs each job every `interval` seconds on a bounded worker pool.
+    - jitter: each delay is randomized by +/- jitter * interval so jobs do not fire in lockstep
+    - overlap protection: a job still running when it is due again is skipped for that round
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._jobs = {}
+        self._queue = []
+        self._condition = threading.Condition()
+        self._executor = None
+        self._thread = None
+        self._stopped = False
+
+    def add_job(self, name: str, func, interval: float, jitter: float = 0.1, initial_delay: float = None):
+        """
+        Register func to run every interval seconds. The first run happens after initial_delay
+        (default: a random fraction of the interval, to spread startup load).
+        """
+        with self._condition:
+            if name in self._jobs:
+                raise ValueError(f"Job {name} is already scheduled")
+            job = self._jobs[name] = _Job(name, func, interval, jitter)
+            if initial_delay is None:
+                initial_delay = random.uniform(0, interval * max(jitter, 0.1))
+            heapq.heappush(self._queue, (time.monotonic() + initial_delay, id(job), job))
+            self._condition.notify()
+        return job
+
+    def remove_job(self, name: str):
+        with self._condition:
+            # Its queue entry is dropped when it comes due
+            return self._jobs.pop(name, None) is not None
+
+    def start(self):
+        """Start the scheduler thread (idempotent)"""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scheduler')
+            self._thread = threading.Thread(target=self._run, name='job-scheduler', daemon=True)
+            self._thread.start()
+        print(f"Job scheduler started ({self.max_workers} workers)")
+
+    def stop(self, wait: bool = False):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._queue or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                if self._jobs.get(job.name) is not job:
+                    continue
+                delay = job.interval + random.uniform(-job.jitter, job.jitter) * job.interval
+                heapq.heappush(self._queue, (time.monotonic() + max(delay, 0.0), id(job), job))
+                if job.running:
+                    job.skipped += 1
+                    continue
+                job.running = True
+                executor = self._executor
+            executor.submit(self._execute, job)
+
+    def _execute(self, job):
+        start = time.perf_counter()
+        error = None
+        try:
+            job.func()
+        except Exception as e:
+            error = e
+            print(f"Warning: scheduled job {job.name} failed: {e}")
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._condition:
+                job.running = False
+                job.runs += 1
+                job.total_seconds += elapsed
+                job.max_seconds = max(job.max_seconds, elapsed)
+                job.last_seconds = elapsed
+                job.last_run = time.time()
+                if error is not None:
+                    job.errors += 1
+                    job.last_error = str(error)
+
+    def stats(self):
+        """Per-job interval, run counts and run-time statistics"""
+        with self._condition:
+            jobs = sorted(self._jobs.values(), key=lambda job: job.name)
+            return [{
+                'name': job.name,
+                'interval': job.interval,
+                'running': job.running,
+                'runs': job.runs,
+                'errors': job.errors,
+                'skipped': job.skipped,
+                'avg_ms': round(job.total_seconds / job.runs * 1000, 2) if job.runs else None,
+                'max_ms': round(job.max_seconds * 1000, 2),
+                'last_ms': round(job.last_seconds * 1000, 2) if job.last_seconds is not None else None,
+                'last_run': job.last_run,
+                'last_error': job.last_error,
+            } for job in jobs]
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        runs, errors, skipped, duration = [], [], [], []
+        with self._condition:
+            jobs = sorted(((job.name, job.runs, job.errors, job.skipped, job.total_seconds)
+                           for job in self._jobs.values()))
+        for name, job_runs, job_errors, job_skipped, total_seconds in jobs:
+            labels = format_labels({'job': name})
+            runs.append(f'devtools_job_runs_total{{{labels}}} {job_runs}')
+            errors.append(f'devtools_job_errors_total{{{labels}}} {job_errors}')
+            skipped.append(f'devtools_job_skipped_total{{{labels}}} {job_skipped}')
+            duration.append(f'devtools_job_duration_seconds_total{{{labels}}} {total_seconds}')
+        return [
+            '# TYPE devtools_job_runs counter',
+            '# HELP devtools_job_runs Completed runs of scheduled background jobs.',
+            *runs,
+            '# TYPE devtools_job_errors counter',
+            '# HELP devtools_job_errors Scheduled job runs that raised.',
+            *errors,
+            '# TYPE devtools_job_skipped counter',
+            '# HELP devtools_job_skipped Runs skipped because the previous run of the job was still going.',
+            *skipped,
+            '# TYPE devtools_job_duration_seconds counter',
+            '# UNIT devtools_job_duration_seconds seconds',
+            '# HELP devtools_job_duration_seconds Time spent running scheduled jobs.',
+            *duration,
+        ]
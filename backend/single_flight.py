@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Single Flight Module
+Coalesces identical concurrent calls: one caller computes, the others wait for its result.
+"""
+
+import threading
+
+from metrics import format_labels
+
+
+class _Call:
+    """One in-flight computation and the callers waiting for it"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time. Callers arriving while a computation for
+    their key is in flight receive its result (or its exception) instead of computing again.
+    Nothing is kept once the computation finished: the next caller computes afresh.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        # (tool, endpoint) -> [computations, shared results]
+        self._stats = {}
+
+    def do(self, key, compute, tool_name: str = '', endpoint: str = ''):
+        """Return (result, shared): shared is True if the result came from another caller's computation"""
+        with self._lock:
+            stats = self._stats.setdefault((tool_name, endpoint), [0, 0])
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                stats[0] += 1
+            else:
+                stats[1] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = compute()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        """Per-endpoint computations and requests answered with a shared result"""
+        with self._lock:
+            items = sorted(self._stats.items())
+        return [{'tool': tool_name, 'endpoint': endpoint, 'computations': computations, 'shared': shared}
+                for (tool_name, endpoint), (computations, shared) in items]
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        computations, shared = [], []
+        for stats in self.stats():
+            labels = format_labels({'tool': stats['tool'], 'endpoint': stats['endpoint']})
+            computations.append(f'devtools_coalesced_computations_total{{{labels}}} {stats["computations"]}')
+            shared.append(f'devtools_coalesced_shared_total{{{labels}}} {stats["shared"]}')
+        return [
+            '# TYPE devtools_coalesced_computations counter',
+            '# HELP devtools_coalesced_computations Requests to coalesced endpoints that ran the handler.',
+            *computations,
+            '# TYPE devtools_coalesced_shared counter',
+            '# HELP devtools_coalesced_shared Requests answered with the result of an identical in-flight request.',
+            *shared,
+        ]
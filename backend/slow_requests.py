@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Slow Requests Module
+Samples the stack of tool requests running past a threshold and keeps the slowest as collapsed stacks.
+"""
+
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from urllib.parse import urlsplit
+
+from metrics import format_labels
+
+# Request being handled in this context (request thread, and the async tasks it starts)
+_current = contextvars.ContextVar('slow_request', default=None)
+
+
+def frame_label(frame) -> str:
+    """'<module>:<qualified function name>', the frame name used in collapsed stacks"""
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def collapse_stack(frame, stop=None):
+    """
+    Stack of frame as 'outermost;...;innermost' (the collapsed format flamegraph.pl and speedscope
+    read). With stop, only the frames called by stop are kept; None if stop is not on the stack.
+    """
+    labels = []
+    while frame is not None and frame is not stop:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    if stop is not None and frame is None:
+        return None
+    return ';'.join(reversed(labels))
+
+
+class _ActiveRequest:
+    """A tool request in progress and the samples taken of its thread"""
+
+    __slots__ = ('tool_name', 'endpoint', 'method', 'route', 'path', 'thread_id', 'frame', 'started',
+                 'started_at', 'stacks', 'samples', 'upstream')
+
+    def __init__(self, tool_name, endpoint, method, route, path, frame):
+        self.tool_name = tool_name
+        self.endpoint = endpoint
+        self.method = method
+        self.route = route
+        self.path = path
+        self.thread_id = threading.get_ident()
+        self.frame = frame
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.stacks = Counter()
+        self.samples = 0
+        self.upstream = []
+
+
+class SlowRequestMonitor:
+    """
+    Watches tool requests from one sampler thread. Once a request has run for threshold
+    seconds, its thread's stack is sampled every interval seconds (sys._current_frames) until
+    it returns; if it took at least threshold seconds, its collapsed stacks, route and
+    upstream calls are kept (the `keep` most recent). Requests faster than the threshold
+    cost a dict insert and removal; the sampler sleeps while no request is past it.
+    Async handlers are sampled on the request thread, which waits for the event loop.
+    """
+
+    MAX_UPSTREAM_CALLS = 100
+
+    def __init__(self, threshold: float = 1.0, interval: float = 0.005, keep: int = 50, max_samples: int = 2000):
+        self.threshold = threshold
+        self.interval = interval
+        self.max_samples = max_samples
+        self.enabled = threshold > 0
+        self._active = {}  # id(request) -> _ActiveRequest
+        self._recent = deque(maxlen=keep)
+        self._counts = {}  # (tool, endpoint) -> slow requests
+        self._sampler_seconds = 0.0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+        self._pid = None
+
+    def begin(self, tool_name: str, endpoint: str, method: str, route: str, path: str):
+        """Start watching the calling request; returns the token for end(), or None when disabled"""
+        if not self.enabled:
+            return None
+        # Samples are cut at the caller's frame, so the server's own frames are left out
+        active = _ActiveRequest(tool_name, endpoint, method, route, path, sys._getframe(1))
+        token = _current.set(active)
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                # Started on first use, and again in a forked worker process
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._sample_loop, name='slow-requests', daemon=True)
+                self._thread.start()
+            self._active[id(active)] = active
+            self._wakeup.notify()
+        return token
+
+    def end(self, token, status: int):
+        """Stop watching the request begin() returned token for; keeps it if it was slow"""
+        if token is None:
+            return
+        active = _current.get()
+        _current.reset(token)
+        duration = time.perf_counter() - active.started
+        with self._lock:
+            self._active.pop(id(active), None)
+            active.frame = None
+            if duration < self.threshold:
+                return
+            key = (active.tool_name, active.endpoint)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._recent.append({
+                'tool': active.tool_name,
+                'endpoint': active.endpoint,
+                'method': active.method,
+                'route': active.route,
+                'path': active.path,
+                'status': status,
+                'duration_ms': round(duration * 1000, 1),
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(active.started_at)),
+                'samples': active.samples,
+                'stacks': [{'stack': stack, 'count': count} for stack, count in active.stacks.most_common()],
+                'upstream': list(active.upstream),
+            })
+
+    def record_upstream(self, method: str, url: str, seconds: float, status):
+        """HttpClient observer: note an outbound call made by the current request"""
+        active = _current.get()
+        if active is None or len(active.upstream) >= self.MAX_UPSTREAM_CALLS:
+            return
+        # The query string is dropped: it may carry API keys
+        parts = urlsplit(url)
+        active.upstream.append({'method': method, 'url': f"{parts.scheme}://{parts.netloc}{parts.path}",
+                                'status': status, 'ms': round(seconds * 1000, 1),
+                                'at_ms': round((time.perf_counter() - active.started - seconds) * 1000, 1)})
+
+    def _sample_loop(self):
+        while True:
+            with self._lock:
+                now = time.perf_counter()
+                due, waits = [], []
+                for active in self._active.values():
+                    if active.samples >= self.max_samples:
+                        continue
+                    remaining = self.threshold - (now - active.started)
+                    if remaining <= 0:
+                        due.append(active)
+                    else:
+                        waits.append(remaining)
+                if not due:
+                    self._wakeup.wait(min(waits) if waits else None)
+                    continue
+
+            cpu_start = time.thread_time()
+            frames = sys._current_frames()
+            stacks = [(active, collapse_stack(frames.get(active.thread_id), active.frame)) for active in due]
+            del frames
+            with self._lock:
+                for active, stack in stacks:
+                    # A request that ended meanwhile is skipped: its thread may be serving another one
+                    if stack and id(active) in self._active:
+                        active.stacks[stack] += 1
+                        active.samples += 1
+                self._sampler_seconds += time.thread_time() - cpu_start
+            time.sleep(self.interval)
+
+    def recent(self, tool_name: str = None):
+        """Kept slow requests, most recent first"""
+        with self._lock:
+            entries = list(self._recent)
+        return [entry for entry in reversed(entries) if tool_name is None or entry['tool'] == tool_name]
+
+    def collapsed(self, tool_name: str = None):
+        """Samples of the kept slow requests as collapsed stack lines, rooted at '<tool>;<endpoint>'"""
+        totals = Counter()
+        for entry in self.recent(tool_name):
+            for stack in entry['stacks']:
+                totals[f"{entry['tool']};{entry['endpoint']};{stack['stack']}"] += stack['count']
+        return ''.join(f"{stack} {count}\n" for stack, count in sorted(totals.items()))
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+    def stats(self):
+        """Settings, sampler CPU time and slow request counts per endpoint"""
+        with self._lock:
+            counts = sorted(self._counts.items())
+            return {
+                'enabled': self.enabled,
+                'threshold_ms': round(self.threshold * 1000, 1),
+                'interval_ms': round(self.interval * 1000, 1),
+                'watching': len(self._active),
+                'sampler_cpu_ms': round(self._sampler_seconds * 1000, 1),
+                'counts': [{'tool': tool_name, 'endpoint': endpoint, 'slow': count}
+                           for (tool_name, endpoint), count in counts],
+            }
+
+    def render(self):
+        """Metric lines in OpenMetrics text format"""
+        stats = self.stats()
+        lines = [f'devtools_slow_requests_total{{{format_labels({"tool": count["tool"], "endpoint": count["endpoint"]})}}} '
+                 f'{count["slow"]}' for count in stats['counts']]
+        return [
+            '# TYPE devtools_slow_requests counter',
+            '# HELP devtools_slow_requests Tool requests that ran past the slow request threshold.',
+            *lines,
+            '# TYPE devtools_slow_request_sampler_cpu_seconds counter',
+            '# UNIT devtools_slow_request_sampler_cpu_seconds seconds',
+            '# HELP devtools_slow_request_sampler_cpu_seconds CPU time spent sampling the stacks of slow requests.',
+            f'devtools_slow_request_sampler_cpu_seconds_total {round(stats["sampler_cpu_ms"] / 1000, 6)}',
+        ]
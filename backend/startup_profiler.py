@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler Module
+Records how long each tool loading phase takes and which third-party modules it imports.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class StartupProfiler:
+    """Collects per-tool phase timings and the third-party imports each phase pulled in"""
+
+    PHASES = ('validate_tool', 'load_env', 'exec_tool', 'exec_api', 'register_apis')
+    PHASE_LABELS = {
+        'validate_tool': 'validate',
+        'load_env': '.env',
+        'exec_tool': 'tool.py',
+        'exec_api': 'api.py',
+        'register_apis': 'register',
+    }
+
+    def __init__(self):
+        self.tools = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, tool_name: str, phase: str):
+        """
+        Time a loading phase of a tool.
+        Nested phases are reported separately: their time and imports are not counted in the parent.
+        """
+        frame = {'start': time.perf_counter(), 'modules': set(sys.modules), 'child_time': 0.0, 'claimed': set()}
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame['start']
+            new_modules = set(sys.modules) - frame['modules']
+            if self._stack:
+                self._stack[-1]['child_time'] += elapsed
+                self._stack[-1]['claimed'] |= new_modules
+
+            record = self.tools.setdefault(tool_name, {'phases': {}, 'modules': {}})
+            record['phases'][phase] = record['phases'].get(phase, 0.0) + elapsed - frame['child_time']
+            record['modules'].setdefault(phase, set()).update(new_modules - frame['claimed'])
+
+    @staticmethod
+    def third_party(modules):
+        """Top-level package names of the given modules that were installed from site-packages"""
+        packages = set()
+        for name in modules:
+            module_file = getattr(sys.modules.get(name), '__file__', None) or ''
+            if 'site-packages' in module_file or 'dist-packages' in module_file:
+                packages.add(name.split('.')[0])
+        return sorted(packages)
+
+    def to_dict(self):
+        """Profile as a JSON-serializable dict, tools sorted by total time (slowest first)"""
+        tools = {}
+        for tool_name, record in self.tools.items():
+            tools[tool_name] = {
+                'total_ms': round(sum(record['phases'].values()) * 1000, 2),
+                'phases_ms': {phase: round(seconds * 1000, 2) for phase, seconds in record['phases'].items()},
+                'third_party_imports': {phase: self.third_party(modules)
+                                        for phase, modules in record['modules'].items()
+                                        if self.third_party(modules)},
+                'modules_loaded': sum(len(modules) for modules in record['modules'].values()),
+            }
+        ordered = dict(sorted(tools.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'total_ms': round(sum(tool['total_ms'] for tool in ordered.values()), 2),
+            'tools': ordered,
+        }
+
+    def format_table(self):
+        """Profile as a plain-text table, slowest tool first"""
+        profile = self.to_dict()
+        name_width = max([len('Tool')] + [len(name) for name in profile['tools']])
+        header = f"{'Tool':<{name_width}}  {'total ms':>9}" + ''.join(
+            f"  {self.PHASE_LABELS[phase]:>9}" for phase in self.PHASES) + "  third-party imports"
+        lines = [header, '-' * len(header)]
+        for tool_name, tool in profile['tools'].items():
+            packages = sorted({pkg for pkgs in tool['third_party_imports'].values() for pkg in pkgs})
+            lines.append(f"{tool_name:<{name_width}}  {tool['total_ms']:>9.1f}" + ''.join(
+                f"  {tool['phases_ms'].get(phase, 0.0):>9.1f}" for phase in self.PHASES) +
+                f"  {', '.join(packages) or '-'}")
+        lines.append('-' * len(header))
+        lines.append(f"{'Total':<{name_width}}  {profile['total_ms']:>9.1f}")
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        """Write the profile to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
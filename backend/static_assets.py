@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Static Assets Module
+Precompressed (.br / .gz) static files served with sendfile, and immutable caching for content-versioned URLs.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+
+from flask import abort, request, send_file
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Encodings in order of preference, with the suffix of their precompressed variant
+PRECOMPRESSED_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# Text files worth compressing (images and fonts are compressed already)
+COMPRESSIBLE_SUFFIXES = ('.js', '.css', '.html', '.json', '.svg', '.md', '.txt', '.map', '.ico')
+
+
+def precompress_static(static_dir: Path, min_size: int = 256, gzip_level: int = 9, brotli_quality: int = 11):
+    """
+    Write <file>.gz (and <file>.br when brotli is installed) next to every compressible file.
+    A variant gets the mtime of its original, which is how the server knows it is current;
+    variants already current are skipped, and variants no smaller than the original are not kept.
+    Returns counts of written, current and skipped variants.
+    """
+    encoders = [(suffix, encode) for _, suffix, encode in _encoders(gzip_level, brotli_quality)]
+    counts = {'written': 0, 'current': 0, 'skipped': 0, 'original_bytes': 0, 'compressed_bytes': 0}
+    for path in sorted(Path(static_dir).rglob('*')):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        stat = path.stat()
+        data = None
+        for suffix, encode in encoders:
+            variant = path.with_name(path.name + suffix)
+            if _is_current(variant, stat):
+                counts['current'] += 1
+                continue
+            if data is None:
+                data = path.read_bytes()
+            compressed = encode(data) if len(data) >= min_size else data
+            if len(compressed) >= len(data):
+                variant.unlink(missing_ok=True)
+                counts['skipped'] += 1
+                continue
+            variant.write_bytes(compressed)
+            os.utime(variant, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            counts['written'] += 1
+            counts['original_bytes'] += len(data)
+            counts['compressed_bytes'] += len(compressed)
+    return counts
+
+
+def compress_variants(data: bytes, min_size: int = 256, gzip_level: int = 9, brotli_quality: int = 11):
+    """
+    Compress data in memory with every available encoding: {encoding: bytes}.
+    Variants no smaller than data (or all of them, below min_size) are left out.
+    """
+    if len(data) < min_size:
+        return {}
+    variants = {}
+    for encoding, _, encode in _encoders(gzip_level, brotli_quality):
+        compressed = encode(data)
+        if len(compressed) < len(data):
+            variants[encoding] = compressed
+    return variants
+
+
+def _encoders(gzip_level, brotli_quality):
+    """(encoding, suffix, encode) of PRECOMPRESSED_ENCODINGS, brotli only when installed"""
+    encode = {'br': lambda data: brotli.compress(data, quality=brotli_quality),
+              'gzip': lambda data: gzip.compress(data, compresslevel=gzip_level, mtime=0)}
+    return [(encoding, suffix, encode[encoding]) for encoding, suffix in PRECOMPRESSED_ENCODINGS
+            if encoding != 'br' or brotli is not None]
+
+
+def _is_current(variant: Path, stat):
+    try:
+        return variant.stat().st_mtime_ns == stat.st_mtime_ns
+    except OSError:
+        return False
+
+
+class StaticAssets:
+    """
+    Replacement for Flask's static file view.
+    - a precompressed variant the client accepts is sent instead of the file (when it is current)
+    - url_for('static', ...) adds ?v=<content hash>; a request carrying the file's current hash
+      is cached as immutable for a year, other requests revalidate with the ETag
+    Files are sent with send_file, i.e. through the server's wsgi.file_wrapper (sendfile) or,
+    with USE_X_SENDFILE, by the fronting proxy.
+    """
+
+    def __init__(self, static_dir: Path, max_age: int = 31536000):
+        self.static_dir = Path(static_dir)
+        self.max_age = max_age
+        self._file_hashes = {}
+
+    def init_app(self, app):
+        app.view_functions['static'] = self.send_static_file
+        app.url_defaults(self._add_version)
+
+    def _add_version(self, endpoint, values):
+        if endpoint == 'static' and 'v' not in values:
+            file_hash = self.file_hash(values.get('filename', ''))
+            if file_hash:
+                values['v'] = file_hash
+
+    def file_hash(self, filename: str):
+        """Short content hash of a static file, reused while its mtime and size are unchanged"""
+        path = safe_join(str(self.static_dir), filename)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            return None
+        if stat is None:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_hashes.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        with open(path, 'rb') as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()[:12]
+        self._file_hashes[path] = (key, file_hash)
+        return file_hash
+
+    def send_static_file(self, filename):
+        path = safe_join(str(self.static_dir), filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        sent_path, encoding = path, None
+        if Path(path).suffix in COMPRESSIBLE_SUFFIXES:
+            stat = os.stat(path)
+            for candidate, suffix in PRECOMPRESSED_ENCODINGS:
+                variant = Path(path + suffix)
+                if request.accept_encodings.quality(candidate) > 0 and _is_current(variant, stat):
+                    sent_path, encoding = str(variant), candidate
+                    break
+
+        response = send_file(sent_path, mimetype=mimetype, download_name=os.path.basename(path),
+                             conditional=True, max_age=None)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if Path(path).suffix in COMPRESSIBLE_SUFFIXES:
+            response.vary.add('Accept-Encoding')
+
+        version = request.args.get('v')
+        if version and version == self.file_hash(filename):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = self.max_age
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
@@ -0,0 +1,63 @@
+"""Tests of async def tool routes, run on the shared event loop through the request bridge"""
+
+import textwrap
+
+import pytest
+from flask import Flask
+
+from tool_manager import ToolManager
+
+TOOL_PY = '''
+def get_tool_info():
+    return {'name': 'tool-async', 'description': 'test tool', 'category': 'test', 'icon': 'x'}
+'''
+
+API_PY = '''
+import asyncio
+import threading
+from flask import abort, jsonify, request
+
+def register_apis(app, base_path, services=None):
+    @app.route(f'{base_path}/echo', methods=['POST'])
+    async def echo():
+        await asyncio.sleep(0)
+        return jsonify({'success': True, 'path': request.path, 'city': request.args.get('city'),
+                        'body': request.get_json(), 'thread': threading.current_thread().name,
+                        'same_loop': asyncio.get_running_loop() is services.loop.get_loop()})
+
+    @app.route(f'{base_path}/missing')
+    async def missing():
+        await asyncio.sleep(0)
+        abort(404)
+
+    @app.route(f'{base_path}/fails')
+    async def fails():
+        raise RuntimeError('upstream exploded')
+'''
+
+
+@pytest.fixture
+def app(tmp_path):
+    tool_dir = tmp_path / 'tools' / 'tool-async'
+    tool_dir.mkdir(parents=True)
+    (tool_dir / 'tool.py').write_text(textwrap.dedent(TOOL_PY))
+    (tool_dir / 'api.py').write_text(textwrap.dedent(API_PY))
+    app = Flask(__name__)
+    ToolManager(tmp_path / 'tools', app)
+    return app
+
+
+def test_request_is_available_inside_the_coroutine(app):
+    response = app.test_client().post('/api/tool-async/echo?city=Paris', json={'n': 1})
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'path': '/api/tool-async/echo', 'city': 'Paris',
+                                   'body': {'n': 1}, 'thread': 'async-loop', 'same_loop': True}
+
+
+def test_http_exceptions_raised_in_the_coroutine(app):
+    assert app.test_client().get('/api/tool-async/missing').status_code == 404
+
+
+def test_errors_raised_in_the_coroutine(app):
+    app.testing = False
+    assert app.test_client().get('/api/tool-async/fails').status_code == 500
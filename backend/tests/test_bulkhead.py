@@ -0,0 +1,73 @@
+"""Tests of the process bulkhead: timeouts, and recovery from a pool process that died"""
+
+import os
+import signal
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from bulkhead import BulkheadFull, BulkheadTimeout, ProcessBulkhead
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='the pool processes are forked')
+
+
+def _started(**kwargs):
+    bulkhead = ProcessBulkhead(workers=2, max_queue=2, timeout=5, **kwargs)
+    bulkhead.register('sleep', time.sleep)
+    bulkhead.register('pid', os.getpid)
+    bulkhead.start()
+    return bulkhead
+
+
+def _call_after_recovery(bulkhead, name, attempts=20):
+    """The call that notices a dead process fails with it; the ones after must succeed"""
+    for _ in range(attempts):
+        try:
+            return bulkhead.call(name)
+        except (BrokenProcessPool, BulkheadFull):
+            time.sleep(0.1)
+    return bulkhead.call(name)
+
+
+def test_call_after_a_timeout_succeeds():
+    bulkhead = _started()
+    try:
+        with pytest.raises(BulkheadTimeout):
+            bulkhead.call('sleep', 2, timeout=0.3)
+        assert bulkhead.call('pid') != os.getpid()
+        assert bulkhead.stats()['running'] is True
+    finally:
+        bulkhead.stop()
+
+
+def test_pool_is_forked_again_after_a_process_died():
+    bulkhead = _started()
+    try:
+        os.kill(bulkhead.call('pid'), signal.SIGKILL)
+        assert _call_after_recovery(bulkhead, 'pid') != os.getpid()
+        assert bulkhead.stats()['broken'] is False
+    finally:
+        bulkhead.stop()
+
+
+def test_overrunning_call_is_killed_with_an_on_broken_handler():
+    retired = []
+    bulkhead = _started(on_broken=lambda: retired.append(True))
+    try:
+        with pytest.raises(BulkheadTimeout):
+            bulkhead.call('sleep', 30, timeout=0.3)
+        assert retired == [True]
+        with pytest.raises(BulkheadFull, match='broken'):
+            bulkhead.call('pid')
+    finally:
+        bulkhead.stop()
+
+
+def test_registering_after_start_raises():
+    bulkhead = _started()
+    try:
+        with pytest.raises(RuntimeError):
+            bulkhead.register('late', print)
+    finally:
+        bulkhead.stop()
@@ -0,0 +1,77 @@
+"""Tests of lazy tool activation: routes added while other requests are routed"""
+
+import textwrap
+import threading
+import time
+
+from flask import Flask
+
+from tool_manager import ToolManager
+
+TOOL_PY = '''
+def get_tool_info():
+    return {{'name': '{name}', 'description': 'test tool', 'category': 'test', 'icon': 'x'}}
+'''
+
+API_PY = '''
+import time
+from flask import jsonify
+
+def register_apis(app, base_path):
+    for i in range(20):
+        def view():
+            return jsonify({{'success': True}})
+        view.__name__ = f'r{{i}}'
+        app.route(f'{{base_path}}/r{{i}}')(view)
+        # Half of the routes are registered while the tool waits
+        if i == 9:
+            time.sleep({delay})
+    @app.route(f'{{base_path}}/ping')
+    def ping():
+        return jsonify({{'success': True, 'tool': '{name}'}})
+'''
+
+
+def _tool_manager(tmp_path, delays):
+    tools_dir = tmp_path / 'tools'
+    for name, delay in delays.items():
+        tool_dir = tools_dir / name
+        tool_dir.mkdir(parents=True)
+        (tool_dir / 'tool.py').write_text(textwrap.dedent(TOOL_PY.format(name=name)))
+        (tool_dir / 'api.py').write_text(textwrap.dedent(API_PY.format(name=name, delay=delay)))
+    app = Flask(__name__)
+    return app, ToolManager(tools_dir, app, lazy=True)
+
+
+def test_requests_routed_during_an_activation(tmp_path):
+    app, tool_manager = _tool_manager(tmp_path, {'tool-fast': 0, 'tool-slow': 0.3})
+    client = app.test_client()
+    assert client.get('/api/tool-fast/ping').get_json() == {'success': True, 'tool': 'tool-fast'}
+    assert 'tool-slow' in tool_manager.pending_tools
+
+    activation = threading.Thread(target=lambda: app.test_client().get('/api/tool-slow/ping'))
+    activation.start()
+    while 'tool-slow.r0' not in app.view_functions:
+        time.sleep(0.01)
+    # Routed only once the activation halfway through its routes is over
+    assert client.get('/api/tool-fast/ping').status_code == 200
+    assert 'tool-slow' not in tool_manager.pending_tools
+    activation.join()
+    assert client.get('/api/tool-slow/r19').status_code == 200
+
+
+def test_concurrent_activations_of_one_tool(tmp_path):
+    app, tool_manager = _tool_manager(tmp_path, {'tool-slow': 0.2})
+    results = []
+    def request():
+        results.append(app.test_client().get('/api/tool-slow/ping').status_code)
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [200] * 4
+    assert list(tool_manager.activation_times) == ['tool-slow']
+    # Setup checks are back in force once activation is over
+    assert '_check_setup_finished' not in vars(app)
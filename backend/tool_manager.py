@@ -4,24 +4,109 @@ Tool Manager Module
 Handles tool discovery and API registration for the Dev Tools App.
 """
 
+import ast
+import functools
+import hashlib
+import importlib
 import importlib.util
+import inspect
+import json
+import sys
+import threading
+import time
 from pathlib import Path
-from flask import Flask
+from flask import Flask, jsonify, request
 from dotenv import load_dotenv
+from werkzeug.exceptions import HTTPException
+from admission import AdmissionController, Shed
+from async_runtime import AsyncHttpClient, AsyncLoop
+from bulkhead import ISOLATED_ENVIRON_KEY, BulkheadFull, BulkheadTimeout, ProcessBulkhead
+from bundler import ToolBundler
+from cache_service import CacheRegistry
+from conditional import conditional_get
+from event_hub import EventHub
+from file_watcher import FileWatcher
+from http_client import HttpClient
+from metadata_cache import ToolMetadataCache
+from metrics import RouteMetrics
+from scheduler import JobScheduler
+from single_flight import SingleFlight
+from slow_requests import SlowRequestMonitor
+from startup_profiler import StartupProfiler
+from tool_services import ToolServices
+from warmup import WarmupRunner
 
 
 class ToolManager:
     """Manages tool discovery and API registration"""
 
-    def __init__(self, tools_dir: Path, app: Flask):
+    def __init__(self, tools_dir: Path, app: Flask, static_tools_dir: Path = None, bundle_imports: bool = False,
+                 lazy: bool = False, metadata_cache_path: Path = None, profiler: StartupProfiler = None,
+                 http_client: HttpClient = None, cache_registry: CacheRegistry = None,
+                 scheduler: JobScheduler = None, event_hub: EventHub = None, bulkhead: ProcessBulkhead = None,
+                 async_loop: AsyncLoop = None, async_http_client: AsyncHttpClient = None,
+                 admission: AdmissionController = None, slow_requests: SlowRequestMonitor = None):
         self.tools = {}
+        self.tool_panels = {}
         self.tools_dir = tools_dir
+        self.static_tools_dir = static_tools_dir
         self.app = app
+        self.lazy = lazy
+        self.bundler = ToolBundler() if bundle_imports and static_tools_dir else None
+        self.imports_manifest = {}
+        self.imports_body = b''
+        self.imports_etag = None
+        self._file_hashes = {}
+        self._manifest_lock = threading.Lock()
+        self._watcher = None
+        # Lazy mode: tools whose api.py has not been imported yet, and how long activation took
+        self.pending_tools = {}
+        self.activation_times = {}
+        # Held while a tool's routes are added and, while tools are pending, while a URL is routed
+        self._activation_lock = threading.RLock()
+        self.profiler = profiler or StartupProfiler()
+        self.metrics = RouteMetrics()
+        self.http_client = http_client or HttpClient()
+        # Stack samples and upstream calls of tool requests running past the slow request threshold
+        self.slow_requests = slow_requests or SlowRequestMonitor()
+        self.http_client.observers.append(self.slow_requests.record_upstream)
+        # Thread id -> (tool, endpoint, view frame) of the tool requests in progress, read by the sampling profiler
+        self.active_requests = {}
+        self.cache_registry = cache_registry or CacheRegistry()
+        # Background jobs registered by tools; started by the app once the tools are loaded
+        self.scheduler = scheduler or JobScheduler()
+        self.event_hub = event_hub or EventHub()
+        # Shared event loop running the tools' async def handlers and their async outbound calls
+        self.async_loop = async_loop or AsyncLoop()
+        self.async_http_client = async_http_client or AsyncHttpClient(self.http_client)
+        self.tool_services = {}
+        # Endpoints whose identical concurrent requests share one handler run (route option coalesce=True)
+        self.single_flight = SingleFlight()
+        self.coalesced_endpoints = set()
+        # Endpoints served by the process pool (route option isolate=True, or 'isolate': True in tool_info)
+        self.bulkhead = bulkhead or ProcessBulkhead(app)
+        self.isolated_endpoints = set()
+        # Concurrency limits of tools ('max_concurrent'/'max_queue' in tool_info) and routes (same route options)
+        self.admission = admission or AdmissionController()
+        self.route_limits = {}
+        # ETag / If-None-Match handling of GET routes (route option etag=True, or etag=<version function>)
+        self.conditional_endpoints = {}
+        # Optional warmup() hooks of the tools (tool.py), run concurrently by run_warmups()
+        self.warmups = WarmupRunner()
+        # Hash of the discovered tools' metadata (version token of /api/tools): the same in every
+        # worker and across restarts, and different as soon as a tool is added, removed or changed
+        self.tools_version = None
+        self.metadata_cache = ToolMetadataCache(metadata_cache_path) if metadata_cache_path else None
         self.discover_tools()
+        self.build_imports_manifest()
+        if self.lazy:
+            self.app.wsgi_app = self._lazy_activation_middleware(self.app.wsgi_app)
+            self.app.create_url_adapter = self._guarded_url_adapter(self.app.create_url_adapter)
 
     def discover_tools(self):
         """Discover all available tools and register their APIs"""
         self.tools = {}
+        self.pending_tools = {}
         if not self.tools_dir.exists():
             print(f"Error: Tools directory does not exist: {self.tools_dir}")
             return
@@ -34,54 +119,416 @@ class ToolManager:
 
             try:
                 # Validate tool structure
-                if not self.validate_tool(tool_dir):
+                with self.profiler.phase(tool_dir.name, 'validate_tool'):
+                    valid = self.validate_tool(tool_dir)
+                if not valid:
                     continue
 
-                # Import tool module
-                spec = importlib.util.spec_from_file_location(
-                    f"tools.{tool_dir.name}",
-                    tool_dir / "tool.py"
-                )
-
-                # Load and validate the module
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+                # Unchanged since the last run: reuse the cached metadata instead of executing tool.py
+                tool_info = self.metadata_cache.get_tool_info(tool_dir) if self.metadata_cache else None
+                if tool_info is not None:
+                    print(f"Using cached metadata for tool: {tool_dir.name}")
+                    self.tools[tool_dir.name] = tool_info
+                    if self.lazy:
+                        self.pending_tools[tool_dir.name] = tool_dir
+                    else:
+                        self.register_tool_api(tool_dir)
+                    continue
 
-                    if module is None:
-                        print(f"Error: module is None for tool {tool_dir.name}")
+                # Lazy mode: read the metadata without executing the tool, activate on first request
+                if self.lazy:
+                    tool_info = self.read_tool_info(tool_dir)
+                    if tool_info is not None:
+                        if self.validate_tool_info(tool_info):
+                            self.tools[tool_dir.name] = tool_info
+                            self.pending_tools[tool_dir.name] = tool_dir
+                            self._cache_tool_info(tool_dir, tool_info)
+                        else:
+                            print(f"Warning: Invalid or missing tool_info for tool {tool_dir.name}")
                         continue
 
-                    # Check if tool has required get_tool_info function
-                    if not hasattr(module, 'get_tool_info'):
-                        print(f"Warning: Tool {tool_dir.name} missing get_tool_info function, skipping")
-                        continue
+                if self.load_tool(tool_dir):
+                    self._cache_tool_info(tool_dir, self.tools[tool_dir.name])
+
+            except Exception as e:
+                print(f"Failed to load tool {tool_dir.name}: {e}")
 
-                    # Get tool info
-                    tool_info = module.get_tool_info()
+        self.refresh_panels()
+        self.tools_version = hashlib.sha256(
+            json.dumps(self.tools, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+        if self.metadata_cache:
+            self.metadata_cache.save()
 
-                    # Only register tools with valid tool_info
-                    if tool_info is not None and self.validate_tool_info(tool_info):
-                        self.tools[tool_dir.name] = tool_info
+    def _cache_tool_info(self, tool_dir: Path, tool_info):
+        if self.metadata_cache:
+            self.metadata_cache.put_tool_info(tool_dir, tool_info)
 
-                        # Register the tool's API endpoints
-                        self.register_tool_api(tool_dir, module)
-                    else:
-                        print(f"Warning: Invalid or missing tool_info for tool {tool_dir.name}")
+    def load_tool(self, tool_dir: Path):
+        """Execute a tool's tool.py, record its tool_info and register its APIs"""
+        module = self._load_tool_module(tool_dir)
+        if module is None:
+            return False
+
+        # Check if tool has required get_tool_info function
+        if not hasattr(module, 'get_tool_info'):
+            print(f"Warning: Tool {tool_dir.name} missing get_tool_info function, skipping")
+            return False
+
+        # Get tool info
+        tool_info = module.get_tool_info()
 
+        # Only register tools with valid tool_info
+        if tool_info is None or not self.validate_tool_info(tool_info):
+            print(f"Warning: Invalid or missing tool_info for tool {tool_dir.name}")
+            return False
+
+        self.tools[tool_dir.name] = tool_info
+
+        # Register the tool's API endpoints
+        self.register_tool_api(tool_dir, module)
+        return True
+
+    def _load_tool_module(self, tool_dir: Path):
+        """Import a tool's tool.py module"""
+        spec = importlib.util.spec_from_file_location(
+            f"tools.{tool_dir.name}",
+            tool_dir / "tool.py"
+        )
+        if not (spec and spec.loader):
+            print(f"Error: Could not load tool.py for tool {tool_dir.name}")
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        with self.profiler.phase(tool_dir.name, 'exec_tool'):
+            spec.loader.exec_module(module)
+        if module is None:
+            print(f"Error: module is None for tool {tool_dir.name}")
+        return module
+
+    def read_tool_info(self, tool_dir: Path):
+        """
+        Read tool_info without executing tool.py.
+        Works when get_tool_info() returns a literal dict; returns None otherwise.
+        """
+        try:
+            tree = ast.parse((tool_dir / "tool.py").read_text(encoding='utf-8'))
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == 'get_tool_info':
+                returns = [stmt for stmt in node.body if isinstance(stmt, ast.Return)]
+                if len(returns) == 1 and returns[0].value is not None:
+                    try:
+                        return ast.literal_eval(returns[0].value)
+                    except ValueError:
+                        return None
+        return None
+
+    def activate_tool(self, tool_name: str):
+        """Import a pending tool and register its routes (lazy mode)"""
+        with self._activation_lock:
+            tool_dir = self.pending_tools.get(tool_name)
+            if tool_dir is None:
+                return
+
+            start = time.perf_counter()
+            # Routes are added after the app has served requests, which Flask forbids by default.
+            # Activation and routing share the lock, so no other request is routed meanwhile.
+            self.app._check_setup_finished = lambda f_name: None
+            try:
+                self.register_tool_api(tool_dir)
+                # The request activating the tool does not wait for it, later ones find it warm
+                self.warmups.start()
             except Exception as e:
-                print(f"Failed to load tool {tool_dir.name}: {e}")
+                print(f"Failed to activate tool {tool_name}: {e}")
+            finally:
+                del self.app._check_setup_finished
+                self.pending_tools.pop(tool_name, None)
+
+            self.activation_times[tool_name] = time.perf_counter() - start
+            print(f"Activated tool {tool_name} in {self.activation_times[tool_name] * 1000:.1f} ms")
+
+    def activate_all(self):
+        """Activate every pending tool"""
+        for tool_name in list(self.pending_tools):
+            self.activate_tool(tool_name)
+
+    def _lazy_activation_middleware(self, wsgi_app):
+        """WSGI middleware activating a tool before the first request under /api/<tool>/ is routed"""
+        def middleware(environ, start_response):
+            path = environ.get('PATH_INFO', '')
+            if self.pending_tools and path.startswith('/api/'):
+                tool_name = path[len('/api/'):].split('/', 1)[0]
+                if tool_name in self.pending_tools:
+                    self.activate_tool(tool_name)
+            return wsgi_app(environ, start_response)
+        return middleware
+
+    def _guarded_url_adapter(self, create_url_adapter):
+        """
+        Wrap app.create_url_adapter so URLs are matched and built under the activation lock while
+        tools are pending: activating a tool adds rules to the url_map, which other threads route with.
+        Once every tool is active the url_map no longer changes and the lock is skipped.
+        """
+        def guarded(request):
+            adapter = create_url_adapter(request)
+            if adapter is None or not self.pending_tools:
+                return adapter
+            match, build = adapter.match, adapter.build
+            def guarded_match(*args, **kwargs):
+                with self._activation_lock:
+                    return match(*args, **kwargs)
+            def guarded_build(*args, **kwargs):
+                with self._activation_lock:
+                    return build(*args, **kwargs)
+            adapter.match, adapter.build = guarded_match, guarded_build
+            return adapter
+        return guarded
 
     def _monkeypatch_route(self, tool_name):
         orig_route = self.app.route
         def custom_route(rule, **options):
+            # Core route options are consumed here, Flask would reject them
+            coalesce = options.pop('coalesce', False)
+            isolate = options.pop('isolate', self.tools.get(tool_name, {}).get('isolate', False))
+            limits = (options.pop('max_concurrent', None), options.pop('max_queue', None))
+            etag = options.pop('etag', False)
             def decorator(f):
                 endpoint = f"{tool_name}.{f.__name__}"
+                if coalesce:
+                    self.coalesced_endpoints.add(endpoint)
+                if isolate and self.bulkhead.started:
+                    # The pool processes were forked with the app as it was: this route is not in it
+                    print(f"Warning: {endpoint} registered after the process pool was forked, "
+                          f"it is served by the server process")
+                elif isolate:
+                    self.isolated_endpoints.add(endpoint)
+                if limits[0]:
+                    self.route_limits[endpoint] = limits
+                if etag:
+                    self.conditional_endpoints[endpoint] = None if etag is True else etag
                 return orig_route(rule, endpoint=endpoint, **options)(f)
             return decorator
         return custom_route
 
-    def register_tool_api(self, tool_dir: Path, module):
+    def _call_register_apis(self, tool_name, register_apis):
+        """Call a tool's register_apis with app.route patched to namespace its endpoints"""
+        existing_endpoints = set(self.app.view_functions)
+        orig_route = self.app.route
+        self.app.route = self._monkeypatch_route(tool_name)
+        try:
+            with self.profiler.phase(tool_name, 'register_apis'):
+                if self._accepts_services(register_apis):
+                    register_apis(self.app, f'/api/{tool_name}', self.get_tool_services(tool_name))
+                else:
+                    register_apis(self.app, f'/api/{tool_name}')
+        finally:
+            self.app.route = orig_route
+
+        # One limiter shared by all routes of the tool, and one per limited route
+        tool_info = self.tools.get(tool_name, {})
+        tool_limiter = self.admission.configure(tool_name, tool_info.get('max_concurrent'), tool_info.get('max_queue'))
+
+        # Wrap every endpoint the tool added, including those registered through blueprints
+        for endpoint in set(self.app.view_functions) - existing_endpoints:
+            view = self.app.view_functions[endpoint]
+            if inspect.iscoroutinefunction(view):
+                view = self._async_view(view)
+            if endpoint in self.isolated_endpoints:
+                view = self._isolate_view(endpoint, view)
+            if endpoint in self.coalesced_endpoints:
+                view = self._coalesce_view(tool_name, endpoint, view)
+            limiters = [limiter for limiter in (self.admission.configure(endpoint, *self.route_limits.get(endpoint, ())),
+                                                tool_limiter) if limiter is not None]
+            if limiters:
+                view = self._admission_view(view, limiters)
+            if endpoint in self.conditional_endpoints:
+                view = conditional_get(self.conditional_endpoints[endpoint])(view)
+            self.app.view_functions[endpoint] = self._wrap_view(tool_name, endpoint, view)
+
+    @staticmethod
+    def _accepts_services(register_apis):
+        """Whether register_apis takes the optional services argument"""
+        try:
+            params = list(inspect.signature(register_apis).parameters.values())
+        except (TypeError, ValueError):
+            return False
+        if any(param.kind == param.VAR_POSITIONAL for param in params):
+            return True
+        positional = [param for param in params if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)]
+        return len(positional) >= 3
+
+    def get_tool_services(self, tool_name):
+        """Services handed to a tool's register_apis"""
+        services = self.tool_services.get(tool_name)
+        if services is None:
+            services = self.tool_services[tool_name] = ToolServices(tool_name, http=self.http_client,
+                                                                        caches=self.cache_registry,
+                                                                        scheduler=self.scheduler,
+                                                                        events=self.event_hub,
+                                                                        bulkhead=self.bulkhead,
+                                                                        loop=self.async_loop,
+                                                                        async_http=self.async_http_client)
+        return services
+
+    def _coalesce_view(self, tool_name, endpoint, view):
+        """
+        Wrap a view so identical concurrent requests (same method, path, query string and body)
+        run it once and all receive a copy of its response. Only for responses that do not
+        depend on who is asking.
+        """
+        name = endpoint.split('.', 1)[-1]
+
+        @functools.wraps(view)
+        def coalesced_view(*args, **kwargs):
+            key = (endpoint, request.method, request.full_path, request.get_data())
+
+            def compute():
+                response = self.app.make_response(view(*args, **kwargs))
+                if response.is_streamed:
+                    return response, None
+                # Snapshot taken before after_request handlers touch the leader's response
+                return response, (response.get_data(), response.status_code, list(response.headers))
+
+            (response, snapshot), shared = self.single_flight.do(key, compute, tool_name, name)
+            if not shared:
+                return response
+            if snapshot is None:
+                # A stream can be consumed only once: run the handler for this request too
+                return view(*args, **kwargs)
+            body, status, headers = snapshot
+            return self.app.response_class(body, status=status, headers=headers)
+
+        return coalesced_view
+
+    def _admission_view(self, view, limiters):
+        """
+        Wrap a view so it runs only with a slot of each limiter (route first, then tool); a request
+        that cannot get one is answered 503 with Retry-After. Slots are held until the view returns:
+        the body of a streamed response is not counted.
+        """
+        @functools.wraps(view)
+        def admitted_view(*args, **kwargs):
+            acquired = []
+            try:
+                for limiter in limiters:
+                    limiter.acquire()
+                    acquired.append(limiter)
+            except Shed as e:
+                for limiter in reversed(acquired):
+                    limiter.release()
+                response = jsonify({'success': False, 'error': str(e)})
+                response.status_code = 503
+                response.headers['Retry-After'] = str(self.admission.retry_after)
+                return response
+
+            try:
+                return view(*args, **kwargs)
+            finally:
+                for limiter in reversed(acquired):
+                    limiter.release()
+
+        return admitted_view
+
+    def _async_view(self, view):
+        """Run an async def view on the shared event loop; the request thread waits for its result"""
+        @functools.wraps(view)
+        def async_view(*args, **kwargs):
+            return self.async_loop.run(view(*args, **kwargs))
+
+        return async_view
+
+    def _isolate_view(self, endpoint, view):
+        """
+        Wrap a view so its requests are served by a process of the bulkhead pool. The view then
+        sees the pool process's copy of the tool state (caches, globals), not the server's.
+        """
+        @functools.wraps(view)
+        def isolated_view(*args, **kwargs):
+            # Already inside the pool process
+            if request.environ.get(ISOLATED_ENVIRON_KEY):
+                return view(*args, **kwargs)
+
+            request_data = {
+                'path': request.path,
+                'method': request.method,
+                'query_string': request.query_string,
+                'headers': list(request.headers.items()),
+                'data': request.get_data(),
+            }
+            try:
+                status, headers, body = self.bulkhead.run_request(endpoint, request_data)
+            except BulkheadFull as e:
+                response = jsonify({'success': False, 'error': str(e)})
+                response.status_code = 503
+                response.headers['Retry-After'] = '1'
+                return response
+            except BulkheadTimeout as e:
+                return jsonify({'success': False, 'error': str(e)}), 504
+            return self.app.response_class(body, status=status, headers=headers)
+
+        return isolated_view
+
+    def _wrap_view(self, tool_name, endpoint, view):
+        """Wrap a tool view function with the core request instrumentation"""
+        metrics = self.metrics
+        slow_requests = self.slow_requests
+        active_requests = self.active_requests
+        name = endpoint.split('.', 1)[-1]
+
+        @functools.wraps(view)
+        def instrumented_view(*args, **kwargs):
+            # A request replayed in a bulkhead process is watched by the server that forwarded it
+            token = None if request.environ.get(ISOLATED_ENVIRON_KEY) else slow_requests.begin(
+                tool_name, name, request.method, str(request.url_rule), request.path)
+            thread_id = threading.get_ident()
+            # Restored afterwards, in case a tool view is called from another one
+            outer_request = active_requests.get(thread_id)
+            active_requests[thread_id] = (tool_name, name, sys._getframe())
+            status = 500
+            start = time.perf_counter()
+            try:
+                try:
+                    response = self.app.make_response(view(*args, **kwargs))
+                except HTTPException as e:
+                    status = e.code or 500
+                    metrics.observe(tool_name, name, time.perf_counter() - start, status)
+                    raise
+                except Exception:
+                    metrics.observe(tool_name, name, time.perf_counter() - start, 500)
+                    raise
+
+                status = response.status_code
+                if response.is_streamed:
+                    # Latency is time to first byte; bytes are counted as the stream is sent
+                    metrics.observe(tool_name, name, time.perf_counter() - start, response.status_code)
+                    response.response = self._count_streamed_bytes(response.response, tool_name, name)
+                else:
+                    metrics.observe(tool_name, name, time.perf_counter() - start, response.status_code,
+                                    response.calculate_content_length() or 0)
+                return response
+            finally:
+                slow_requests.end(token, status)
+                if outer_request is None:
+                    active_requests.pop(thread_id, None)
+                else:
+                    active_requests[thread_id] = outer_request
+
+        return instrumented_view
+
+    def _count_streamed_bytes(self, iterable, tool_name, endpoint):
+        sent = 0
+        try:
+            for chunk in iterable:
+                sent += len(chunk)
+                yield chunk
+        finally:
+            self.metrics.add_bytes(tool_name, endpoint, sent)
+            if hasattr(iterable, 'close'):
+                iterable.close()
+
+    def register_tool_api(self, tool_dir: Path, module=None):
         """Register tool APIs - try to import from api module first"""
         try:
             api_spec = importlib.util.spec_from_file_location(
@@ -90,29 +537,68 @@ class ToolManager:
             )
             if api_spec and api_spec.loader:
                 api_module = importlib.util.module_from_spec(api_spec)
-                api_spec.loader.exec_module(api_module)
+                with self.profiler.phase(tool_dir.name, 'exec_api'):
+                    api_spec.loader.exec_module(api_module)
                 if hasattr(api_module, 'register_apis'):
-                    orig_route = self.app.route
-                    self.app.route = self._monkeypatch_route(tool_dir.name)
-                    api_module.register_apis(self.app, f'/api/{tool_dir.name}')
-                    self.app.route = orig_route
+                    self._call_register_apis(tool_dir.name, api_module.register_apis)
                     print(f"Registered APIs for tool: {tool_dir.name} (from api.py)")
+                    self._register_warmup(tool_dir, getattr(api_module, 'tool', None))
                 else:
                     print(f"Warning: {tool_dir.name}/api.py has no register_apis function")
             else:
                 print(f"Warning: Could not load {tool_dir.name}/api.py")
         except Exception as api_error:
             # Fallback: try to register APIs from tool module (backward compatibility)
+            if module is None:
+                module = self._load_tool_module(tool_dir)
             if hasattr(module, 'register_apis'):
-                orig_route = self.app.route
-                self.app.route = self._monkeypatch_route(tool_dir.name)
-                module.register_apis(self.app, f'/api/{tool_dir.name}')
-                self.app.route = orig_route
+                self._call_register_apis(tool_dir.name, module.register_apis)
                 print(f"Registered APIs for tool: {tool_dir.name} (from tool.py - deprecated)")
+                self._register_warmup(tool_dir, module)
             else:
                 print(f"Warning: No API registration found for tool: {tool_dir.name}")
                 print(f"API error: {api_error}")
 
+    def _register_warmup(self, tool_dir: Path, module=None):
+        """
+        Register the warmup() of a tool's tool.py, if it defines one. It must run on the module instance
+        the tool's api.py uses (where register_apis set up its caches and clients): the api module's
+        `tool` attribute, or else tools.<tool>.tool as `from . import tool` imports it.
+        """
+        if not inspect.ismodule(module):
+            if not self._declares_warmup(tool_dir):
+                return
+            try:
+                module = importlib.import_module(f"tools.{tool_dir.name}.tool")
+            except Exception as e:
+                print(f"Warning: could not import tool.py of {tool_dir.name} for its warmup: {e}")
+                return
+        warmup = getattr(module, 'warmup', None)
+        if callable(warmup):
+            self.warmups.add(tool_dir.name, warmup)
+
+    @staticmethod
+    def _declares_warmup(tool_dir: Path):
+        """Whether tool.py defines a top-level warmup function (checked without executing it)"""
+        try:
+            tree = ast.parse((tool_dir / "tool.py").read_text(encoding='utf-8'))
+        except (OSError, SyntaxError, ValueError):
+            return False
+        return any(isinstance(node, ast.FunctionDef) and node.name == 'warmup' for node in tree.body)
+
+    def run_warmups(self, timeout: float):
+        """Run the registered warmups concurrently and wait for them, at most timeout seconds"""
+        started = time.perf_counter()
+        if not self.warmups.start():
+            return True
+        finished = self.warmups.wait(timeout)
+        if finished:
+            print(f"Warmed up tools in {(time.perf_counter() - started) * 1000:.1f} ms")
+        else:
+            warming = [name for name, stats in self.warmups.stats().items() if stats['state'] == 'warming']
+            print(f"Warning: warmup of {', '.join(warming)} still running after {timeout:g} seconds, serving anyway")
+        return finished
+
     def validate_tool(self, tool_dir: Path) -> bool:
         """Validate tool structure and setup"""
         try:
@@ -124,7 +610,8 @@ class ToolManager:
             # Load tool-specific environment variables
             tool_env_file = tool_dir / ".env"
             if tool_env_file.exists():
-                load_dotenv(tool_env_file)
+                with self.profiler.phase(tool_dir.name, 'load_env'):
+                    load_dotenv(tool_env_file)
                 print(f"Loaded environment variables for tool: {tool_dir.name}")
 
             # Check if tool.py exists
@@ -161,4 +648,114 @@ class ToolManager:
 
     def get_available_tools(self):
         """Get list of available tools"""
-        return self.tools
\ No newline at end of file
+        return self.tools
+
+    def build_imports_manifest(self):
+        """Resolve every tool's imports once and cache the serialized manifest with its ETag"""
+        manifest = {}
+        for tool_name, info in self.tools.items():
+            entries = self.expand_tool_imports(tool_name, info.get('imports', []))
+            if self.bundler:
+                manifest[tool_name] = self._bundle_tool_imports(tool_name, entries)
+            else:
+                manifest[tool_name] = [self._import_url(tool_name, entry) for entry in entries]
+
+        body = json.dumps({'success': True, 'imports': manifest}, separators=(',', ':')).encode('utf-8')
+        with self._manifest_lock:
+            self.imports_manifest = manifest
+            self.imports_body = body
+            self.imports_etag = hashlib.sha256(body).hexdigest()
+        return manifest
+
+    def expand_tool_imports(self, tool_name, imports):
+        """Expand a tool's import list into CDN URLs (str) and local script files (Path)"""
+        static_dir = self.static_tools_dir / tool_name if self.static_tools_dir else None
+        entries = []
+        for path in imports:
+            # If it's a URL, just add it
+            if path.startswith('http://') or path.startswith('https://') or static_dir is None:
+                entries.append(path)
+            # Expand wildcards, sorted so the manifest (and its ETag) is stable across processes
+            elif '*' in path:
+                entries.extend(sorted(m for m in static_dir.glob(path) if m.is_file() and m.suffix == '.js'))
+            else:
+                entries.append(static_dir / path)
+        return entries
+
+    def _import_url(self, tool_name, entry):
+        """Static URL of a local script tagged with its content hash, or the entry itself for URLs"""
+        if isinstance(entry, str):
+            return entry if '://' in entry else f"/static/tools/{tool_name}/{entry}"
+        url = f"/static/tools/{tool_name}/{entry.relative_to(self.static_tools_dir / tool_name).as_posix()}"
+        file_hash = self._hash_file(entry)
+        return f"{url}?v={file_hash}" if file_hash else url
+
+    def _bundle_tool_imports(self, tool_name, entries):
+        """CDN URLs in their declared order followed by one bundle of all local scripts"""
+        urls = [entry for entry in entries if isinstance(entry, str)]
+        files = [entry for entry in entries if isinstance(entry, Path)]
+        if files:
+            filename = self.bundler.build(tool_name, files, self.static_tools_dir)
+            urls.append(f"/bundles/{filename}")
+        return urls
+
+    def get_bundle(self, filename: str, accept_encodings=None):
+        """Return (content, encoding) of a built bundle, or (None, None); see ToolBundler.get"""
+        return self.bundler.get(filename, accept_encodings) if self.bundler else (None, None)
+
+    def _hash_file(self, path: Path):
+        """Short content hash of a file, reused while its mtime and size are unchanged"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_hashes.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        file_hash = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+        self._file_hashes[path] = (key, file_hash)
+        return file_hash
+
+    def refresh_panels(self):
+        """Rebuild the panel list of every tool (from the metadata cache when unchanged)"""
+        self.tool_panels = {tool_name: self._scan_panels(tool_name) for tool_name in self.tools}
+
+    def _scan_panels(self, tool_name, use_cache=True):
+        if not self.static_tools_dir:
+            return []
+        panels_dir = self.static_tools_dir / tool_name / 'panels'
+        use_cache = use_cache and self.metadata_cache is not None
+        if use_cache:
+            panels = self.metadata_cache.get_panels(tool_name, panels_dir)
+            if panels is not None:
+                return panels
+        panels = sorted(p.stem for p in panels_dir.glob('*.js') if p.is_file()) if panels_dir.exists() else []
+        if use_cache:
+            self.metadata_cache.put_panels(tool_name, panels_dir, panels)
+        return panels
+
+    def get_tool_panels(self, tool_name):
+        """Get the panel names of a tool"""
+        if tool_name in self.tool_panels:
+            return self.tool_panels[tool_name]
+        return self._scan_panels(tool_name, use_cache=False)
+
+    def get_imports_manifest(self):
+        """Return the pre-serialized imports manifest body and its ETag"""
+        with self._manifest_lock:
+            return self.imports_body, self.imports_etag
+
+    def watch_static_files(self, interval: float = 2.0):
+        """Rebuild the imports manifest whenever a tool's static JS files change"""
+        if self._watcher or not self.static_tools_dir:
+            return
+        self._watcher = FileWatcher(self.static_tools_dir, self._on_static_change, interval, suffixes=['.js'])
+        self._watcher.start()
+
+    def _on_static_change(self):
+        self.build_imports_manifest()
+        self.refresh_panels()
+        if self.metadata_cache:
+            self.metadata_cache.save()
+        print("Static tool files changed, rebuilt imports manifest")
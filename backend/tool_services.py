@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tool Services Module
+Core services handed to tools by the ToolManager.
+"""
+
+from conditional import conditional_get
+
+
+class ToolServices:
+    """
+    Services available to a tool, passed as the optional third argument of register_apis:
+
+        def register_apis(app, base_path, services=None):
+            ...
+
+    - http: shared HttpClient (pooled keep-alive connections, default timeouts, retries)
+    - cache(name, ...): named TTL/LRU cache of the tool, listed in /api/cache/stats as '<tool>/<name>';
+      shared=True keeps it on the shared cache server, when one is configured (shared_caches)
+    - schedule(name, func, interval, ...): periodic background job, listed in /api/scheduler/jobs
+    - topic(name, producer, interval, ...) / publish(name, data): Server-Sent Events topics
+      '<tool>/<name>' that browsers subscribe to through /api/events
+    - isolate(name, func): run a blocking function in the core process pool (bulkhead)
+    - conditional_get(version=None): ETag / 304 decorator for JSON GET routes (same as the etag route option)
+    - loop / async_http: shared asyncio loop (loop.run(coro) from sync code) and async HTTP client;
+      async def route handlers run on the same loop
+    """
+
+    def __init__(self, tool_name: str, http, caches, scheduler, events, bulkhead, loop, async_http):
+        self.tool_name = tool_name
+        self.http = http
+        self._caches = caches
+        self._scheduler = scheduler
+        self._events = events
+        self._bulkhead = bulkhead
+        self.loop = loop
+        self.async_http = async_http
+
+    def cache(self, name: str, maxsize: int = 256, ttl: float = 60.0, stale_ttl: float = 0.0, shared: bool = False):
+        """
+        Return the tool's cache with this name (created with the given limits on first use).
+        Entries expire after ttl seconds; with stale_ttl they are served stale for that much
+        longer while being refreshed in the background.
+        With shared=True and CACHE_REDIS_URL set, entries are stored on the shared cache server
+        (values must be JSON data), so all app instances reuse each other's upstream results.
+        Caches of data about this machine (psutil readings) must stay local.
+        """
+        return self._caches.get_cache(f"{self.tool_name}/{name}", maxsize=maxsize, ttl=ttl, stale_ttl=stale_ttl,
+                                      shared=shared)
+
+    @property
+    def shared_caches(self):
+        """Whether a shared cache server is configured (CACHE_REDIS_URL), i.e. whether cache(shared=True) uses it"""
+        return self._caches.shared_client is not None
+
+    def schedule(self, name: str, func, interval: float, jitter: float = 0.1, initial_delay: float = None):
+        """
+        Run func() every interval seconds on the core scheduler's worker pool, typically to keep
+        a cache warm. Runs are skipped while the previous one is still going.
+        """
+        return self._scheduler.add_job(f"{self.tool_name}/{name}", func, interval, jitter=jitter,
+                                       initial_delay=initial_delay)
+
+    def topic(self, name: str, producer, interval: float, parameterized: bool = False, param_pattern: str = None):
+        """
+        Publish producer() to the topic '<tool>/<name>' every interval seconds while it has subscribers.
+        A parameterized topic is subscribed as '<tool>/<name>:<param>' and publishes producer(param)
+        for each subscribed param; params must fully match param_pattern (a regex, by default a
+        word, name or city of at most 64 characters).
+        """
+        topic = f"{self.tool_name}/{name}"
+        if parameterized:
+            self._events.register_parameterized(topic, param_pattern)
+        publish = lambda: self._events.publish_active(topic, producer, parameterized)
+        return self._scheduler.add_job(f"{topic}/publish", publish, interval, jitter=0.0)
+
+    def publish(self, name: str, data):
+        """Publish data to the topic '<tool>/<name>' now (e.g. from a job that already computed it)"""
+        self._events.publish(f"{self.tool_name}/{name}", data)
+
+    @staticmethod
+    def conditional_get(version=None):
+        """
+        Decorator giving a JSON GET view a strong ETag and 304 answers to matching If-None-Match.
+        For routes registered on a Blueprint, where the etag route option is not available.
+        """
+        return conditional_get(version)
+
+    def isolate(self, name: str, func, timeout: float = None):
+        """
+        Return a function calling func in the core process pool instead of the calling thread.
+        The call waits at most timeout seconds (queueing included) and raises when the pool is full.
+        func is registered when the tool loads, so it may be a closure; its arguments and result
+        must be picklable.
+        """
+        qualified_name = f"{self.tool_name}/{name}"
+        try:
+            self._bulkhead.register(qualified_name, func)
+        except RuntimeError:
+            # Tool activated (lazy loading) after the pool was forked: never fork it again from the server
+            print(f"Warning: {qualified_name} registered after the process pool was forked, "
+                  f"it runs in the server process")
+            return func
+
+        def isolated(*args, **kwargs):
+            return self._bulkhead.call(qualified_name, *args, timeout=timeout, **kwargs)
+        return isolated
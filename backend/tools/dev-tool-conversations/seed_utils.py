@@ -17,6 +17,41 @@ from pathlib import Path
 # Base path for seed data
 SEED_BASE_PATH = Path.home() / 'code' / 'conversations-examples'
 
+# Parsed seed files: path -> ((mtime_ns, size), data); a file is parsed again only when it changed.
+# The cached data is shared between requests and must not be modified.
+_parsed_files: Dict[Path, Any] = {}
+
+
+def _read_seed_json(path: Path) -> Any:
+    """Parsed content of a seed file; raises json.JSONDecodeError or IOError like reading it directly"""
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _parsed_files.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.loads(f.read())
+    _parsed_files[path] = (key, data)
+    return data
+
+
+def index_seeds() -> int:
+    """Parse every seed file under SEED_BASE_PATH ahead of the first seeding request; returns the file count"""
+    if not SEED_BASE_PATH.exists():
+        return 0
+    count = 0
+    for group_dir in SEED_BASE_PATH.iterdir():
+        if not group_dir.is_dir():
+            continue
+        for name in ('group.json', 'members.json', 'instructions.json'):
+            try:
+                _read_seed_json(group_dir / name)
+                count += 1
+            except (json.JSONDecodeError, IOError):
+                # Missing or invalid: reported by the GET functions when requested
+                pass
+    return count
+
 
 # ============================================================================
 # Validation Functions
@@ -408,10 +443,8 @@ def seeds_groups_get(group_key: Optional[str] = None, existing_keys: set = None)
             return []
         
         try:
-            with open(group_file, 'r', encoding='utf-8') as f:
-                group_data = json.load(f)
-            # Set group_key to null in returned data
-            group_data['group_key'] = None
+            # Set group_key to null in returned data (on a copy: the parsed file is cached)
+            group_data = dict(_read_seed_json(group_file), group_key=None)
             validation = validate_group(group_data)
             
             # Templates always have group_key None, so they can't exist in database
@@ -453,9 +486,7 @@ def seeds_groups_get(group_key: Optional[str] = None, existing_keys: set = None)
             continue
 
         try:
-            with open(group_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                group_data = json.loads(content)
+            group_data = _read_seed_json(group_file)
 
             # Validate structure
             validation = validate_group(group_data)
@@ -527,9 +558,7 @@ def seeds_members_get(group_key: str, member_key: Optional[str] = None, existing
         return []
     
     try:
-        with open(members_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            members_data = json.loads(content)
+        members_data = _read_seed_json(members_file)
     except (json.JSONDecodeError, IOError) as e:
         # Return wrapped error structure
         return [{
@@ -619,9 +648,7 @@ def seeds_instructions_get(group_key: str, instruction_key: Optional[str] = None
         return []
     
     try:
-        with open(instructions_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            instructions_data = json.loads(content)
+        instructions_data = _read_seed_json(instructions_file)
     except (json.JSONDecodeError, IOError) as e:
         return [{
             'type': 'instruction',
@@ -704,9 +731,7 @@ def seeds_instructions_roles_get(group_key: str) -> Any:
         return []
     
     try:
-        with open(instructions_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            instructions_data = json.loads(content)
+        instructions_data = _read_seed_json(instructions_file)
     except (json.JSONDecodeError, IOError) as e:
         return [{
             'type': 'role',
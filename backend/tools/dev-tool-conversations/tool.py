@@ -12,6 +12,9 @@ def get_tool_info():
         'category': 'utility',
         'icon': '🗫',
         'version': '1.0.0',
+        # Upstream proxy calls in flight at once; the rest queue, then get 503 (the notifications stream is not counted)
+        'max_concurrent': 16,
+        'max_queue': 32,
         'imports': [
             'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js',
             'https://cdn.jsdelivr.net/npm/chartjs-plugin-datalabels@2.2.0/dist/chartjs-plugin-datalabels.min.js',
@@ -25,3 +28,8 @@ def get_tool_info():
         ],
     }
 
+
+def warmup():
+    """Parse the seed files ahead of the first seeding request"""
+    from . import seed_utils
+    seed_utils.index_seeds()
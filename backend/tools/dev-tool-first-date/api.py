@@ -25,7 +25,10 @@ from requests.exceptions import RequestException
 
 upstream_base = 'http://127.0.0.1:8443'
 
-def register_apis(app, base_path: str):
+def register_apis(app, base_path: str, services=None):
+    # Outbound HTTP client: the app's shared pooled client when provided
+    http_client = services.http if services is not None else requests
+
     @app.route(f"{base_path}/group_instruction_info", methods=["POST"])
     def group_instruction_info():
         """Proxy to upstream /api/group_instruction_info with group_name and conversation_type from payload (no defaults)."""
@@ -54,7 +57,7 @@ def register_apis(app, base_path: str):
         if member_id is not None:
             params['member_id'] = member_id  # pass as query parameter
 
-        resp = requests.post(url, json=payload or {}, headers=headers, params=params, timeout=timeout)
+        resp = http_client.post(url, json=payload or {}, headers=headers, params=params, timeout=timeout)
         resp.raise_for_status()
         return resp.json()
 
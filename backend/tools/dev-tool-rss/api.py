@@ -3,6 +3,7 @@ Dev Tool RSS - API Endpoints
 """
 
 from flask import Blueprint, jsonify, request
+import asyncio
 import os
 import sys
 
@@ -13,12 +14,39 @@ if current_dir not in sys.path:
 
 import tool
 
-def register_apis(app, prefix):
+# Items returned when the request has no max_items, and how many feeds the background poll keeps warm
+DEFAULT_MAX_ITEMS = 20
+POLLED_FEEDS = 10
+
+def register_apis(app, prefix, services=None):
     """Register RSS tool API endpoints"""
 
+    feed_cache = None
+    if services is not None:
+        tool.http_client = services.http
+        # Parsed feed content, served up to 10 minutes stale while it is refreshed in the background
+        feed_cache = services.cache('feeds', maxsize=128, ttl=300, stale_ttl=600, shared=True)
+
+        async def fetch_feeds(feeds):
+            return await asyncio.gather(*(tool.parse_rss_feed_async(feed_info['url'], DEFAULT_MAX_ITEMS, services.async_http)
+                                          for _, feed_info in feeds))
+
+        def poll_feeds():
+            """Fetch the most used feeds of feeds.json ahead of time, so opening them is served from the cache"""
+            feeds = sorted(tool.load_feeds().items(), key=lambda item: item[1].get('usage', 0), reverse=True)[:POLLED_FEEDS]
+            # All feeds are fetched concurrently on the shared event loop
+            for (feed_id, _), result in zip(feeds, services.loop.run(fetch_feeds(feeds))):
+                if result['success']:
+                    feed_cache.set(f"{feed_id}:{DEFAULT_MAX_ITEMS}", result)
+
+        services.schedule('poll-feeds', poll_feeds, interval=240)
+
     rss_bp = Blueprint('rss', __name__, url_prefix=prefix)
+    # Feed list revalidated with If-None-Match against the version of feeds.json
+    conditional_get = services.conditional_get if services is not None else (lambda version=None: lambda view: view)
 
     @rss_bp.route('/feeds', methods=['GET'])
+    @conditional_get(version=tool.get_feeds_version)
     def get_feeds():
         """Get all available RSS feeds with optional filtering"""
         category = request.args.get('category')
@@ -55,9 +83,16 @@ def register_apis(app, prefix):
             }), 404
 
         feed_info = feeds_data[feed_id]
-        max_items = request.args.get('max_items', 20, type=int)
+        max_items = request.args.get('max_items', DEFAULT_MAX_ITEMS, type=int)
 
-        result = tool.parse_rss_feed(feed_info['url'], max_items)
+        if feed_cache is not None:
+            result = feed_cache.get_or_compute(f"{feed_id}:{max_items}",
+                                               lambda: tool.parse_rss_feed(feed_info['url'], max_items),
+                                               cache_if=lambda parsed: parsed['success'])
+            # The cached result is shared: add feed_info to a copy
+            result = dict(result)
+        else:
+            result = tool.parse_rss_feed(feed_info['url'], max_items)
 
         if result['success']:
             # Increment usage count for this feed
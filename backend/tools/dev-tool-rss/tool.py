@@ -2,6 +2,7 @@
 Dev Tool RSS - Core Logic
 """
 
+import asyncio
 import requests
 import feedparser
 from datetime import datetime, timedelta
@@ -15,6 +16,12 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# Outbound HTTP client; replaced by the app's shared pooled client in register_apis
+http_client = requests
+
+# Parsed feeds.json and the modification time it was parsed at
+_feeds_cache = (None, {})
+
 def get_tool_info():
     """Return tool metadata"""
     return {
@@ -30,15 +37,30 @@ def get_tool_info():
     }
 
 def load_feeds():
-    """Load feeds data from JSON file"""
+    """Load feeds data from JSON file (parsed again only when the file changed; callers get their own copy)"""
+    global _feeds_cache
     feeds_file = os.path.join(current_dir, 'feeds.json')
     try:
-        with open(feeds_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        version = os.stat(feeds_file).st_mtime_ns
+        if _feeds_cache[0] != version:
+            with open(feeds_file, 'r', encoding='utf-8') as f:
+                _feeds_cache = (version, json.load(f))
+        return {feed_id: dict(feed) for feed_id, feed in _feeds_cache[1].items()}
     except Exception as e:
         print(f"Error loading feeds: {e}")
         return {}
 
+def warmup():
+    """Parse feeds.json at startup"""
+    load_feeds()
+
+def get_feeds_version():
+    """Version token of feeds.json (its modification time), changes whenever the feeds are saved"""
+    try:
+        return os.stat(os.path.join(current_dir, 'feeds.json')).st_mtime_ns
+    except OSError:
+        return 0
+
 def save_feeds(feeds_data):
     """Save feeds data to JSON file"""
     feeds_file = os.path.join(current_dir, 'feeds.json')
@@ -83,55 +105,72 @@ def parse_rss_feed(feed_url, max_items=20):
     """Parse RSS feed and return formatted items"""
     try:
         # Set a reasonable timeout
-        response = requests.get(feed_url, timeout=10)
+        response = http_client.get(feed_url, timeout=10)
         response.raise_for_status()
 
         # Parse the feed
-        feed = feedparser.parse(response.content)
-
-        items = []
-        for entry in feed.entries[:max_items]:
-            # Extract published date
-            published = entry.get('published_parsed')
-            if published:
-                published_date = datetime(*published[:6])
-            else:
-                published_date = datetime.now()
-
-            # Extract description/summary
-            description = entry.get('summary', entry.get('description', ''))
-            # Clean up HTML tags from description
-            import re
-            description = re.sub(r'<[^>]+>', '', description)
-            description = description.strip()
-
-            item = {
-                'title': entry.get('title', 'No Title'),
-                'link': entry.get('link', ''),
-                'description': description[:300] + '...' if len(description) > 300 else description,
-                'published': published_date.isoformat(),
-                'author': entry.get('author', ''),
-                'guid': entry.get('id', entry.get('link', ''))
-            }
-            items.append(item)
-
-        return {
-            'success': True,
-            'feed_title': feed.feed.get('title', 'Unknown Feed'),
-            'feed_description': feed.feed.get('description', ''),
-            'items': items,
-            'last_updated': datetime.now().isoformat()
-        }
+        return format_feed(feedparser.parse(response.content), max_items)
 
     except requests.exceptions.RequestException as e:
-        return {
-            'success': False,
-            'error': f'Network error: {str(e)}',
-            'items': []
-        }
+        return feed_error(f'Network error: {str(e)}')
+    except Exception as e:
+        return feed_error(f'Parse error: {str(e)}')
+
+async def parse_rss_feed_async(feed_url, max_items=20, async_http=None):
+    """Async variant of parse_rss_feed for the shared event loop, so many feeds are fetched at once"""
+    try:
+        response = await async_http.get(feed_url, timeout=10)
+        response.raise_for_status()
+
+        # Parsing is CPU work: keep it off the event loop thread
+        feed = await asyncio.get_running_loop().run_in_executor(None, feedparser.parse, response.content)
+        return format_feed(feed, max_items)
+
+    except requests.exceptions.RequestException as e:
+        return feed_error(f'Network error: {str(e)}')
     except Exception as e:
-        return {
-            'success': False,
-            'error': f'Parse error: {str(e)}',
-            'items': []
-        }
\ No newline at end of file
+        return feed_error(f'Parse error: {str(e)}')
+
+def format_feed(feed, max_items=20):
+    """Format a parsed feed as the feed response"""
+    items = []
+    for entry in feed.entries[:max_items]:
+        # Extract published date
+        published = entry.get('published_parsed')
+        if published:
+            published_date = datetime(*published[:6])
+        else:
+            published_date = datetime.now()
+
+        # Extract description/summary
+        description = entry.get('summary', entry.get('description', ''))
+        # Clean up HTML tags from description
+        import re
+        description = re.sub(r'<[^>]+>', '', description)
+        description = description.strip()
+
+        item = {
+            'title': entry.get('title', 'No Title'),
+            'link': entry.get('link', ''),
+            'description': description[:300] + '...' if len(description) > 300 else description,
+            'published': published_date.isoformat(),
+            'author': entry.get('author', ''),
+            'guid': entry.get('id', entry.get('link', ''))
+        }
+        items.append(item)
+
+    return {
+        'success': True,
+        'feed_title': feed.feed.get('title', 'Unknown Feed'),
+        'feed_description': feed.feed.get('description', ''),
+        'items': items,
+        'last_updated': datetime.now().isoformat()
+    }
+
+def feed_error(error):
+    """Feed response of a feed that could not be fetched or parsed"""
+    return {
+        'success': False,
+        'error': error,
+        'items': []
+    }
\ No newline at end of file
@@ -3,13 +3,54 @@ Dev Tool Stocks - API Endpoints
 Handles HTTP requests and responses for stock data.
 """
 
+import os
 from flask import jsonify, request
 from . import tool
 
-def register_apis(app, base_path):
+def register_apis(app, base_path, services=None):
     """Register dev-tool-stocks API endpoints"""
 
-    @app.route(f'{base_path}/quote', methods=['GET'])
+    quote_cache = news_cache = None
+    if services is not None:
+        tool.http_client = services.http
+        # Quotes are served up to 5 minutes stale while a background refresh fetches the new price
+        quote_cache = services.cache('quotes', maxsize=256, ttl=60, stale_ttl=300, shared=True)
+        news_cache = services.cache('news', maxsize=128, ttl=600, shared=True)
+
+        def refresh_popular_quotes():
+            """Keep the popular symbols' quotes warm, so the stocks page loads them from the cache"""
+            failed = []
+            for symbol in tool.get_popular_stocks():
+                try:
+                    quote_cache.set(symbol, tool.get_stock_quote(symbol))
+                except ValueError:
+                    failed.append(symbol)
+            if failed:
+                raise ValueError(f"Could not refresh quotes for {', '.join(failed)}")
+
+        # Needs the server-side key; 6 symbols a minute stays within the Twelve Data free tier
+        if os.getenv('TWELVE_DATA_API_KEY'):
+            services.schedule('popular-quotes', refresh_popular_quotes, interval=55)
+
+    def get_quote(symbol, api_key=None):
+        # The shared cache only holds quotes fetched with the server's key: a user's own key is never
+        # served to the other users, nor reused by the background refresh of a stale entry
+        if quote_cache is None or api_key:
+            return tool.get_stock_quote(symbol, api_key)
+        return quote_cache.get_or_compute(symbol.upper(), lambda: tool.get_stock_quote(symbol, api_key))
+
+    def get_news(symbol):
+        if news_cache is None:
+            return tool.get_stock_news(symbol)
+        # An empty list means the feed could not be fetched: do not cache it
+        return news_cache.get_or_compute(symbol.upper(), lambda: tool.get_stock_news(symbol), cache_if=bool)
+
+    if services is not None:
+        # Quote and news of a symbol pushed to the open stocks pages ('dev-tool-stocks/stock:<SYMBOL>')
+        services.topic('stock', lambda symbol: {'quote': get_quote(symbol), 'news': get_news(symbol)},
+                       interval=30, parameterized=True, param_pattern=r'[A-Za-z0-9.-]{1,12}')
+
+    @app.route(f'{base_path}/quote', methods=['GET'], coalesce=True)
     def get_stock_quote_endpoint():
         """Get stock quote for a symbol"""
         try:
@@ -22,7 +63,7 @@ def register_apis(app, base_path):
                     'error': 'Symbol parameter is required'
                 }), 400
 
-            quote_data = tool.get_stock_quote(symbol, api_key)
+            quote_data = get_quote(symbol, api_key)
             return jsonify({
                 'success': True,
                 'data': quote_data
@@ -45,7 +86,7 @@ def register_apis(app, base_path):
                     'error': 'Symbol parameter is required'
                 }), 400
 
-            news_data = tool.get_stock_news(symbol)
+            news_data = get_news(symbol)
             return jsonify({
                 'success': True,
                 'data': news_data
@@ -15,6 +15,9 @@ env_file = tool_dir / '.env'
 if env_file.exists():
     load_dotenv(env_file)
 
+# Outbound HTTP client; replaced by the app's shared pooled client in register_apis
+http_client = requests
+
 def get_tool_info():
     """Return tool metadata"""
     return {
@@ -40,7 +43,7 @@ def get_stock_quote(symbol, api_key=None):
 
     try:
         url = f'https://api.twelvedata.com/quote?symbol={symbol}&apikey={api_key}'
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -77,7 +80,7 @@ def get_stock_news(symbol):
     try:
         # Use Google News RSS feed
         url = f'https://news.google.com/rss/search?q={symbol}+stock&hl=en-US&gl=US&ceid=US:en'
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url, timeout=10)
         response.raise_for_status()
 
         # Parse XML
@@ -5,9 +5,44 @@ System Info Tool - API Endpoints
 from flask import jsonify
 from . import tool
 
-def register_apis(app, base_path):
+def register_apis(app, base_path, services=None):
     """Register system-info API endpoints"""
 
+    caches = {}
+    # Disk usage of every mounted partition can hang on a slow or network mount (and CPU sampling
+    # blocks until warmup took its first sample): scan in the core process pool, not in a request thread
+    get_hardware_info = tool.get_hardware_info
+    if services is not None:
+        get_hardware_info = services.isolate('hardware', tool.get_hardware_info)
+        caches = {
+            'hardware': services.cache('hardware', maxsize=1, ttl=10, stale_ttl=30),
+            'os': services.cache('os', maxsize=1, ttl=60),
+            'network': services.cache('network', maxsize=1, ttl=2),
+        }
+
+        def sample_hardware():
+            """Hardware info pushed to the open dashboards, also kept as the /hardware response"""
+            hardware_data = get_hardware_info()
+            if 'error' in hardware_data:
+                raise RuntimeError(hardware_data['error'])
+            caches['hardware'].set('hardware', hardware_data)
+            return hardware_data
+
+        # Topics of the panels: published once per interval, whatever the number of open dashboards,
+        # and not sampled at all while none is open
+        services.topic('hardware', sample_hardware, interval=5)
+        services.topic('time', tool.get_current_time, interval=1)
+        services.topic('battery', tool.get_battery_info, interval=30)
+        services.topic('network', lambda: cached('network', tool.get_network_info), interval=10)
+        services.topic('os', lambda: cached('os', tool.get_os_info), interval=30)
+
+    def cached(name, compute):
+        """Share one result between panels polling the same data; error results are not cached"""
+        cache = caches.get(name)
+        if cache is None:
+            return compute()
+        return cache.get_or_compute(name, compute, cache_if=lambda data: 'error' not in data)
+
     @app.route(f'{base_path}/time', methods=['GET'])
     def get_time():
         """Get current time information"""
@@ -38,11 +73,11 @@ def register_apis(app, base_path):
                 'error': str(e)
             }), 500
 
-    @app.route(f'{base_path}/hardware', methods=['GET'])
+    @app.route(f'{base_path}/hardware', methods=['GET'], coalesce=True)
     def get_hardware():
         """Get hardware information"""
         try:
-            hardware_data = tool.get_hardware_info()
+            hardware_data = cached('hardware', get_hardware_info)
             return jsonify({
                 'success': True,
                 'data': hardware_data
@@ -53,11 +88,11 @@ def register_apis(app, base_path):
                 'error': str(e)
             }), 500
 
-    @app.route(f'{base_path}/os', methods=['GET'])
+    @app.route(f'{base_path}/os', methods=['GET'], etag=True)
     def get_os():
         """Get OS information"""
         try:
-            os_data = tool.get_os_info()
+            os_data = cached('os', tool.get_os_info)
             return jsonify({
                 'success': True,
                 'data': os_data
@@ -72,7 +107,7 @@ def register_apis(app, base_path):
     def get_network():
         """Get network interface information"""
         try:
-            network_data = tool.get_network_info()
+            network_data = cached('network', tool.get_network_info)
             return jsonify({
                 'success': True,
                 'data': network_data
@@ -9,6 +9,15 @@ import datetime
 import json
 from typing import Dict, Any
 
+from cpu_usage import CpuUsage
+
+# CPU usage readings with a baseline per caller (hardware topic, routes)
+_cpu_usage = CpuUsage()
+
+def warmup():
+    """Take the first CPU time sample, so hardware info does not have to wait for one"""
+    _cpu_usage.system_percents('hardware')
+
 def get_tool_info():
     """Return tool metadata"""
     return {
@@ -84,18 +93,19 @@ def format_time_left(seconds: int) -> str:
     else:
         return f"{seconds}s"
 
-def get_hardware_info() -> Dict[str, Any]:
+def get_hardware_info(caller: str = 'hardware') -> Dict[str, Any]:
     """Get comprehensive hardware information"""
     try:
         # CPU information
+        cpu_percent, cpu_percent_per_core = _cpu_usage.system_percents(caller)
         cpu_info = {
             'physical_cores': psutil.cpu_count(logical=False),
             'logical_cores': psutil.cpu_count(logical=True),
             'cpu_freq_current': psutil.cpu_freq().current if psutil.cpu_freq() else None,
             'cpu_freq_min': psutil.cpu_freq().min if psutil.cpu_freq() else None,
             'cpu_freq_max': psutil.cpu_freq().max if psutil.cpu_freq() else None,
-            'cpu_percent': psutil.cpu_percent(interval=1),
-            'cpu_percent_per_core': psutil.cpu_percent(interval=1, percpu=True)
+            'cpu_percent': cpu_percent,
+            'cpu_percent_per_core': cpu_percent_per_core
         }
 
         # Memory information
@@ -6,8 +6,18 @@ Handles HTTP requests and responses for system info and welcome message.
 from flask import jsonify
 from . import tool
 
-def register_apis(app, base_path):
+def register_apis(app, base_path, services=None):
     """Register dev-tool-system-performance API endpoints"""
+
+    if services is not None:
+        def get_update():
+            """Memory usage by process with the current system stats, as the page's update expects"""
+            memory_data = tool.get_memory_usage_by_process(caller='update')
+            memory_data['system_stats'] = tool.get_system_info(caller='update')['system_stats']
+            return memory_data
+
+        # Scanning every process is slow, so updates are pushed every 2 seconds (from the process pool)
+        services.topic('update', services.isolate('update', get_update), interval=2)
     
     @app.route(f'{base_path}/info', methods=['GET'])
     def get_system_info_endpoint():
@@ -6,6 +6,18 @@ import datetime
 import psutil
 import platform
 
+from cpu_usage import CpuUsage
+
+# CPU usage readings with a baseline per caller (route or topic), system-wide and per process
+_cpu_usage = CpuUsage()
+
+def warmup():
+    """Take the first CPU time samples of every caller, so their first readings do not block or read 0"""
+    for caller in ('info', 'update'):
+        _cpu_usage.system_percent(caller)
+    for caller in ('memory-usage', 'update'):
+        _cpu_usage.process_percents(caller)
+
 def get_tool_info():
     """Return tool metadata"""
     return {
@@ -14,20 +26,22 @@ def get_tool_info():
         'category': 'system',
         'icon': '📊',
         'version': '1.0.0',
+        # The endpoints block on psutil for a second or more: serve them from the core process pool
+        'isolate': True,
         'endpoints': [
             'GET /api/dev-tool-system-performance/info',
             'GET /api/dev-tool-system-performance/memory-usage'
         ]
     }
 
-def get_system_info():
+def get_system_info(caller='info'):
     """Get static welcome message with server system information"""
     # Get current time
     current_time = datetime.datetime.now()
     formatted_time = current_time.strftime("%B %d, %Y at %I:%M %p")
     # Get system information
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = _cpu_usage.system_percent(caller)
         cpu_count = psutil.cpu_count()
         memory = psutil.virtual_memory()
         memory_used_gb = round(memory.used / (1024**3), 2)
@@ -77,21 +91,19 @@ def get_system_info():
         'system_info': system_info
     }
 
-def get_memory_usage_by_process():
+def get_memory_usage_by_process(caller='memory-usage'):
     """Get memory usage by process/applications"""
     try:
         processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
+        # CPU usage since this caller's previous call (0.0 for processes it has not seen before)
+        cpu_percents = _cpu_usage.process_percents(caller)
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
             try:
                 # Get process memory and CPU info
                 mem_info = proc.info['memory_info']
                 if mem_info:
                     memory_mb = mem_info.rss / (1024 * 1024)  # Convert to MB
-                    # Get CPU usage (this might be 0.0 for the first call, but will be accurate on subsequent calls)
-                    try:
-                        cpu_percent = proc.info.get('cpu_percent', 0.0) or 0.0
-                    except:
-                        cpu_percent = 0.0
+                    cpu_percent = cpu_percents.get(proc.info['pid'], 0.0)
                     
                     processes.append({
                         'pid': proc.info['pid'],
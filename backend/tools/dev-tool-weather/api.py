@@ -6,9 +6,21 @@ Handles HTTP requests and responses for weather information.
 from flask import jsonify, request
 from . import tool
 
-def register_apis(app, base_path):
+def register_apis(app, base_path, services=None):
     """Register dev-tool-weather API endpoints"""
 
+    if services is not None:
+        tool.http_client = services.http
+        # City coordinates do not move; Open-Meteo refreshes current conditions every 15 minutes
+        tool.geocode_cache = services.cache('geocode', maxsize=512, ttl=86400, shared=True)
+        tool.weather_cache = services.cache('weather', maxsize=256, ttl=300, shared=True)
+
+        # Current weather and 5-day forecast of a city pushed to the open weather pages
+        # ('dev-tool-weather/weather:<city>'), at the page's former polling interval
+        services.topic('weather', lambda city: {'current': tool.get_weather_data(city),
+                                                'forecast': tool.get_weather_forecast(city, None, 5)},
+                       interval=600, parameterized=True)
+
     @app.route(f'{base_path}/current', methods=['GET'])
     def get_current_weather():
         """Get current weather for a city"""
@@ -3,8 +3,26 @@ Dev Tool Weather - Core Logic
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# Outbound HTTP client; replaced by the app's shared pooled client in register_apis
+http_client = requests
+
+# Caches for geocoding results and weather responses; set by register_apis from the app's cache service.
+# Fallback coordinates and mock data are never cached, so a transient upstream error is not pinned.
+geocode_cache = None
+weather_cache = None
+
+# Fallback coordinates for major cities
+FALLBACK_COORDS = {
+    'new york': {'lat': 40.7128, 'lon': -74.0060, 'name': 'New York', 'country': 'US'},
+    'london': {'lat': 51.5074, 'lon': -0.1278, 'name': 'London', 'country': 'GB'},
+    'tokyo': {'lat': 35.6762, 'lon': 139.6503, 'name': 'Tokyo', 'country': 'JP'},
+    'paris': {'lat': 48.8566, 'lon': 2.3522, 'name': 'Paris', 'country': 'FR'},
+    'sydney': {'lat': -33.8688, 'lon': 151.2093, 'name': 'Sydney', 'country': 'AU'}
+}
+
 def get_tool_info():
     """Return tool metadata"""
     return {
@@ -21,6 +39,12 @@ def get_tool_info():
 
 def get_city_coordinates(city):
     """Get latitude and longitude for a city name using Open-Meteo geocoding"""
+    cache_key = city.lower()
+    if geocode_cache is not None:
+        cached = geocode_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         # Use Open-Meteo's geocoding API
         geo_url = "https://geocoding-api.open-meteo.com/v1/search"
@@ -31,32 +55,33 @@ def get_city_coordinates(city):
             'format': 'json'
         }
 
-        response = requests.get(geo_url, params=params)
+        response = http_client.get(geo_url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
         if data.get('results'):
             result = data['results'][0]
-            return {
+            coords = {
                 'lat': result['latitude'],
                 'lon': result['longitude'],
                 'name': result['name'],
                 'country': result.get('country', '')
             }
+            if geocode_cache is not None:
+                geocode_cache.set(cache_key, coords)
+            return coords
     except Exception as e:
         pass
 
-    # Fallback coordinates for major cities
-    fallback_coords = {
-        'new york': {'lat': 40.7128, 'lon': -74.0060, 'name': 'New York', 'country': 'US'},
-        'london': {'lat': 51.5074, 'lon': -0.1278, 'name': 'London', 'country': 'GB'},
-        'tokyo': {'lat': 35.6762, 'lon': 139.6503, 'name': 'Tokyo', 'country': 'JP'},
-        'paris': {'lat': 48.8566, 'lon': 2.3522, 'name': 'Paris', 'country': 'FR'},
-        'sydney': {'lat': -33.8688, 'lon': 151.2093, 'name': 'Sydney', 'country': 'AU'}
-    }
-
     city_lower = city.lower()
-    return fallback_coords.get(city_lower, {'lat': 40.7128, 'lon': -74.0060, 'name': city.title(), 'country': 'Unknown'})
+    return FALLBACK_COORDS.get(city_lower, {'lat': 40.7128, 'lon': -74.0060, 'name': city.title(), 'country': 'Unknown'})
+
+def warmup():
+    """Geocode the major cities at startup, so their first weather request skips the geocoding call"""
+    if geocode_cache is None:
+        return
+    with ThreadPoolExecutor(max_workers=len(FALLBACK_COORDS)) as executor:
+        list(executor.map(get_city_coordinates, FALLBACK_COORDS))
 
 def get_weather_description(weathercode):
     """Convert Open-Meteo weather code to description"""
@@ -125,6 +150,12 @@ def get_weather_icon(weathercode):
 
 def get_weather_data(city="New York", api_key=None):
     """Get weather data from Open-Meteo API (no API key required)"""
+    cache_key = f"current:{city.lower()}"
+    if weather_cache is not None:
+        cached = weather_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         # First, get coordinates for the city
         coords = get_city_coordinates(city)
@@ -142,13 +173,13 @@ def get_weather_data(city="New York", api_key=None):
             'timezone': 'auto'
         }
 
-        response = requests.get(base_url, params=params)
+        response = http_client.get(base_url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
         current = data['current_weather']
 
-        return {
+        weather = {
             'city': coords['name'],
             'country': coords.get('country', 'Unknown'),
             'temperature': round(current['temperature']),
@@ -163,12 +194,21 @@ def get_weather_data(city="New York", api_key=None):
             'sunset': '18:00',   # Would need separate API call for this
             'last_updated': datetime.now().strftime('%H:%M:%S')
         }
+        if weather_cache is not None:
+            weather_cache.set(cache_key, weather)
+        return weather
     except Exception as e:
         # Fallback to mock data on error
         return get_mock_weather_data(city)
 
 def get_weather_forecast(city="New York", api_key=None, days=5):
     """Get weather forecast from Open-Meteo API (no API key required)"""
+    cache_key = f"forecast:{city.lower()}:{days}"
+    if weather_cache is not None:
+        cached = weather_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         # Get coordinates for the city
         coords = get_city_coordinates(city)
@@ -187,7 +227,7 @@ def get_weather_forecast(city="New York", api_key=None, days=5):
             'forecast_days': min(days, 16)  # Open-Meteo supports up to 16 days
         }
 
-        response = requests.get(base_url, params=params)
+        response = http_client.get(base_url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -204,7 +244,10 @@ def get_weather_forecast(city="New York", api_key=None, days=5):
                 'wind_speed': 5.0  # Not available in daily forecast
             })
 
-        return forecast[:days]  # Return only requested number of days
+        forecast = forecast[:days]  # Return only requested number of days
+        if weather_cache is not None:
+            weather_cache.set(cache_key, forecast, ttl=1800)
+        return forecast
 
     except Exception as e:
         # Fallback to mock data on error
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Warmup Module
+Runs the tools' optional warmup() hooks concurrently at startup and tracks which tools are ready.
+"""
+
+import threading
+import time
+
+
+class WarmupRunner:
+    """
+    Each registered warmup runs on its own thread, all at the same time. A tool is ready once its
+    warmup returned (a warmup that raised counts as done: the tool works, just cold).
+    wait() returns at the deadline even if some warmups are still running; they keep going and
+    their tools become ready when they finish. Warmup threads do not survive a fork: a worker
+    process calls after_fork() to run again the warmups that were still running in its parent.
+    """
+
+    def __init__(self):
+        self._warmups = {}  # tool name -> state
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+
+    def add(self, tool_name: str, func):
+        with self._lock:
+            self._warmups[tool_name] = {'func': func, 'state': 'pending', 'started': None,
+                                        'seconds': None, 'error': None}
+
+    def start(self):
+        """Start every warmup not started yet"""
+        with self._lock:
+            pending = [(name, warmup) for name, warmup in self._warmups.items() if warmup['state'] == 'pending']
+            for _, warmup in pending:
+                warmup['state'] = 'warming'
+                warmup['started'] = time.perf_counter()
+        for name, warmup in pending:
+            threading.Thread(target=self._run, args=(name, warmup), name=f'warmup-{name}', daemon=True).start()
+        return len(pending)
+
+    def after_fork(self):
+        """In a forked child: run again the warmups its parent was still running (their threads are gone)"""
+        # The parent's lock may have been held by one of those threads at the fork
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        for warmup in self._warmups.values():
+            if warmup['state'] == 'warming':
+                warmup['state'] = 'pending'
+        return self.start()
+
+    def _run(self, tool_name, warmup):
+        state, error = 'ready', None
+        try:
+            warmup['func']()
+        except Exception as e:
+            state, error = 'failed', str(e)
+            print(f"Warning: warmup of tool {tool_name} failed: {e}")
+        with self._lock:
+            warmup['state'] = state
+            warmup['error'] = error
+            warmup['seconds'] = time.perf_counter() - warmup['started']
+            self._done.notify_all()
+
+    def wait(self, timeout: float):
+        """Wait until every started warmup finished or timeout seconds passed; returns whether all finished"""
+        with self._lock:
+            return self._done.wait_for(
+                lambda: all(warmup['state'] != 'warming' for warmup in self._warmups.values()), timeout)
+
+    def is_ready(self, tool_name: str):
+        """Whether a tool is ready (tools without a warmup always are)"""
+        with self._lock:
+            warmup = self._warmups.get(tool_name)
+            return warmup is None or warmup['state'] in ('ready', 'failed')
+
+    def stats(self):
+        """State, duration and error of every warmup"""
+        now = time.perf_counter()
+        with self._lock:
+            return {name: {
+                'state': warmup['state'],
+                'ms': round(((warmup['seconds'] if warmup['seconds'] is not None else now - warmup['started'])
+                             * 1000), 1) if warmup['started'] is not None else None,
+                'error': warmup['error'],
+            } for name, warmup in sorted(self._warmups.items())}
@@ -0,0 +1,22 @@
+// Batch Service
+// Sends several tool API calls to /api/batch so they share one HTTP round trip
+
+const BatchService = {
+    // Run requests ([{ method, path, body }]) on the server; resolves to their { status, duration_ms, body } in order
+    async run(requests) {
+        const resp = await fetch('/api/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ requests })
+        });
+
+        const result = await resp.json();
+        if (!result.success) {
+            throw new Error(result.error || 'Batch request failed');
+        }
+        return result.results;
+    }
+};
+
+// Make BatchService globally available
+window.BatchService = BatchService;
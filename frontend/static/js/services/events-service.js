@@ -0,0 +1,98 @@
+// Events Service
+// Receives the Server-Sent Events topics of all tools and panels over a single connection per tab
+
+const EventsService = {
+    eventSource: null,
+    subscriptions: new Map(), // topic -> Set of callbacks
+    connectedTopics: '',
+    reconnectTimer: null,
+
+    // Subscribe to a topic ('<tool>/<name>' or '<tool>/<name>:<param>'); returns the unsubscribe function
+    subscribe(topic, callback) {
+        if (!this.subscriptions.has(topic)) {
+            this.subscriptions.set(topic, new Set());
+        }
+        this.subscriptions.get(topic).add(callback);
+        this.scheduleReconnect();
+
+        return () => this.unsubscribe(topic, callback);
+    },
+
+    // Remove a callback from a topic
+    unsubscribe(topic, callback) {
+        const callbacks = this.subscriptions.get(topic);
+        if (!callbacks) {
+            return;
+        }
+        callbacks.delete(callback);
+        if (callbacks.size === 0) {
+            this.subscriptions.delete(topic);
+        }
+        this.scheduleReconnect();
+    },
+
+    // Subscriptions made in the same tick (e.g. all panels of a tool) share one reconnect
+    scheduleReconnect() {
+        clearTimeout(this.reconnectTimer);
+        this.reconnectTimer = setTimeout(() => this.connect());
+    },
+
+    // (Re)open the stream with the current topics, if they changed
+    connect() {
+        const topics = [...this.subscriptions.keys()].sort();
+        const topicsKey = topics.join('\n');
+        if (this.eventSource && topicsKey === this.connectedTopics) {
+            return;
+        }
+
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+        this.connectedTopics = topicsKey;
+        if (topics.length === 0) {
+            return;
+        }
+
+        const query = topics.map(topic => `topic=${encodeURIComponent(topic)}`).join('&');
+        console.log(`[EventsService] Connecting to ${topics.length} topic(s)`);
+        this.eventSource = new EventSource(`/api/events?${query}`);
+        this.eventSource.onmessage = (event) => this.dispatch(event);
+        this.eventSource.onerror = () => {
+            // EventSource reconnects by itself; the server resends the last event of each topic
+            console.warn('[EventsService] Connection lost, reconnecting...');
+        };
+    },
+
+    // Hand an event to the callbacks of its topic
+    dispatch(event) {
+        let message;
+        try {
+            message = JSON.parse(event.data);
+        } catch (error) {
+            console.warn('[EventsService] Invalid event data:', error);
+            return;
+        }
+
+        if (message.error) {
+            // Topic refused by the server (e.g. an invalid parameter); the other topics keep flowing
+            console.warn(`[EventsService] ${message.topic}: ${message.error}`);
+            return;
+        }
+
+        const callbacks = this.subscriptions.get(message.topic);
+        if (!callbacks) {
+            return;
+        }
+        for (const callback of [...callbacks]) {
+            try {
+                callback(message.data);
+            } catch (error) {
+                console.error(`[EventsService] Subscriber of ${message.topic} failed:`, error);
+            }
+        }
+    }
+};
+
+// Make EventsService globally available
+window.EventsService = EventsService;
@@ -233,7 +233,7 @@ const ToolsService = {
             const data = await res.json();
             if (!data.success || !data.imports || !Array.isArray(data.imports[toolName])) return;
             for (const scriptUrl of data.imports[toolName]) {
-                const file = scriptUrl.split('/').pop();
+                const file = scriptUrl.split('?')[0].split('/').pop();
                 if (!file.endsWith('.js')) continue;
                 // const globalName = file
                 //     .replace(/\.js$/, '')
@@ -0,0 +1,45 @@
+/*
+    Batched API calls for dev-tool-conversations
+*/
+window.conversations = window.conversations || {};
+window.conversations.apiBatch = window.conversations.apiBatch || {};
+
+
+// Fetch everything a group's page needs (group, instructions and conversations) in one round trip
+window.conversations.apiBatch.groupOpen = async function (spinnerContainer, groupId, memberId = null, conversationType = null, onlyLast = false) {
+    // Show loading spinner while fetching
+    const spinner = new window.SpinnerComponent(spinnerContainer, { text: `Loading group ${groupId} ...`, size: 16, textPosition: window.SpinnerComponent.TEXT_POSITION_RIGHT });
+
+    const names = ['group', 'instructions', 'conversations'];
+    try {
+        const results = await window.BatchService.run([
+            { method: 'POST', path: '/api/dev-tool-conversations/groups_get', body: { group_id: groupId } },
+            { method: 'POST', path: '/api/dev-tool-conversations/instructions_list', body: { group_id: groupId, conversation_type: conversationType } },
+            {
+                method: 'POST', path: '/api/dev-tool-conversations/conversations_list', body: {
+                    group_id: groupId,
+                    member_id: memberId,
+                    conversation_type: conversationType,
+                    conversation_id: null,
+                    only_last: onlyLast
+                }
+            }
+        ]);
+
+        spinner.remove();
+        const data = {};
+        results.forEach((item, index) => {
+            const result = item.body;
+            if (!result || !result.success) {
+                new window.conversations.AlertApiErrorComponent(result || {});
+                throw new Error((result && result.message) || `Failed to load ${names[index]} of group ${groupId}`);
+            }
+            data[names[index]] = result.data;
+        });
+        return data;
+    } catch (e) {
+        spinner.remove();
+        console.error('Error opening group ' + groupId + ':', e);
+        throw e;
+    }
+};
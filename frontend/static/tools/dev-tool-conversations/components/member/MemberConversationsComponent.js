@@ -68,13 +68,19 @@
         }
 
         async load() {
-            this.group = await window.conversations.apiGroups.groupsGet(this.container, this.groupId);
-
-            // Fetch group instructions for the specific conversation type
-            this.groupInstructions = await window.conversations.apiInstructions.instructionsList(this.container, this.groupId, this.conversation_type);
+            // Group, instructions for the specific conversation type and the conversations in one round trip
+            const data = await window.conversations.apiBatch.groupOpen(
+                this.container,
+                this.groupId,
+                this.member.member_id,
+                this.conversation_type,
+                this.showOnlyLast
+            );
+            this.group = data.group;
+            this.groupInstructions = data.instructions;
 
-            // Initial refresh to populate the list immediately
-            this.refresh();
+            // Initial refresh populates the list immediately from the conversations already loaded
+            this.refresh(data.conversations);
         }
 
         createButtonsArea() {
@@ -162,10 +168,10 @@
             );
         }
 
-        async refresh() {
+        async refresh(preloadedData = null) {
             const version = ++this._refreshVersion;
 
-            const data =
+            const data = preloadedData ||
                 await window.conversations.apiConversations.conversationsList(
                     this.nullElementForSpinner,
                     this.groupId,
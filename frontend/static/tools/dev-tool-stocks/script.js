@@ -2,11 +2,8 @@
 // Standardized object-based architecture with init method
 
 window.tool_script = {
-    // Configurable polling interval (30 seconds default)
-    pollingInterval: 30000,
-
     // State variables
-    stocksPollingId: null,
+    unsubscribeStock: null,
     isStocksInitialLoad: true,
     stocksObserver: null,
 
@@ -43,20 +40,22 @@ window.tool_script = {
         }
     },
 
-    // Start polling for stock updates
+    // Receive the quote and news of the shown symbol, pushed by the server every 30 seconds
     startStocksPolling: function() {
-        this.stopStocksPolling(); // Clear any existing polling
+        this.stopStocksPolling(); // Clear any existing subscription
 
-        this.stocksPollingId = setInterval(() => {
-            this.loadStockData();
-        }, this.pollingInterval);
+        const symbol = (document.getElementById('stockInput').value || 'AAPL').toUpperCase();
+        this.unsubscribeStock = EventsService.subscribe(`dev-tool-stocks/stock:${symbol}`, (data) => {
+            this.hideStocksError();
+            this.displayStockData(data.quote, data.news);
+        });
     },
 
-    // Stop polling for stock updates
+    // Stop receiving stock updates
     stopStocksPolling: function() {
-        if (this.stocksPollingId) {
-            clearInterval(this.stocksPollingId);
-            this.stocksPollingId = null;
+        if (this.unsubscribeStock) {
+            this.unsubscribeStock();
+            this.unsubscribeStock = null;
         }
     },
 
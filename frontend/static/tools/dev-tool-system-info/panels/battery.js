@@ -3,7 +3,7 @@ window.battery = {
     name: 'Battery',
     icon: '🔋',
     description: 'Battery status and power information',
-    intervalId: null,
+    unsubscribeBattery: null,
     container: null,
     headerStatusContainer: null,
     collapsedStatusContainer: null,
@@ -116,17 +116,17 @@ window.battery = {
         // Initial load
         await this.refreshBattery();
 
-        // Update every 30 seconds (battery status doesn't change that frequently)
-        this.intervalId = setInterval(async () => {
-            await this.refreshBattery();
-        }, 30000);
+        // The server pushes the battery status every 30 seconds (it doesn't change that frequently)
+        this.stopBatteryMonitor();
+        this.unsubscribeBattery = EventsService.subscribe('dev-tool-system-info/battery',
+            (batteryData) => this.updateDisplay(batteryData));
     },
 
     // Stop battery monitoring
     stopBatteryMonitor() {
-        if (this.intervalId) {
-            clearInterval(this.intervalId);
-            this.intervalId = null;
+        if (this.unsubscribeBattery) {
+            this.unsubscribeBattery();
+            this.unsubscribeBattery = null;
         }
     },
 
@@ -3,7 +3,7 @@ window.clock = {
     name: 'Clock',
     icon: '🕐',
     description: 'Real-time clock with current time and date',
-    intervalId: null,
+    unsubscribeTime: null,
     container: null,
 
     // Initialize the panel
@@ -102,27 +102,26 @@ window.clock = {
     async startClock() {
         console.log('[Clock Panel] Starting clock updates...');
 
-        if (this.intervalId) {
+        if (this.unsubscribeTime) {
             console.log('[Clock Panel] Clock updates already running. Aborting start.');
             return; // Already running
         }
 
-        // Initial load
-        await this.refreshTime();
+        // Subscribe first so a second start while loading is ignored
+        this.unsubscribeTime = EventsService.subscribe('dev-tool-system-info/time',
+            (timeData) => this.updateDisplay(timeData));
 
-        // Set up interval for updates every second
-        this.intervalId = setInterval(async () => {
-            await this.refreshTime();
-        }, this.showSeconds ? 1000 : 60000);
+        // Initial load (the server pushes the time every second from then on)
+        await this.refreshTime();
     },
 
     // Stop the clock updates
     stopClock() {
         console.log('[Clock Panel] Stopping clock updates...');
 
-        if (this.intervalId) {
-            clearInterval(this.intervalId);
-            this.intervalId = null;
+        if (this.unsubscribeTime) {
+            this.unsubscribeTime();
+            this.unsubscribeTime = null;
         }
     },
 
@@ -3,7 +3,7 @@ window.network = {
     name: 'Network',
     icon: '🌐',
     description: 'Network interfaces and connection information',
-    intervalId: null,
+    unsubscribeNetwork: null,
     container: null,
     headerStatusContainer: null,
     collapsedStatusContainer: null,
@@ -137,17 +137,17 @@ window.network = {
         // Initial load
         await this.refreshNetwork();
 
-        // Update every 10 seconds (network stats change more frequently)
-        this.intervalId = setInterval(async () => {
-            await this.refreshNetwork();
-        }, 10000);
+        // The server pushes network stats every 10 seconds (they change more frequently)
+        this.stopNetworkMonitor();
+        this.unsubscribeNetwork = EventsService.subscribe('dev-tool-system-info/network',
+            (networkData) => this.updateDisplay(networkData));
     },
 
     // Stop network monitoring
     stopNetworkMonitor() {
-        if (this.intervalId) {
-            clearInterval(this.intervalId);
-            this.intervalId = null;
+        if (this.unsubscribeNetwork) {
+            this.unsubscribeNetwork();
+            this.unsubscribeNetwork = null;
         }
     },
 
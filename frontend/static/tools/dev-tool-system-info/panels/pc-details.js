@@ -5,7 +5,7 @@ window.pc_details = {
     description: 'Comprehensive hardware and operating system information',
     currentTab: 'hardware',
     container: null,
-    intervalId: null,
+    unsubscribers: [],
 
     // Initialize the panel
     init(container, headerStatusContainer) {
@@ -182,18 +182,18 @@ window.pc_details = {
         // Initial load
         await this.refreshData();
 
-        // Set up interval for updates every 30 seconds
-        this.intervalId = setInterval(async () => {
-            await this.refreshData();
-        }, 30000);
+        // The server pushes new hardware samples and OS information from then on
+        this.stopIntervals();
+        this.unsubscribers = [
+            EventsService.subscribe('dev-tool-system-info/hardware', (data) => this.updateHardwareDisplay(data)),
+            EventsService.subscribe('dev-tool-system-info/os', (data) => this.updateOSDisplay(data))
+        ];
     },
 
     // Stop automatic data updates
     stopIntervals() {
-        if (this.intervalId) {
-            clearInterval(this.intervalId);
-            this.intervalId = null;
-        }
+        this.unsubscribers.forEach(unsubscribe => unsubscribe());
+        this.unsubscribers = [];
     },
 
     // Load hardware information
@@ -4,12 +4,12 @@
  */
 window.tool_script = {
     container: null,
-    pollingIntervalId: null,
+    unsubscribeUpdates: null,
     cpuHistory: [],
     cpuChart: null,
     memoryChart: null,
-    MAX_DATA_POINTS: 60, // Keep 60 data points (3 minutes at 5-second intervals)
-    POLLING_INTERVAL: 1000, // Update every 5 seconds
+    MAX_DATA_POINTS: 60, // Keep 60 data points (2 minutes at 2-second updates)
+    UPDATE_INTERVAL: 2000, // The server pushes an update every 2 seconds
     memoryChartColors: [
         'var(--color-primary-accent)',
         'var(--color-secondary-accent)',
@@ -123,28 +123,26 @@ window.tool_script = {
     },
 
     /**
-     * Start polling for updates every 5 seconds
+     * Load the data once, then receive the updates the server pushes every 2 seconds
      */
     startPolling() {
-        // Clear any existing interval first
+        // Clear any existing subscription first
         this.stopPolling();
 
-        // Poll immediately
+        // Load immediately
         this.update();
 
-        // Start new polling interval
-        this.pollingIntervalId = setInterval(() => {
-            this.update();
-        }, this.POLLING_INTERVAL);
+        this.unsubscribeUpdates = EventsService.subscribe('dev-tool-system-performance/update',
+            (data) => this.showData(data));
     },
 
     /**
-     * Stop polling
+     * Stop receiving updates
      */
     stopPolling() {
-        if (this.pollingIntervalId) {
-            clearInterval(this.pollingIntervalId);
-            this.pollingIntervalId = null;
+        if (this.unsubscribeUpdates) {
+            this.unsubscribeUpdates();
+            this.unsubscribeUpdates = null;
         }
     },
 
@@ -361,7 +359,7 @@ window.tool_script = {
 
         // Prepare data for Chart.js
         const labels = this.cpuHistory.map((_, index) => {
-            const secondsAgo = (this.cpuHistory.length - 1 - index) * (this.POLLING_INTERVAL / 1000);
+            const secondsAgo = (this.cpuHistory.length - 1 - index) * (this.UPDATE_INTERVAL / 1000);
             if (secondsAgo < 60) {
                 return `${secondsAgo}s ago`;
             } else {
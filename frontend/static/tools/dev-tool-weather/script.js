@@ -4,7 +4,7 @@
  */
 window.tool_script = {
     container: null,
-    pollingInterval: 600000, // 10 minutes for weather updates
+    unsubscribeWeather: null,
 
     // Initialize the tool
     async init(container) {
@@ -34,19 +34,23 @@ window.tool_script = {
 
     },
 
-    // Polling management
+    // Updates of the shown city, pushed by the server every 10 minutes
     startWeatherPolling() {
-        // Clear any existing interval first
+        // Clear any existing subscription first
         this.stopWeatherPolling();
 
-        // Start new polling interval (update every 10 minutes for weather)
-        this.weatherPollingIntervalId = setInterval(() => this.loadWeatherData(), this.pollingInterval);
+        const cityInput = document.getElementById('cityInput');
+        const city = (cityInput && cityInput.value) || 'New York';
+        this.unsubscribeWeather = EventsService.subscribe(`dev-tool-weather/weather:${city}`, (data) => {
+            this.hideWeatherError();
+            this.displayWeatherData(data.current, data.forecast);
+        });
     },
 
     stopWeatherPolling() {
-        if (this.weatherPollingIntervalId) {
-            clearInterval(this.weatherPollingIntervalId);
-            this.weatherPollingIntervalId = null;
+        if (this.unsubscribeWeather) {
+            this.unsubscribeWeather();
+            this.unsubscribeWeather = null;
         }
     },
 